@@ -0,0 +1,47 @@
+"""
+Measure how many game moves per second BatchEngine can simulate on one core.
+
+Every game picks a random direction on every step and games that end are reset
+automatically by the engine.
+
+Usage:
+    python -m benchmarks.batch_throughput [games] [steps]
+"""
+
+import sys
+import time
+
+from src.core.batch_engine import BatchEngine
+
+import numpy as np
+
+
+def run(num_games: int, steps: int) -> float:
+    """
+    Step a batch of games.
+
+    Args:
+        num_games (int): The number of games to run in lockstep
+        steps (int): The number of steps to run
+
+    Returns:
+        float: The game moves simulated per second
+    """
+    engine = BatchEngine(num_games, seed=0)
+    rng = np.random.default_rng(0)
+    actions = rng.integers(0, 4, size=(steps, num_games))
+
+    start = time.perf_counter()
+    for step_actions in actions:
+        engine.step(step_actions)
+    return num_games * steps / (time.perf_counter() - start)
+
+
+def main() -> None:
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    print(f"{num_games:,} games: {run(num_games, steps):,.0f} moves/s")
+
+
+if __name__ == "__main__":
+    main()
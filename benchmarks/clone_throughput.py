@@ -0,0 +1,61 @@
+"""
+Measure how many times per second a game with a 200-cell snake can be cloned,
+snapshotted and restored, as a lookahead search would.
+Restoring is also measured for a short snake: it should not depend on the length.
+
+Usage:
+    python -m benchmarks.clone_throughput [repeats]
+"""
+
+import sys
+import timeit
+
+from src.core.game_state import GameState
+from src.utils import constants as c
+
+
+def make_game(length: int = 200) -> GameState:
+    """
+    Build a game with a long snake winding over the top rows of the board.
+
+    Args:
+        length (int): The number of cells of the snake
+
+    Returns:
+        GameState: The game
+    """
+    positions = []
+    for y in range(c.GRID_SIZE):
+        row = [(x, y) for x in range(c.GRID_SIZE)]
+        positions += row if y % 2 == 0 else row[::-1]
+    keyframe = GameState(seed=0).keyframe()
+    return GameState.from_keyframe(
+        keyframe._replace(
+            positions=tuple(reversed(positions[:length])),
+            direction=c.DOWN,
+            food_pos=(c.GRID_SIZE // 2, c.GRID_SIZE - 3),
+            new_food=False,
+        )
+    )
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    game_state = make_game()
+    snapshot = game_state.snapshot()
+    for name, operation in [
+        ("clone", game_state.clone),
+        ("snapshot", game_state.snapshot),
+        ("restore", lambda: game_state.restore(snapshot)),
+    ]:
+        elapsed = timeit.timeit(operation, number=repeats)
+        print(f"{name}: {repeats / elapsed:,.0f} per second")
+
+    short_game = make_game(length=20)
+    short_snapshot = short_game.snapshot()
+    elapsed = timeit.timeit(lambda: short_game.restore(short_snapshot), number=repeats)
+    print(f"restore (20 cells): {repeats / elapsed:,.0f} per second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Measure the cold import cost of the simulation core.
+
+Each module is imported in a fresh interpreter, which reports the import time and
+the peak resident set size of the process.
+
+Usage:
+    python -m benchmarks.core_import
+"""
+
+import os
+import subprocess
+import sys
+
+MODULES = [
+    "src.core.game_state",
+    "pygame",
+    "src.ui.renderer",
+]
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss_kb //= 1024
+print(elapsed, rss_kb, "pygame" in sys.modules)
+"""
+
+
+def measure(module: str) -> tuple[float, int, bool]:
+    """
+    Import a module in a fresh interpreter.
+
+    Args:
+        module (str): The dotted name of the module to import
+
+    Returns:
+        tuple[float, int, bool]: The import time in seconds, the peak RSS in KB and
+            whether pygame was loaded
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"},
+    ).stdout.split()
+    return float(output[0]), int(output[1]), output[2] == "True"
+
+
+def main() -> None:
+    print(f"{'module':<24}{'import ms':>12}{'peak RSS MB':>14}{'pygame':>9}")
+    for module in MODULES:
+        elapsed, rss_kb, pygame_loaded = measure(module)
+        print(
+            f"{module:<24}{elapsed * 1000:>12.1f}{rss_kb / 1024:>14.1f}"
+            f"{'yes' if pygame_loaded else 'no':>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
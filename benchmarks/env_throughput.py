@@ -0,0 +1,50 @@
+"""
+Measure how many steps per second SnakeEnv runs with and without observations.
+
+Actions are drawn at random, so most episodes are short and every reset is
+included in the timing.
+
+Usage:
+    python -m benchmarks.env_throughput [steps]
+"""
+
+import random
+import sys
+import time
+
+from src.simulation.env import SnakeEnv
+
+
+def run(steps: int, observe: bool) -> float:
+    """
+    Run a number of environment steps.
+
+    Args:
+        steps (int): The number of steps to run
+        observe (bool): Whether the environment maintains observations
+
+    Returns:
+        float: The steps run per second
+    """
+    env = SnakeEnv(seed=0, observe=observe)
+    env.reset()
+    rng = random.Random(0)
+    actions = [rng.randrange(4) for _ in range(steps)]
+    start = time.perf_counter()
+    for action in actions:
+        _, _, terminated, truncated, _ = env.step(action)
+        if terminated or truncated:
+            env.reset()
+    return steps / (time.perf_counter() - start)
+
+
+def main() -> None:
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    without = run(steps, observe=False)
+    with_observations = run(steps, observe=True)
+    print(f"without observations: {without:,.0f} steps/s")
+    print(f"with observations:    {with_observations:,.0f} steps/s")
+
+
+if __name__ == "__main__":
+    main()
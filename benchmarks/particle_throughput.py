@@ -0,0 +1,56 @@
+"""
+Measure how many frames per second ParticleSystem.update sustains with a number of
+live particles.
+
+Particles are topped up by spawning bursts before every frame, so the count stays
+at the target as old particles die.
+
+Usage:
+    python -m benchmarks.particle_throughput [particles] [frames]
+"""
+
+import sys
+import time
+
+from src.effects.particle_system import ParticleSystem
+from src.utils import constants as c
+
+import pygame
+
+
+def run(particles: int, frames: int) -> float:
+    """
+    Update a particle system kept at a number of live particles.
+
+    Args:
+        particles (int): The number of live particles to keep
+        frames (int): The number of frames to update
+
+    Returns:
+        float: The frames updated per second
+    """
+    particle_system = ParticleSystem(pygame.Surface((c.WINDOW_SIZE, c.WINDOW_SIZE)))
+    spawn_count = 0
+    elapsed = 0.0
+    for _ in range(frames):
+        while particle_system.count < particles:
+            spawn_count += 1
+            particle_system.spawn_particles(
+                spawn_count * 7 % c.WINDOW_SIZE,
+                spawn_count * 13 % c.WINDOW_SIZE,
+                c.PASTEL_PINK if spawn_count % 2 else c.MINT_GREEN,
+            )
+        start = time.perf_counter()
+        particle_system.update()
+        elapsed += time.perf_counter() - start
+    return frames / elapsed
+
+
+def main() -> None:
+    particles = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+    print(f"{run(particles, frames):,.0f} frames/s with {particles:,} particles")
+
+
+if __name__ == "__main__":
+    main()
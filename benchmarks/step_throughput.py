@@ -0,0 +1,54 @@
+"""
+Measure how many snake moves per second GameState.step can simulate.
+
+A cheap policy keeps the current direction and only turns to avoid a lethal cell,
+and a new game is started whenever one ends.
+
+Usage:
+    python -m benchmarks.step_throughput [moves]
+"""
+
+import sys
+import time
+
+from src.core.game_state import GameState
+from src.utils import constants as c
+
+DIRECTIONS = (c.UP, c.RIGHT, c.DOWN, c.LEFT)
+
+
+def run(moves: int) -> float:
+    """
+    Simulate a number of moves.
+
+    Args:
+        moves (int): The number of moves to simulate
+
+    Returns:
+        float: The moves simulated per second
+    """
+    game_state = GameState()
+    board = game_state.board
+    start = time.perf_counter()
+    for _ in range(moves):
+        snake = game_state.snake
+        head_x, head_y = snake.get_head_position()
+        direction = snake.direction
+        if board.is_lethal((head_x + direction[0], head_y + direction[1])):
+            for direction in DIRECTIONS:
+                if not board.is_lethal((head_x + direction[0], head_y + direction[1])):
+                    break
+
+        if game_state.step(direction).game_over:
+            game_state.reset()
+            board = game_state.board
+    return moves / (time.perf_counter() - start)
+
+
+def main() -> None:
+    moves = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{run(moves):,.0f} moves/s")
+
+
+if __name__ == "__main__":
+    main()
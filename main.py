@@ -3,6 +3,7 @@ import sys
 
 from src.core.game_loop import game_loop
 from src.core.game_state import GameState
+from src.effects.particle_system import ParticleSystem
 from src.utils import constants as c
 
 import pygame
@@ -38,8 +39,9 @@ def main() -> None:
     clock = pygame.time.Clock()
 
     try:
-        game_state = GameState()
-        game_state.particle_system.screen = screen
+        game_state = GameState(
+            particle_system=ParticleSystem(screen), board_size=c.BOARD_SIZE
+        )
         game_loop(screen, game_state, clock)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
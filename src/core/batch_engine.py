@@ -0,0 +1,412 @@
+from typing import NamedTuple
+
+from src.utils import constants as c
+
+import numpy as np
+
+# Direction codes used by the batch engine, ordered clockwise so that the opposite
+# of direction d is (d + 2) % 4
+DIRECTIONS = (c.UP, c.RIGHT, c.DOWN, c.LEFT)
+KEEP_DIRECTION = -1
+
+
+class BatchStepResult(NamedTuple):
+    """
+    Outcome of a single BatchEngine.step call, one entry per game
+
+    Attributes:
+        reward (np.ndarray): The points scored during the step
+        game_over (np.ndarray): Whether the game ended; it has been reset since
+        score (np.ndarray): The score at the end of the step, before any reset
+        length (np.ndarray): The snake length at the end of the step, before any reset
+    """
+
+    reward: np.ndarray
+    game_over: np.ndarray
+    score: np.ndarray
+    length: np.ndarray
+
+
+class BatchEngine:
+    """
+    Runs many independent games in lockstep with NumPy array operations.
+
+    The rules are the same as GameState.step: every step advances each game by one
+    snake move, with the bonus food timers counting the frames the move takes at
+    the current speed. Games that end are reset automatically.
+
+    Each board is a flat row of (size + 2)² cells with a ring of wall sentinels, like
+    Board. The bodies are ring buffers of cell indices with the head at head_ptr,
+    and the occupancy tensor counts the snake segments on every cell, so a step
+    runs without any per-game Python loop.
+
+    Args:
+        num_games (int): The number of games to run
+        size (int): The width and height of each board in cells
+        seed (int | None): The seed for the food spawning random generator
+    """
+
+    def __init__(self, num_games: int, size: int = c.GRID_SIZE, seed=None):
+        self._num_games: int = num_games
+        self._size: int = size
+        self._stride: int = size + 2
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+
+        cells = self._stride * self._stride
+        grid = np.zeros((self._stride, self._stride), dtype=bool)
+        grid[0, :] = grid[-1, :] = grid[:, 0] = grid[:, -1] = True
+        self._walls: np.ndarray = grid.ravel()
+
+        # food never spawns on the outermost ring of the grid
+        spawnable = np.zeros((self._stride, self._stride), dtype=bool)
+        spawnable[2:-2, 2:-2] = True
+        self._spawnable: np.ndarray = spawnable.ravel()
+
+        self._offsets: np.ndarray = np.array(
+            [dx + dy * self._stride for dx, dy in DIRECTIONS], dtype=np.int32
+        )
+        middle = size // 2
+        self._start_cells: tuple[int, int] = (
+            (middle + 1) * self._stride + middle + 1,  # head in the middle
+            (middle + 1) * self._stride + middle + 2,  # one cell to the right
+        )
+
+        self._capacity: int = size * size + 1
+        self._occupancy: np.ndarray = np.zeros((num_games, cells), dtype=np.int8)
+        self._bodies: np.ndarray = np.zeros((num_games, self._capacity), dtype=np.int32)
+        self._head_ptr: np.ndarray = np.zeros(num_games, dtype=np.int64)
+        self._length: np.ndarray = np.zeros(num_games, dtype=np.int64)
+        self._direction: np.ndarray = np.zeros(num_games, dtype=np.int64)
+
+        self._food: np.ndarray = np.full(num_games, -1, dtype=np.int64)
+        self._new_food: np.ndarray = np.ones(num_games, dtype=bool)
+        self._bonus_food: np.ndarray = np.full(num_games, -1, dtype=np.int64)
+        self._bonus_food_spawn_timer: np.ndarray = np.zeros(num_games, dtype=np.int64)
+        self._bonus_food_duration_timer: np.ndarray = np.zeros(
+            num_games, dtype=np.int64
+        )
+
+        self._score: np.ndarray = np.zeros(num_games, dtype=np.int64)
+        self._frame_count: np.ndarray = np.zeros(num_games, dtype=np.int64)
+        self._move_delay: np.ndarray = np.full(num_games, 20, dtype=np.int64)
+
+        self._games: np.ndarray = np.arange(num_games)
+        self.reset()
+
+    @property
+    def num_games(self) -> int:
+        return self._num_games
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def occupancy(self) -> np.ndarray:
+        """
+        Read-only view of the snake segment counts on the playable cells,
+        shaped (num_games, size, size) and indexed [game, y, x]
+        """
+        view = self._occupancy.reshape(-1, self._stride, self._stride)[:, 1:-1, 1:-1]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def scores(self) -> np.ndarray:
+        return self._score
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return self._length
+
+    @property
+    def directions(self) -> np.ndarray:
+        return self._direction
+
+    def head_positions(self) -> np.ndarray:
+        """
+        Get the grid position of every head.
+
+        Returns:
+            np.ndarray: The (x, y) positions, shaped (num_games, 2)
+        """
+        return self._to_positions(self._bodies[self._games, self._head_ptr])
+
+    def food_positions(self) -> np.ndarray:
+        """
+        Get the grid position of every regular food, (-1, -1) if there is none.
+
+        Returns:
+            np.ndarray: The (x, y) positions, shaped (num_games, 2)
+        """
+        return self._to_positions(self._food)
+
+    def bonus_food_positions(self) -> np.ndarray:
+        """
+        Get the grid position of every bonus food, (-1, -1) if it is not active.
+
+        Returns:
+            np.ndarray: The (x, y) positions, shaped (num_games, 2)
+        """
+        return self._to_positions(self._bonus_food)
+
+    def reset(self, games: np.ndarray | None = None) -> None:
+        """
+        Start new games.
+
+        Args:
+            games (np.ndarray | None): A boolean mask or the indices of the games to
+                reset; all games are reset if not given
+        """
+        games = self._games if games is None else self._games[games]
+        if games.size == 0:
+            return
+
+        head, tail = self._start_cells
+        self._occupancy[games] = 0
+        self._occupancy[games, head] = 1
+        self._occupancy[games, tail] = 1
+        self._bodies[games, 0] = tail
+        self._bodies[games, 1] = head
+        self._head_ptr[games] = 1
+        self._length[games] = 2
+        self._direction[games] = DIRECTIONS.index(c.LEFT)
+
+        self._food[games] = -1
+        self._new_food[games] = True
+        self._bonus_food[games] = -1
+        self._bonus_food_spawn_timer[games] = 0
+        self._bonus_food_duration_timer[games] = 0
+
+        self._score[games] = 0
+        self._frame_count[games] = 0
+        self._move_delay[games] = 20
+
+    def step(self, actions: np.ndarray | None = None) -> BatchStepResult:
+        """
+        Advance every game by exactly one snake move.
+
+        Args:
+            actions (np.ndarray | None): One direction code per game, an index into
+                DIRECTIONS or KEEP_DIRECTION; all games keep their direction if
+                not given
+
+        Returns:
+            BatchStepResult: The reward and game over flag of every game
+        """
+        if actions is not None:
+            actions = np.asarray(actions)
+            turning = (actions >= 0) & (actions != (self._direction + 2) % 4)
+            self._direction[turning] = actions[turning]
+
+        self._spawn_food()
+        self._update_speed()
+        idle_frames = np.maximum(self._move_delay - self._frame_count - 1, 0)
+        self._skip_frames(idle_frames)
+        score = self._score.copy()
+
+        tail, head = self._move()
+        game_over = (self._walls[head] | (self._occupancy[self._games, head] > 1)) | (
+            self._food < 0
+        )
+
+        ate_food = head == self._food
+        self._grow(ate_food, tail)
+        self._score[ate_food] += 1
+        self._new_food |= ate_food
+
+        ate_bonus_food = self._update_bonus_food(head)
+        self._grow(ate_bonus_food, tail)
+        self._score[ate_bonus_food] += 3
+        self._spawn_food()
+
+        result = BatchStepResult(
+            self._score - score, game_over, self._score.copy(), self._length.copy()
+        )
+        self.reset(game_over)
+        return result
+
+    def _move(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Move every snake by one cell, releasing the tail before placing the head.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The vacated tail and the new head cells
+        """
+        games = self._games
+        tail_ptr = (self._head_ptr - self._length + 1) % self._capacity
+        tail = self._bodies[games, tail_ptr]
+        self._occupancy[games, tail] -= 1
+
+        head = self._bodies[games, self._head_ptr] + self._offsets[self._direction]
+        self._head_ptr = (self._head_ptr + 1) % self._capacity
+        self._bodies[games, self._head_ptr] = head
+        self._occupancy[games, head] += 1
+        self._frame_count[:] = 0
+        return tail, head
+
+    def _grow(self, games: np.ndarray, tail: np.ndarray) -> None:
+        """
+        Grow the masked snakes by adding the vacated tail back to the end.
+        The tail is still stored in the ring buffer just behind the body.
+
+        Args:
+            games (np.ndarray): A boolean mask of the games to grow
+            tail (np.ndarray): The vacated tail cell of every game
+        """
+        self._length[games] += 1
+        self._occupancy[games, tail[games]] += 1
+
+    def _update_speed(self) -> None:
+        """
+        Adjust every snake's speed based on its score, like GameState._update_speed
+        """
+        base_delay = 20
+        min_delay = 5
+
+        first_phase = base_delay - (25 // 5) * 2
+        new_delay = np.where(
+            self._score < 25,
+            base_delay - (self._score // 5) * 2,
+            first_phase - (self._score - 25) // 5,
+        )
+        np.maximum(new_delay, min_delay, out=self._move_delay)
+
+    def _skip_frames(self, frames: np.ndarray) -> None:
+        """
+        Advance the bonus food timers over the frames before the move,
+        like FoodSystem.skip_frames
+
+        Args:
+            frames (np.ndarray): The number of frames to skip in every game
+        """
+        frames = frames.copy()
+        spawn_timer = self._bonus_food_spawn_timer
+        duration_timer = self._bonus_food_duration_timer
+        self._frame_count += frames + 1
+
+        pending = frames > 0
+        while pending.any():
+            waiting = pending & (self._bonus_food < 0)
+            active = pending & (self._bonus_food >= 0)
+
+            skipped = np.minimum(frames, c.BONUS_FOOD_SPAWN_INTERVAL - spawn_timer)
+            spawn_timer[waiting] += skipped[waiting]
+            frames[waiting] -= skipped[waiting]
+
+            skipped = np.minimum(frames, c.BONUS_FOOD_DURATION - duration_timer)
+            duration_timer[active] += skipped[active]
+            frames[active] -= skipped[active]
+
+            spawning = waiting & (spawn_timer == c.BONUS_FOOD_SPAWN_INTERVAL)
+            if spawning.any():
+                self._spawn_bonus_food(spawning)
+                duration_timer[spawning & (self._bonus_food >= 0)] += 1
+
+            self._expire_bonus_food()
+            pending = frames > 0
+
+    def _update_bonus_food(self, head: np.ndarray) -> np.ndarray:
+        """
+        Run the bonus food rules for the frame in which the snakes move,
+        like FoodSystem.update_bonus_food
+
+        Args:
+            head (np.ndarray): The new head cell of every game
+
+        Returns:
+            np.ndarray: A boolean mask of the games that collected the bonus food
+        """
+        self._bonus_food_spawn_timer[self._bonus_food < 0] += 1
+        spawning = self._bonus_food_spawn_timer == c.BONUS_FOOD_SPAWN_INTERVAL
+        if spawning.any():
+            self._spawn_bonus_food(spawning)
+
+        active = self._bonus_food >= 0
+        collected = active & (head == self._bonus_food)
+        self._bonus_food_duration_timer[active & ~collected] += 1
+        self._bonus_food[collected] = -1
+        self._bonus_food_duration_timer[collected] = 0
+        self._expire_bonus_food()
+        return collected
+
+    def _expire_bonus_food(self) -> None:
+        """
+        Remove the bonus food from the games where its duration has run out
+        """
+        expired = self._bonus_food_duration_timer >= c.BONUS_FOOD_DURATION
+        self._bonus_food[expired] = -1
+        self._bonus_food_duration_timer[expired] = 0
+
+    def _spawn_food(self) -> None:
+        """
+        Spawn the regular food in the games that need new food,
+        leaving -1 where the board is full
+        """
+        games = np.flatnonzero(self._new_food)
+        if games.size:
+            self._food[games] = self._sample_free_cells(games)
+            self._new_food[games] = False
+
+    def _spawn_bonus_food(self, games: np.ndarray) -> None:
+        """
+        Spawn the bonus food in the masked games and restart their timers,
+        leaving it inactive where the board is full
+
+        Args:
+            games (np.ndarray): A boolean mask of the games to spawn in
+        """
+        games = np.flatnonzero(games)
+        self._bonus_food_spawn_timer[games] = 0
+        self._bonus_food_duration_timer[games] = 0
+        self._bonus_food[games] = self._sample_free_cells(games)
+
+    def _sample_free_cells(self, games: np.ndarray) -> np.ndarray:
+        """
+        Draw a uniformly random free cell in each of the given games.
+
+        Args:
+            games (np.ndarray): The indices of the games to draw in
+
+        Returns:
+            np.ndarray: The drawn cells, -1 where the board is full
+        """
+        free = self._free_cells(games)
+        keys = self._rng.random(free.shape)
+        keys[~free] = -1.0
+        cells = keys.argmax(axis=1)
+        cells[~free.any(axis=1)] = -1
+        return cells
+
+    def _free_cells(self, games: np.ndarray) -> np.ndarray:
+        """
+        Get the cells where food may spawn in each of the given games.
+
+        Args:
+            games (np.ndarray): The indices of the games
+
+        Returns:
+            np.ndarray: A boolean mask shaped (len(games), cells)
+        """
+        free = (self._occupancy[games] == 0) & self._spawnable
+        rows = np.arange(games.size)
+        for items in (self._food[games], self._bonus_food[games]):
+            placed = items >= 0
+            free[rows[placed], items[placed]] = False
+        return free
+
+    def _to_positions(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Convert flat cell indices to (x, y) grid positions, keeping -1 as (-1, -1).
+
+        Args:
+            cells (np.ndarray): The cell indices
+
+        Returns:
+            np.ndarray: The positions, shaped (len(cells), 2)
+        """
+        positions = np.stack(
+            [cells % self._stride - 1, cells // self._stride - 1], axis=-1
+        )
+        positions[cells < 0] = -1
+        return positions
@@ -0,0 +1,278 @@
+from src.utils import constants as c
+from src.utils.rng import Rng
+
+
+class Board:
+    """
+    Occupancy grid shared by the snake and the food system.
+
+    The playable area is surrounded by a ring of wall sentinel cells and stored
+    row by row in a single bytearray of (size + 2)² cells, so asking whether a cell
+    is lethal, free or holds food is one indexed read.
+    Each cell keeps the WALL, FOOD and BONUS_FOOD flags in its low bits and the
+    number of snake segments on it in the remaining bits.
+
+    The free cells where food may spawn (every cell except the outermost ring of the
+    grid) are also counted in a Fenwick tree over the spawn cells in row-major
+    order, updated in O(log N) whenever a cell is occupied or freed. A random free
+    cell is drawn by picking k uniformly and descending the tree to the k-th free
+    cell in O(log N) at any fill ratio, so the draw depends only on which cells are
+    free, never on the order in which they were taken and freed.
+
+    Args:
+        size (int): The width and height of the playable area in cells
+        rng (Rng | None): The random generator for drawing free cells
+    """
+
+    WALL = 1
+    FOOD = 2
+    BONUS_FOOD = 4
+    SNAKE = 8  # one snake segment, counted in the bits above the flags
+
+    def __init__(self, size: int = c.GRID_SIZE, rng: Rng | None = None):
+        self._size: int = size
+        self._rng: Rng = rng if rng is not None else Rng()
+        self._stride: int = size + 2
+        self._cells: bytearray = bytearray(self._stride * self._stride)
+
+        last = self._stride - 1
+        for i in range(self._stride):
+            self._cells[i] = Board.WALL  # top row
+            self._cells[last * self._stride + i] = Board.WALL  # bottom row
+            self._cells[i * self._stride] = Board.WALL  # left column
+            self._cells[i * self._stride + last] = Board.WALL  # right column
+
+        # Fenwick positions start at 1; position 0 marks cells where food never spawns
+        self._spawn_slots: list[int] = [0] * len(self._cells)
+        self._spawn_cells: list[int] = [0]
+        for y in range(1, size - 1):
+            for x in range(1, size - 1):
+                index = self.index((x, y))
+                self._spawn_slots[index] = len(self._spawn_cells)
+                self._spawn_cells.append(index)
+
+        count = len(self._spawn_cells) - 1
+        self._free_count: int = count
+        self._free_tree: list[int] = [0] + [1] * count
+        for position in range(1, count + 1):
+            parent = position + (position & -position)
+            if parent <= count:
+                self._free_tree[parent] += self._free_tree[position]
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def cells(self) -> memoryview:
+        """
+        Read-only view of the flat cell array, row by row including the wall ring
+        """
+        return memoryview(self._cells).toreadonly()
+
+    @property
+    def free_cell_count(self) -> int:
+        return self._free_count
+
+    def index(self, position: tuple[int, ...]) -> int:
+        """
+        Get the index of a cell in the flat cell array.
+        Positions one cell outside the grid map onto the wall sentinels.
+
+        Args:
+            position (tuple[int, int]): the grid position
+
+        Returns:
+            int: the index of the cell
+        """
+        return (position[1] + 1) * self._stride + position[0] + 1
+
+    def is_wall(self, position: tuple[int, ...]) -> bool:
+        """
+        Check if the cell is a wall sentinel outside the playable area.
+        """
+        return bool(self._cells[self.index(position)] & Board.WALL)
+
+    def is_lethal(self, position: tuple[int, ...]) -> bool:
+        """
+        Check if moving the head onto the cell would end the game.
+        """
+        cell = self._cells[self.index(position)]
+        return bool(cell & Board.WALL) or cell >= Board.SNAKE
+
+    def is_free(self, position: tuple[int, ...]) -> bool:
+        """
+        Check if the cell holds neither a wall, the snake nor any food.
+        """
+        return self._cells[self.index(position)] == 0
+
+    def has_food(self, position: tuple[int, ...]) -> bool:
+        """
+        Check if the cell holds the regular food.
+        """
+        return bool(self._cells[self.index(position)] & Board.FOOD)
+
+    def has_bonus_food(self, position: tuple[int, ...]) -> bool:
+        """
+        Check if the cell holds the bonus food.
+        """
+        return bool(self._cells[self.index(position)] & Board.BONUS_FOOD)
+
+    def snake_count(self, position: tuple[int, ...]) -> int:
+        """
+        Get the number of snake segments on the cell.
+        """
+        return self._cells[self.index(position)] // Board.SNAKE
+
+    def add_snake(self, position: tuple[int, ...]) -> None:
+        """
+        Record a snake segment entering the cell.
+        """
+        index = self.index(position)
+        if self._cells[index] == 0:
+            self._take_free_cell(index)
+        self._cells[index] += Board.SNAKE
+
+    def remove_snake(self, position: tuple[int, ...]) -> None:
+        """
+        Record a snake segment leaving the cell.
+        """
+        index = self.index(position)
+        self._cells[index] -= Board.SNAKE
+        if self._cells[index] == 0:
+            self._give_free_cell(index)
+
+    def set_flag(self, position: tuple[int, ...], flag: int) -> None:
+        """
+        Mark the cell with a FOOD or BONUS_FOOD flag.
+        """
+        index = self.index(position)
+        if self._cells[index] == 0:
+            self._take_free_cell(index)
+        self._cells[index] |= flag
+
+    def clear_flag(self, position: tuple[int, ...], flag: int) -> None:
+        """
+        Remove a FOOD or BONUS_FOOD flag from the cell.
+        """
+        index = self.index(position)
+        if self._cells[index] & flag:
+            self._cells[index] &= ~flag
+            if self._cells[index] == 0:
+                self._give_free_cell(index)
+
+    def snake_cells_in(
+        self, left: int, top: int, width: int, height: int
+    ) -> list[tuple[int, int]]:
+        """
+        Get the cells holding the snake within a rectangle of the board.
+        Only the rows and columns the rectangle covers are read, so the cost
+        depends on its area rather than on the size of the board or the snake.
+
+        Args:
+            left (int): the first column of the rectangle
+            top (int): the first row of the rectangle
+            width (int): the number of columns
+            height (int): the number of rows
+
+        Returns:
+            list[tuple[int, int]]: the cells, row by row
+        """
+        first_x, last_x = max(left, 0), min(left + width, self._size)
+        cells = []
+        for y in range(max(top, 0), min(top + height, self._size)):
+            start = self.index((first_x, y))
+            row = self._cells[start : start + last_x - first_x]
+            cells.extend(
+                (first_x + x, y) for x, cell in enumerate(row) if cell >= Board.SNAKE
+            )
+        return cells
+
+    def random_free_cell(self) -> tuple[int, int] | None:
+        """
+        Draw a uniformly random free cell where food may spawn.
+
+        Returns:
+            tuple[int, int] | None: the free cell, or None if the board is full
+        """
+        if not self._free_count:
+            return None
+        tree = self._free_tree
+        count = len(tree) - 1
+        rank = self._rng.randrange(self._free_count)
+        position = 0
+        step = 1 << (count.bit_length() - 1)
+        while step:
+            child = position + step
+            if child <= count and tree[child] <= rank:
+                position = child
+                rank -= tree[child]
+            step >>= 1
+        index = self._spawn_cells[position + 1]
+        return index % self._stride - 1, index // self._stride - 1
+
+    def snapshot(self) -> tuple[bytes, tuple[int, ...], int]:
+        """
+        Capture the cells and the free cell counts, to be restored with restore.
+
+        Returns:
+            tuple[bytes, tuple[int, ...], int]: the captured state
+        """
+        return bytes(self._cells), tuple(self._free_tree), self._free_count
+
+    def restore(self, snapshot: tuple[bytes, tuple[int, ...], int]) -> None:
+        """
+        Restore a state captured with snapshot on a board of the same size.
+        """
+        cells, free_tree, self._free_count = snapshot
+        self._cells[:] = cells
+        self._free_tree = list(free_tree)
+
+    def copy(self, rng: Rng | None = None) -> "Board":
+        """
+        Copy the board without rebuilding its wall ring and free cell index.
+
+        Args:
+            rng (Rng | None): the random generator of the copy; shared with this
+                board if not given
+
+        Returns:
+            Board: the copy
+        """
+        board = Board.__new__(Board)
+        board._size = self._size
+        board._rng = rng if rng is not None else self._rng
+        board._stride = self._stride
+        board._cells = self._cells[:]
+        board._spawn_slots = self._spawn_slots  # never changes after __init__
+        board._spawn_cells = self._spawn_cells  # never changes after __init__
+        board._free_count = self._free_count
+        board._free_tree = self._free_tree[:]
+        return board
+
+    def _take_free_cell(self, index: int) -> None:
+        """
+        Count a cell that is about to be occupied out of the free cells.
+        """
+        position = self._spawn_slots[index]
+        if position:
+            self._update_free_tree(position, -1)
+
+    def _give_free_cell(self, index: int) -> None:
+        """
+        Count a cell that has just been vacated back into the free cells.
+        """
+        position = self._spawn_slots[index]
+        if position:
+            self._update_free_tree(position, 1)
+
+    def _update_free_tree(self, position: int, change: int) -> None:
+        """
+        Add to the free count of a spawn cell and of the tree nodes covering it.
+        """
+        self._free_count += change
+        tree = self._free_tree
+        count = len(tree) - 1
+        while position <= count:
+            tree[position] += change
+            position += position & -position
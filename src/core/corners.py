@@ -0,0 +1,60 @@
+from collections import deque
+
+
+def step_towards(start: tuple[int, ...], end: tuple[int, ...]) -> tuple[int, int]:
+    """
+    Get the unit step that leads from one cell to another on the same row or column.
+
+    Args:
+        start (tuple[int, int]): the cell to step from
+        end (tuple[int, int]): the cell to step towards
+
+    Returns:
+        tuple[int, int]: the unit step
+    """
+    return (
+        (end[0] > start[0]) - (end[0] < start[0]),
+        (end[1] > start[1]) - (end[1] < start[1]),
+    )
+
+
+def retract_tail(corners: deque[tuple[int, ...]]) -> tuple[int, ...]:
+    """
+    Remove the last cell of a body kept as its corners from the head to the tail,
+    dropping the tail corner once its run has been used up.
+
+    Args:
+        corners (deque[tuple[int, int]]): the corners, changed in place
+
+    Returns:
+        tuple[int, int]: the removed cell
+    """
+    tail = corners[-1]
+    if len(corners) == 1:
+        corners.pop()
+        return tail
+
+    step_x, step_y = step_towards(tail, corners[-2])
+    new_tail = (tail[0] + step_x, tail[1] + step_y)
+    if new_tail == corners[-2]:
+        corners.pop()
+    else:
+        corners[-1] = new_tail
+    return tail
+
+
+def advance_head(corners: deque[tuple[int, ...]], new_head: tuple[int, ...]) -> None:
+    """
+    Add a new head cell to a body kept as its corners from the head to the tail,
+    extending the head run or starting a new run on a turn.
+
+    Args:
+        corners (deque[tuple[int, int]]): the corners, changed in place
+        new_head (tuple[int, int]): the new position of the head
+    """
+    if len(corners) > 1 and step_towards(corners[1], corners[0]) == (
+        step_towards(corners[0], new_head)
+    ):
+        corners[0] = new_head
+    else:
+        corners.appendleft(new_head)
@@ -1,29 +1,36 @@
+from src.core.board import Board
+from src.core.hooks import EffectsHook
 from src.core.snake import Snake
-from src.effects.particle_system import ParticleSystem
+from src.core.zobrist import zobrist_keys
 from src.utils import constants as c
-from src.utils.helpers import get_random_position
 
 
 class FoodSystem:
     """
     The FoodSystem class is responsible for managing the food items in the game
+    Food positions are mirrored on the snake's board, which also keeps the index of
+    free cells that new food is drawn from
+    Positions are stored as immutable tuples and returned as they are, so reading
+    them never allocates
     """
 
-    def __init__(self, snake: Snake, particle_system: ParticleSystem):
+    def __init__(self, snake: Snake, particle_system: EffectsHook):
         self._snake = snake
+        self._board: Board = snake.board
         self._particle_system = particle_system
 
-        self._food_pos: list[int] = [0, 0]
+        self._food_pos: tuple[int, ...] | None = (0, 0)
         self._new_food: bool = True
 
-        self._bonus_food_pos: list[int] | None = None
+        self._bonus_food_pos: tuple[int, ...] | None = None
         self._bonus_food_spawn_timer: int = 0
         self._bonus_food_duration_timer: int = 0
         self._bonus_food_active: bool = False
+        self._keys = zobrist_keys(self._board.size)
 
     @property
-    def food_pos(self) -> tuple[int, ...]:
-        return tuple(self._food_pos)
+    def food_pos(self) -> tuple[int, ...] | None:
+        return self._food_pos
 
     @property
     def new_food(self) -> bool:
@@ -31,7 +38,11 @@ class FoodSystem:
 
     @property
     def bonus_food_pos(self) -> tuple[int, ...] | None:
-        return tuple(self._bonus_food_pos) if self._bonus_food_pos else None
+        return self._bonus_food_pos
+
+    @property
+    def board_full(self) -> bool:
+        return self._food_pos is None
 
     @property
     def bonus_food_active(self) -> bool:
@@ -45,6 +56,19 @@ class FoodSystem:
     def bonus_food_spawn_timer(self) -> int:
         return self._bonus_food_spawn_timer
 
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        The Zobrist keys of the food and bonus food cells, looked up in O(1) from
+        the current positions so it follows every spawn and removal
+        """
+        value = 0
+        if self._food_pos is not None:
+            value ^= self._keys.food[self._food_pos]
+        if self._bonus_food_pos is not None:
+            value ^= self._keys.bonus_food[self._bonus_food_pos]
+        return value
+
     def update_bonus_food(self, tail: list[int]) -> bool:
         """
         Update the bonus food state
@@ -69,6 +93,37 @@ class FoodSystem:
             return bonus_food_collected
         return False
 
+    def skip_frames(self, frames: int) -> None:
+        """
+        Advance the bonus food timers by a number of frames in which the snake
+        does not move, in O(1) instead of one update_bonus_food call per frame
+        The result is the same as calling update_bonus_food that many times,
+        since the bonus food is never collected while the head stands still
+
+        Args:
+            frames: int - The number of frames to skip
+        """
+        while frames > 0:
+            if self._bonus_food_pos is None:
+                skipped = min(
+                    frames, c.BONUS_FOOD_SPAWN_INTERVAL - self._bonus_food_spawn_timer
+                )
+                self._bonus_food_spawn_timer += skipped
+                frames -= skipped
+                if self._bonus_food_spawn_timer == c.BONUS_FOOD_SPAWN_INTERVAL:
+                    self._spawn_bonus_food()
+                    if self._bonus_food_active:
+                        self._bonus_food_duration_timer += 1
+            else:
+                skipped = min(
+                    frames, c.BONUS_FOOD_DURATION - self._bonus_food_duration_timer
+                )
+                self._bonus_food_duration_timer += skipped
+                frames -= skipped
+
+            if self._bonus_food_duration_timer >= c.BONUS_FOOD_DURATION:
+                self.deactivate_bonus_food()
+
     def _handle_bonus_food(self, tail: list[int]) -> bool:
         """
         Handle the bonus food state.
@@ -82,7 +137,7 @@ class FoodSystem:
         Returns:
             bool - Whether the bonus food was collected or not
         """
-        if self._snake.get_head_position() == tuple(self._bonus_food_pos):
+        if self._snake.get_head_position() == self._bonus_food_pos:
             self._collect_bonus_food(tail)
             return True
         else:
@@ -111,9 +166,14 @@ class FoodSystem:
         """
         Spawn the bonus food
         Validate the bonus food position and set the bonus food state
+        If the board is full, skip this bonus food and wait for the next interval
         """
-        self._bonus_food_pos = self._validate_food_position(bonus_food=True)
         self._bonus_food_spawn_timer = 0
+        self._bonus_food_pos = self._validate_food_position()
+        if self._bonus_food_pos is None:
+            return
+
+        self._board.set_flag(self._bonus_food_pos, Board.BONUS_FOOD)
         self._bonus_food_active = True
         self._bonus_food_duration_timer = 0
 
@@ -121,63 +181,101 @@ class FoodSystem:
         """
         Spawn the food
         Validate the food position and set the food state
+        If the board is full, the food position is set to None
         """
         if self._new_food:
             self._new_food = False
+            if self._food_pos is not None:
+                self._board.clear_flag(self._food_pos, Board.FOOD)
             self._food_pos = self._validate_food_position()
+            if self._food_pos is not None:
+                self._board.set_flag(self._food_pos, Board.FOOD)
 
-    def _validate_food_position(self, bonus_food: bool = False) -> list[int]:
+    def _validate_food_position(self) -> tuple[int, int] | None:
         """
         Validate the food position
-        Generate random positions until a valid position is found
+        Draw a uniformly random free cell from the board's free cell index
         A valid position is one that is not occupied by the snake or another food item
 
-        Args:
-            bonus_food: bool - Whether the food is a bonus food or not
-
         Returns:
-            list[int] - The valid food position
+            tuple[int, int] | None - The valid food position, or None if the board
+            is full
         """
-        attempts = 0
-        max_attempts = 100
-
-        while attempts < max_attempts:
-            new_pos = get_random_position()
-            new_pos_tuple = tuple(new_pos)
-
-            if bonus_food:
-                if (
-                    self.food_pos == new_pos_tuple
-                    or new_pos_tuple in self._snake.positions
-                ):
-                    attempts += 1
-                    continue
-
-            else:
-                if new_pos_tuple in self._snake.positions or (
-                    self._bonus_food_active and new_pos_tuple == self._bonus_food_pos
-                ):
-                    attempts += 1
-                    continue
-
-            return new_pos
-
-        return [1, 1]
+        return self._board.random_free_cell()
 
     def deactivate_bonus_food(self) -> None:
         """
         Deactivate the bonus food
         Reset the bonus food state
         """
+        if self._bonus_food_pos is not None:
+            self._board.clear_flag(self._bonus_food_pos, Board.BONUS_FOOD)
         self._bonus_food_active = False
         self._bonus_food_pos = None
         self._bonus_food_duration_timer = 0
 
+    def snapshot(self) -> tuple:
+        """
+        Capture the food positions and bonus food timers, to be restored with
+        restore
+        The board flags are captured with the board
+
+        Returns:
+            tuple - The captured state
+        """
+        return (
+            self._food_pos,
+            self._new_food,
+            self._bonus_food_pos,
+            self._bonus_food_spawn_timer,
+            self._bonus_food_duration_timer,
+            self._bonus_food_active,
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        Restore a state captured with snapshot
+
+        Args:
+            snapshot: tuple - The captured state
+        """
+        (
+            self._food_pos,
+            self._new_food,
+            self._bonus_food_pos,
+            self._bonus_food_spawn_timer,
+            self._bonus_food_duration_timer,
+            self._bonus_food_active,
+        ) = snapshot
+
+    def copy(self, snake: Snake, particle_system: EffectsHook) -> "FoodSystem":
+        """
+        Copy the food system for a copied snake
+
+        Args:
+            snake: Snake - The copied snake, on the copied board
+            particle_system: EffectsHook - The effects the copy notifies
+
+        Returns:
+            FoodSystem - The copy
+        """
+        food_system = FoodSystem.__new__(FoodSystem)
+        food_system._snake = snake
+        food_system._board = snake.board
+        food_system._particle_system = particle_system
+        food_system._keys = self._keys
+        food_system.restore(self.snapshot())
+        return food_system
+
     def reset(self) -> None:
         """
         Reset the food system
         """
-        self._food_pos = [0, 0]
+        if self._food_pos is not None:
+            self._board.clear_flag(self._food_pos, Board.FOOD)
+        if self._bonus_food_pos is not None:
+            self._board.clear_flag(self._bonus_food_pos, Board.BONUS_FOOD)
+        self._food_pos = (0, 0)
         self._new_food = True
         self._bonus_food_pos = None
         self._bonus_food_spawn_timer = 0
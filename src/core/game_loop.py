@@ -1,6 +1,7 @@
 from src.core.game_state import GameState
 from src.event_handler import EventHandler
 from src.ui.renderer import Renderer
+from src.utils import constants as c
 
 import pygame
 
@@ -17,12 +18,18 @@ def game_loop(
         clock (pygame.time.Clock): The game clock
     """
     event_handler = EventHandler(game_state)
-    renderer = Renderer(screen)
+    renderer = Renderer(
+        screen,
+        dirty_rects=c.DIRTY_RECT_RENDERING,
+        grid_raster=c.GRID_RASTER_RENDERING,
+    )
 
     while True:
         clock.tick(60)
         game_state.update()
         game_state.food_system.spawn_food()
+        event_handler.replay_recorder.tick()
+        event_handler.rewind_buffer.record(game_state)
         if not event_handler.handle_events():
             break
 
@@ -1,28 +1,145 @@
+from typing import NamedTuple
+
+from src.core.board import Board
 from src.core.food_system import FoodSystem
+from src.core.hooks import EffectsHook
 from src.core.snake import Snake
-from src.effects.particle_system import ParticleSystem
 from src.utils import constants as c
+from src.utils.rng import Rng
+
+
+class StepResult(NamedTuple):
+    """
+    Outcome of a single GameState.step call
+
+    Attributes:
+        reward (int): The points scored during the step
+        game_over (bool): Whether the game has ended
+        ate_food (bool): Whether the snake ate the regular food
+        ate_bonus_food (bool): Whether the snake ate the bonus food
+    """
+
+    reward: int
+    game_over: bool
+    ate_food: bool = False
+    ate_bonus_food: bool = False
+
+
+class Keyframe(NamedTuple):
+    """
+    Everything needed to rebuild a game between two frames, e.g. to seek in a replay
+
+    Attributes:
+        rng_state (int): The state of the game's random generator
+        score (int): The score
+        frame_count (int): The frames since the snake last moved
+        move_delay (int): The frames between two snake moves
+        paused (bool): Whether the game is paused
+        game_over_cause (str | None): Why the game ended, or None while playing
+        direction (tuple[int, int]): The direction of the snake
+        has_direction_changed (bool): Whether the direction already changed since
+            the last move
+        positions (tuple[tuple[int, int], ...]): The cells of the snake, head first
+        food_pos (tuple[int, int] | None): The food position
+        new_food (bool): Whether new food is due to spawn
+        bonus_food_pos (tuple[int, int] | None): The bonus food position
+        bonus_food_spawn_timer (int): The frames since the last bonus food
+        bonus_food_duration_timer (int): The frames the bonus food has been shown
+    """
+
+    rng_state: int
+    score: int
+    frame_count: int
+    move_delay: int
+    paused: bool
+    game_over_cause: str | None
+    direction: tuple[int, ...]
+    has_direction_changed: bool
+    positions: tuple[tuple[int, ...], ...]
+    food_pos: tuple[int, ...] | None
+    new_food: bool
+    bonus_food_pos: tuple[int, ...] | None
+    bonus_food_spawn_timer: int
+    bonus_food_duration_timer: int
+
+
+class GameSnapshot(NamedTuple):
+    """
+    The simulation state of a game in memory, captured with GameState.snapshot
+    Unlike a Keyframe it keeps the board's cells and free cell counts as they are,
+    so restoring it needs no rebuilding
+
+    Attributes:
+        rng_state (int): The state of the game's random generator
+        score (int): The score
+        frame_count (int): The frames since the snake last moved
+        move_delay (int): The frames between two snake moves
+        game_over (bool): Whether the game is over
+        game_over_cause (str | None): Why the game ended
+        paused (bool): Whether the game is paused
+        start_screen (bool): Whether the start screen is shown
+        board (tuple): The state of the board
+        snake (tuple): The state of the snake
+        food (tuple): The state of the food system
+    """
+
+    rng_state: int
+    score: int
+    frame_count: int
+    move_delay: int
+    game_over: bool
+    game_over_cause: str | None
+    paused: bool
+    start_screen: bool
+    board: tuple
+    snake: tuple
+    food: tuple
 
 
 class GameState:
     """
     Class to hold the game state
+    The game state imports no pygame, so it can run headless.
+    Visual effects attach through the optional particle_system hook.
 
     Attributes:
+        board (Board): The occupancy grid shared by the snake and the food
         snake (Snake): The snake object controlling snake's position and movement
+        rng (Rng): The random generator used for spawning food
+
+    Args:
+        snake_class (type[Snake]): The snake storage to use, e.g. SegmentSnake for
+            very large boards
+        particle_system (EffectsHook | None): The effects to notify, e.g. a
+            ParticleSystem; effects are disabled if not given
+        seed (int | None): The seed for spawning food, for reproducible games
+        board_size (int): The width and height of the board in cells; boards
+            larger than the window scroll with the head
     """
 
-    def __init__(self):
-        self.snake: Snake = Snake()
+    def __init__(
+        self,
+        snake_class: type[Snake] = Snake,
+        particle_system: EffectsHook | None = None,
+        seed: int | None = None,
+        board_size: int = c.GRID_SIZE,
+    ):
+        self._snake_class: type[Snake] = snake_class
+        self.rng: Rng = Rng(seed)
+        self.board: Board = Board(board_size, self.rng)
+        self.snake: Snake = snake_class(self.board)
         self.score: int = 0
 
         self._frame_count: int = 0
         self._move_delay: int = 20
 
-        self.particle_system: ParticleSystem = ParticleSystem(None)
+        self.particle_system: EffectsHook = (
+            particle_system if particle_system is not None else EffectsHook()
+        )
         self.food_system: FoodSystem = FoodSystem(self.snake, self.particle_system)
 
         self._game_over: bool = False
+        self._game_over_cause: str | None = None
         self._paused: bool = True
         self._start_screen: bool = True
 
@@ -30,6 +147,22 @@ class GameState:
     def game_over(self) -> bool:
         return self._game_over
 
+    @property
+    def game_over_cause(self) -> str | None:
+        """
+        Why the game ended: "wall", "self" or "board_full", or None while playing
+        """
+        return self._game_over_cause
+
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        A 64-bit Zobrist hash of the snake, its direction and the food, kept up to
+        date incrementally, for transposition tables and deduplication
+        Score, timers and the random generator are not part of the hash
+        """
+        return self.snake.zobrist_hash ^ self.food_system.zobrist_hash
+
     @property
     def paused(self) -> bool:
         return self._paused
@@ -46,15 +179,77 @@ class GameState:
         self._update_speed()
 
         if not self._game_over and not self._paused:
-            tail = self._update_movement()
-            if self._check_wall_collision() or self._check_self_collision():
-                self._game_over = True
+            self._advance()
+
+    def step(self, direction: tuple[int, ...] | None = None) -> StepResult:
+        """
+        Advance the game by exactly one snake move, for headless simulations
+        Applies the direction, skips the frames before the move in O(1), moves the
+        snake, resolves food, bonus food and collisions, and spawns new food
+        The result is the same as calling update and spawn_food every frame until
+        the snake moves, but pause and start screen states are ignored
+
+        Args:
+            direction (tuple[int, int] | None): The new direction, or None to keep
+                the current one
+
+        Returns:
+            StepResult: The points scored and whether the game is over
+        """
+        if self._game_over:
+            return StepResult(0, True)
+
+        if direction is not None:
+            self.snake.change_direction(direction)
+        self.food_system.spawn_food()
+
+        self._update_speed()
+        idle_frames = max(self._move_delay - self._frame_count - 1, 0)
+        self.food_system.skip_frames(idle_frames)
+        self._frame_count += idle_frames + 1
+
+        score = self.score
+        food_pos = self.food_system.food_pos
+        bonus_food_pos = self.food_system.bonus_food_pos
+        self._advance()
+        self.food_system.spawn_food()
+
+        head = self.snake.get_head_position()
+        return StepResult(
+            self.score - score,
+            self._game_over,
+            head == food_pos,
+            bonus_food_pos is not None and head == bonus_food_pos,
+        )
+
+    def _advance(self) -> None:
+        """
+        Run the rules for one frame of play: move the snake if it is due,
+        then check for collisions and food
+        """
+        tail = self._update_movement()
+        if self._check_wall_collision():
+            self._end_game("wall")
+        elif self._check_self_collision():
+            self._end_game("self")
+        elif self.food_system.board_full:
+            self._end_game("board_full")
+
+        if self.snake.get_head_position() == self.food_system.food_pos:
+            self._handle_food_collision(tail)
 
-            if self.snake.get_head_position() == tuple(self.food_system.food_pos):
-                self._handle_food_collision(tail)
+        if self.food_system.update_bonus_food(tail):
+            self.score += 3
 
-            if self.food_system.update_bonus_food(tail):
-                self.score += 3
+    def _end_game(self, cause: str) -> None:
+        """
+        End the game
+
+        Args:
+            cause (str): Why the game ended
+        """
+        self._game_over = True
+        self._game_over_cause = cause
 
     def _check_wall_collision(self) -> bool:
         """
@@ -63,10 +258,7 @@ class GameState:
         Returns:
             bool: True if the snake has collided with the wall, False otherwise
         """
-        head_x, head_y = self.snake.get_head_position()
-        return (
-            head_x < 0 or head_x >= c.GRID_SIZE or head_y < 0 or head_y >= c.GRID_SIZE
-        )
+        return self.board.is_wall(self.snake.get_head_position())
 
     def _check_self_collision(self) -> bool:
         """
@@ -75,8 +267,7 @@ class GameState:
         Returns:
             bool: True if the snake has collided with itself, False otherwise
         """
-        head_pos = self.snake.get_head_position()
-        return head_pos in self.snake.positions[1:]
+        return self.snake.has_self_collision()
 
     def _handle_food_collision(self, tail: list[int]) -> None:
         """
@@ -89,10 +280,8 @@ class GameState:
         self.snake.grow(tail)
         self.score += 1
         self.food_system._new_food = True
-        food_pixel_pos = (
-            self.food_system.food_pos[0] * c.CELL_SIZE,
-            self.food_system.food_pos[1] * c.CELL_SIZE,
-        )
+        food_x, food_y = self.food_system.food_pos
+        food_pixel_pos = (food_x * c.CELL_SIZE, food_y * c.CELL_SIZE)
         self.particle_system.spawn_particles(*food_pixel_pos, c.PASTEL_PINK)
 
     def _update_movement(self) -> list[int]:
@@ -148,16 +337,162 @@ class GameState:
         """
         self._paused = False
 
+    def snapshot(self) -> GameSnapshot:
+        """
+        Capture the simulation state, for lookahead search
+        Effects are not captured
+
+        Returns:
+            GameSnapshot: The captured state
+        """
+        return GameSnapshot(
+            self.rng.getstate(),
+            self.score,
+            self._frame_count,
+            self._move_delay,
+            self._game_over,
+            self._game_over_cause,
+            self._paused,
+            self._start_screen,
+            self.board.snapshot(),
+            self.snake.snapshot(),
+            self.food_system.snapshot(),
+        )
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """
+        Restore a state captured with snapshot from this game or one of its clones
+        A snapshot can be restored any number of times
+
+        Args:
+            snapshot (GameSnapshot): The captured state
+        """
+        self.rng.setstate(snapshot.rng_state)
+        self.score = snapshot.score
+        self._frame_count = snapshot.frame_count
+        self._move_delay = snapshot.move_delay
+        self._game_over = snapshot.game_over
+        self._game_over_cause = snapshot.game_over_cause
+        self._paused = snapshot.paused
+        self._start_screen = snapshot.start_screen
+        self.board.restore(snapshot.board)
+        self.snake.restore(snapshot.snake)
+        self.food_system.restore(snapshot.food)
+
+    def clone(self) -> "GameState":
+        """
+        Copy the game for lookahead search, without effects
+        The copy has its own board, snake, food system and random generator, so
+        stepping it leaves this game untouched, and it plays out exactly like this
+        game would for the same directions
+
+        Returns:
+            GameState: The copy
+        """
+        game_state = GameState.__new__(GameState)
+        game_state._snake_class = self._snake_class
+        game_state.rng = Rng(self.rng.getstate())
+        game_state.board = self.board.copy(game_state.rng)
+        game_state.snake = self.snake.copy(game_state.board)
+        game_state.score = self.score
+        game_state._frame_count = self._frame_count
+        game_state._move_delay = self._move_delay
+        game_state.particle_system = EffectsHook()
+        game_state.food_system = self.food_system.copy(
+            game_state.snake, game_state.particle_system
+        )
+        game_state._game_over = self._game_over
+        game_state._game_over_cause = self._game_over_cause
+        game_state._paused = self._paused
+        game_state._start_screen = self._start_screen
+        return game_state
+
+    def keyframe(self) -> Keyframe:
+        """
+        Capture the game between two frames
+
+        Returns:
+            Keyframe: The captured game
+        """
+        food_system = self.food_system
+        return Keyframe(
+            self.rng.getstate(),
+            self.score,
+            self._frame_count,
+            self._move_delay,
+            self._paused,
+            self._game_over_cause,
+            self.snake.direction,
+            self.snake.has_direction_changed,
+            tuple(self.snake.positions),
+            food_system.food_pos,
+            food_system.new_food,
+            food_system.bonus_food_pos,
+            food_system.bonus_food_spawn_timer,
+            food_system.bonus_food_duration_timer,
+        )
+
+    @classmethod
+    def from_keyframe(
+        cls,
+        keyframe: Keyframe,
+        snake_class: type[Snake] = Snake,
+        particle_system: EffectsHook | None = None,
+        board_size: int = c.GRID_SIZE,
+    ) -> "GameState":
+        """
+        Rebuild a game captured with keyframe
+
+        Args:
+            keyframe (Keyframe): The captured game
+            snake_class (type[Snake]): The snake storage to use
+            particle_system (EffectsHook | None): The effects to notify
+            board_size (int): The width and height of the board of the game
+
+        Returns:
+            GameState: The rebuilt game, past the start screen
+        """
+        game_state = cls(snake_class, particle_system, keyframe.rng_state)
+        board = game_state.board = Board(board_size, game_state.rng)
+        snake = game_state.snake = snake_class(board, list(keyframe.positions))
+        snake.restore_direction(keyframe.direction, keyframe.has_direction_changed)
+
+        food_system = game_state.food_system = FoodSystem(
+            snake, game_state.particle_system
+        )
+        food_system._food_pos = keyframe.food_pos
+        food_system._new_food = keyframe.new_food
+        if keyframe.food_pos is not None and not keyframe.new_food:
+            board.set_flag(keyframe.food_pos, Board.FOOD)
+        food_system._bonus_food_pos = keyframe.bonus_food_pos
+        food_system._bonus_food_active = keyframe.bonus_food_pos is not None
+        if keyframe.bonus_food_pos is not None:
+            board.set_flag(keyframe.bonus_food_pos, Board.BONUS_FOOD)
+        food_system._bonus_food_spawn_timer = keyframe.bonus_food_spawn_timer
+        food_system._bonus_food_duration_timer = keyframe.bonus_food_duration_timer
+
+        game_state.score = keyframe.score
+        game_state._frame_count = keyframe.frame_count
+        game_state._move_delay = keyframe.move_delay
+        game_state._game_over = keyframe.game_over_cause is not None
+        game_state._game_over_cause = keyframe.game_over_cause
+        game_state._paused = keyframe.paused
+        game_state._start_screen = False
+        return game_state
+
     def reset(self) -> None:
         """
         Reset the game state
-        Creates a new snake and resets all game parameters
+        Creates a new board of the same size and snake and resets all game
+        parameters
         """
-        self.snake = Snake()
+        self.board = Board(self.board.size, self.rng)
+        self.snake = self._snake_class(self.board)
         self.score = 0
         self._frame_count = 0
         self._move_delay = 20
         self._game_over = False
+        self._game_over_cause = None
         self._paused = False
 
         self.food_system = FoodSystem(self.snake, self.particle_system)
@@ -0,0 +1,43 @@
+class EffectsHook:
+    """
+    Optional hook through which visual effects attach to the simulation core.
+
+    The core only ever calls these methods, and the default implementation does
+    nothing, so a headless GameState never imports pygame.
+    The particle system implements this interface for the interactive game.
+    """
+
+    def spawn_particles(self, x: int, y: int, color: tuple) -> None:
+        """
+        Called when an effect should start at the given pixel position.
+
+        Args:
+            x (int): The x-coordinate of the effect in pixels
+            y (int): The y-coordinate of the effect in pixels
+            color (tuple): The color of the effect
+        """
+
+    def update(self) -> None:
+        """
+        Called once per rendered frame to advance the effects.
+        """
+
+    def draw(self, view: tuple[int, int, int, int] | None = None) -> None:
+        """
+        Called once per rendered frame to draw the effects.
+
+        Args:
+            view (tuple[int, int, int, int] | None): The area of the board in pixels
+                shown on the screen, as (x, y, width, height), when the board is
+                larger than the screen; only the effects within it are drawn
+        """
+
+    def get_bounds(self) -> tuple[int, int, int, int] | None:
+        """
+        Called by the renderer to find the screen area the effects cover.
+
+        Returns:
+            tuple[int, int, int, int] | None: The area as (x, y, width, height), or
+                None if nothing is drawn
+        """
+        return None
@@ -0,0 +1,230 @@
+from typing import NamedTuple
+
+from src.core.board import Board
+from src.core.game_state import GameState
+from src.utils import constants as c
+
+
+class _Frame(NamedTuple):
+    """
+    The state of a game after one frame that a rewind has to put back, captured in
+    O(1): the ends of the snake and the scalar fields, but not the body or the board
+    """
+
+    head: tuple[int, ...]
+    tail: tuple[int, ...]
+    rng_state: int
+    score: int
+    frame_count: int
+    move_delay: int
+    game_over: bool
+    game_over_cause: str | None
+    paused: bool
+    direction: tuple[int, ...]
+    has_direction_changed: bool
+    food: tuple
+
+
+def _capture(game_state: GameState) -> _Frame:
+    """
+    Capture the state a rewind needs after a frame
+
+    Args:
+        game_state (GameState): The game to capture
+
+    Returns:
+        _Frame: The captured state
+    """
+    snake = game_state.snake
+    return _Frame(
+        snake.get_head_position(),
+        snake.get_tail_position(),
+        game_state.rng.getstate(),
+        game_state.score,
+        game_state._frame_count,
+        game_state._move_delay,
+        game_state._game_over,
+        game_state._game_over_cause,
+        game_state._paused,
+        snake.direction,
+        snake.has_direction_changed,
+        game_state.food_system.snapshot(),
+    )
+
+
+class RewindBuffer:
+    """
+    Keeps the last frames of a game so it can be stepped backwards
+
+    Every frame only the difference to the previous one is stored (whether the
+    snake moved and grew, the tail it left, and the food, timers and score before
+    the frame) in a fixed-size ring buffer, with a full snapshot every keyframe
+    interval. Memory stays bounded however long the game runs, recording a frame is
+    O(1), and rewinding to any frame in the window restores the nearest later
+    snapshot and undoes at most one keyframe interval of frames.
+
+    Args:
+        capacity (int): The number of frames that can be rewound
+        keyframe_interval (int): The frames between two full snapshots
+    """
+
+    def __init__(
+        self,
+        capacity: int = c.REWIND_BUFFER_SECONDS * 60,
+        keyframe_interval: int = 60,
+    ):
+        self._capacity: int = capacity
+        self._keyframe_interval: int = keyframe_interval
+        self._deltas: list = [None] * capacity
+        self._keyframes: list = [None] * (capacity // keyframe_interval + 1)
+        self._game_state: GameState | None = None
+        self._board: Board | None = None
+        self._last: _Frame | None = None
+        self._frame: int = 0
+        self._available: int = 0
+
+    @property
+    def available(self) -> int:
+        """
+        The number of frames that can currently be rewound
+        """
+        return self._available
+
+    def clear(self) -> None:
+        """
+        Forget all recorded frames
+        """
+        self._game_state = None
+        self._board = None
+        self._last = None
+        self._available = 0
+
+    def record(self, game_state: GameState) -> None:
+        """
+        Record one frame, after the game state has been updated and the food
+        spawned
+        Recording starts over when the game has been reset. Frames spent paused or
+        after the game ended are skipped once the pause or game over has been
+        recorded, so waiting does not push the play out of the window
+
+        Args:
+            game_state (GameState): The game being played
+        """
+        if (
+            self._game_state is not game_state
+            or self._last is None
+            or game_state.board is not self._board
+        ):
+            self._game_state = game_state
+            self._board = game_state.board
+            self._last = _capture(game_state)
+            self._frame = 0
+            self._available = 0
+            self._store_keyframe()
+            return
+
+        last = self._last
+        current = _capture(game_state)
+        if (current.paused or current.game_over) and (
+            current.paused == last.paused and current.game_over == last.game_over
+        ):
+            return
+        moved = current.head != last.head
+        grew = current.score > last.score  # the snake grows whenever it scores
+        self._frame += 1
+        self._deltas[self._frame % self._capacity] = (last, moved, grew)
+        self._available = min(self._available + 1, self._capacity)
+        self._last = current
+        if self._frame % self._keyframe_interval == 0:
+            self._store_keyframe()
+
+    def step_back(self) -> bool:
+        """
+        Undo the last recorded frame
+
+        Returns:
+            bool: True if a frame was undone, False if none is left
+        """
+        if self._available == 0:
+            return False
+
+        game_state = self._game_state
+        last, moved, grew = self._deltas[self._frame % self._capacity]
+        self._deltas[self._frame % self._capacity] = None
+        snake = game_state.snake
+        if moved:
+            snake.retract_head()
+            if not grew:
+                snake.grow(last.tail)
+        self._restore_food(last.food)
+
+        game_state.rng.setstate(last.rng_state)
+        game_state.score = last.score
+        game_state._frame_count = last.frame_count
+        game_state._move_delay = last.move_delay
+        game_state._game_over = last.game_over
+        game_state._game_over_cause = last.game_over_cause
+        game_state._paused = last.paused
+        snake.restore_direction(last.direction, last.has_direction_changed)
+
+        self._frame -= 1
+        self._available -= 1
+        self._last = last
+        return True
+
+    def rewind(self, frames: int) -> int:
+        """
+        Step the game back by a number of frames, at most as far as recorded
+        Jumps to the nearest snapshot after the target first, so this undoes at
+        most one keyframe interval of frames one by one
+
+        Args:
+            frames (int): The number of frames to go back
+
+        Returns:
+            int: The number of frames actually rewound
+        """
+        frames = min(frames, self._available)
+        target = self._frame - frames
+        keyframe_frame = -(-target // self._keyframe_interval) * self._keyframe_interval
+        if keyframe_frame < self._frame:
+            keyframe = self._keyframes[
+                keyframe_frame // self._keyframe_interval % len(self._keyframes)
+            ]
+            if keyframe is not None and keyframe[0] == keyframe_frame:
+                self._game_state.restore(keyframe[1])
+                self._available -= self._frame - keyframe_frame
+                self._frame = keyframe_frame
+                self._last = _capture(self._game_state)
+
+        while self._frame > target:
+            self.step_back()
+        return frames
+
+    def _store_keyframe(self) -> None:
+        """
+        Store a full snapshot of the current frame
+        """
+        self._keyframes[
+            self._frame // self._keyframe_interval % len(self._keyframes)
+        ] = (self._frame, self._game_state.snapshot())
+
+    def _restore_food(self, food: tuple) -> None:
+        """
+        Put the food and bonus food of an earlier frame back on the board
+
+        Args:
+            food (tuple): The food system snapshot of the earlier frame
+        """
+        food_system = self._game_state.food_system
+        board = self._game_state.board
+        for current, earlier, flag in [
+            (food_system.food_pos, food[0], Board.FOOD),
+            (food_system.bonus_food_pos, food[2], Board.BONUS_FOOD),
+        ]:
+            if current != earlier:
+                if current is not None:
+                    board.clear_flag(current, flag)
+                if earlier is not None:
+                    board.set_flag(earlier, flag)
+        food_system.restore(food)
@@ -0,0 +1,199 @@
+from collections import deque
+from collections.abc import Iterator
+
+from src.core.board import Board
+from src.core.corners import advance_head, retract_tail, step_towards
+from src.core.snake import Snake
+from src.core.zobrist import ZobristKeys, zobrist_keys
+from src.utils import constants as c
+
+
+class SegmentSnake(Snake):
+    """
+    Snake that stores only its turn points, for very large boards.
+
+    The body is kept as a deque of corner cells from the head to the tail, with every
+    pair of neighbouring corners joined by a straight run, so memory grows with the
+    number of turns instead of the length of the snake.
+    Advancing the head and retracting the tail touch only the ends of the deque and
+    stay O(1), and the shared board still answers collision queries in O(1).
+    The positions are expanded from the corners on each read, so renderers and
+    collision queries should use iter_segments() instead.
+    """
+
+    def __init__(
+        self,
+        board: Board | None = None,
+        positions: list[tuple[int, ...]] | None = None,
+    ):
+        self._board: Board = board if board is not None else Board()
+        self._length: int = c.SNAKE_SIZE
+
+        if positions is None:
+            positions = self._initial_positions()
+        self._corners: deque[tuple[int, ...]] = deque([positions[0]])
+        for previous, position, following in zip(
+            positions, positions[1:], positions[2:]
+        ):
+            if step_towards(previous, position) != step_towards(position, following):
+                self._corners.append(position)
+        if len(positions) > 1:
+            self._corners.append(positions[-1])
+        for position in positions:
+            self._board.add_snake(position)
+
+        self._direction: tuple[int] = c.LEFT
+        self._has_direction_changed: bool = False
+        self._keys: ZobristKeys = zobrist_keys(self._board.size)
+        self._rehash()
+
+    @property
+    def positions(self) -> tuple[tuple[int, ...], ...]:
+        cells = [self._corners[0]]
+        for start, end in self.iter_segments():
+            step_x, step_y = step_towards(start, end)
+            x, y = start
+            while (x, y) != end:
+                x += step_x
+                y += step_y
+                cells.append((x, y))
+        return tuple(cells)
+
+    @property
+    def corners(self) -> tuple[tuple[int, ...], ...]:
+        return tuple(self._corners)
+
+    def get_head_position(self) -> tuple[int, ...]:
+        """
+        Get the current position of the snake's head.
+        """
+        return self._corners[0]
+
+    def get_tail_position(self) -> tuple[int, ...]:
+        """
+        Get the current position of the snake's tail.
+        """
+        return self._corners[-1]
+
+    def iter_segments(self) -> Iterator[tuple[tuple[int, ...], tuple[int, ...]]]:
+        """
+        Iterate over the straight runs of the body, from the head to the tail.
+
+        Yields:
+            tuple[tuple[int, int], tuple[int, int]]: the first and last cell of a run
+        """
+        if len(self._corners) == 1:
+            yield self._corners[0], self._corners[0]
+            return
+
+        corners = iter(self._corners)
+        start = next(corners)
+        for end in corners:
+            yield start, end
+            start = end
+
+    def get_snake_body_positions(self) -> tuple[tuple[int, ...], ...]:
+        """
+        Get the current positions of the snake's body.
+        """
+        return tuple(
+            (grid_x * c.CELL_SIZE, grid_y * c.CELL_SIZE)
+            for grid_x, grid_y in self.positions
+        )
+
+    def move(self) -> tuple[int, ...]:
+        """
+        Move the snake by one cell.
+
+        Returns:
+            tuple[int, int]: the tail of the snake
+        """
+        old_head = self._corners[0]
+        tail = retract_tail(self._corners)
+        self._board.remove_snake(tail)
+        new_head = self._get_next_head_position()
+        advance_head(self._corners, new_head)
+        self._board.add_snake(new_head)
+        self._has_direction_changed = False
+        self._hash_move(old_head, new_head, tail, self._corners[-1])
+        return tail
+
+    def grow(self, tail: tuple[int, ...]) -> None:
+        """
+        Grow the snake by one cell, adding the tail to the end of the snake.
+        """
+        corners = self._corners
+        self._hash_grow(corners[-1], tail)
+        if len(corners) > 1 and step_towards(corners[-2], corners[-1]) == (
+            step_towards(corners[-1], tail)
+        ):
+            corners[-1] = tail
+        else:
+            corners.append(tail)
+        self._board.add_snake(tail)
+
+    def retract_head(self) -> tuple[int, ...]:
+        """
+        Remove the head, undoing the second half of a move, and drop the head corner
+        once its run has been used up.
+
+        Returns:
+            tuple[int, int]: the removed cell
+        """
+        corners = self._corners
+        head = corners[0]
+        if len(corners) == 1:
+            corners.popleft()
+        else:
+            step_x, step_y = step_towards(head, corners[1])
+            new_head = (head[0] + step_x, head[1] + step_y)
+            if new_head == corners[1]:
+                corners.popleft()
+            else:
+                corners[0] = new_head
+            self._hash_retract(head, corners[0])
+        self._board.remove_snake(head)
+        return head
+
+    def snapshot(self) -> tuple:
+        """
+        Capture the corners, direction and hash, to be restored with restore.
+        The board is captured separately.
+
+        Returns:
+            tuple: the captured state
+        """
+        return (
+            tuple(self._corners),
+            self._direction,
+            self._has_direction_changed,
+            self._hash,
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        Restore a state captured with snapshot.
+        """
+        corners, self._direction, self._has_direction_changed, self._hash = snapshot
+        self._corners.clear()
+        self._corners.extend(corners)
+
+    def copy(self, board: Board) -> "SegmentSnake":
+        """
+        Copy the snake onto a copy of its board, without marking the cells again.
+
+        Args:
+            board (Board): the copied board
+
+        Returns:
+            SegmentSnake: the copy
+        """
+        snake = self.__class__.__new__(self.__class__)
+        snake._board = board
+        snake._length = self._length
+        snake._corners = self._corners.copy()
+        snake._direction = self._direction
+        snake._has_direction_changed = self._has_direction_changed
+        snake._keys = self._keys
+        snake._hash = self._hash
+        return snake
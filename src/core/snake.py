@@ -1,27 +1,65 @@
+from collections import deque
+from collections.abc import Iterator
+
+from src.core.board import Board
+from src.core.views import SequenceView
+from src.core.zobrist import ZobristKeys, snake_hash, zobrist_keys
 from src.utils import constants as c
 
 
 class Snake:
     """
     Snake class that represents the snake in the game.
+
+    The body is stored in a deque (head first) so that moving and growing are O(1),
+    and every occupied cell is counted on the shared board so that membership and
+    self-collision checks are O(1) as well.
+    The positions are exposed through a read-only view, so reading them never
+    copies the body.
+    A Zobrist hash of the body and direction is kept up to date in O(1) by every
+    move, growth and direction change.
+
+    Args:
+        board (Board | None): The board to occupy; a new one is created if not given
+        positions (list[tuple[int, int]] | None): The cells of the body, head first,
+            e.g. when restoring a saved game; the snake starts in the middle of the
+            board if not given
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        board: Board | None = None,
+        positions: list[tuple[int, ...]] | None = None,
+    ):
+        self._board: Board = board if board is not None else Board()
         self._length: int = c.SNAKE_SIZE
-        self._positions: list[tuple[int, ...]] = [
-            (c.GRID_SIZE // 2, c.GRID_SIZE // 2),  # middle of the grid
-            (c.GRID_SIZE // 2 + 1, c.GRID_SIZE // 2),  # one cell to the left
-        ]
+        self._positions: deque[tuple[int, ...]] = deque(
+            positions if positions is not None else self._initial_positions()
+        )
+        self._positions_view: SequenceView = SequenceView(self._positions)
+        for position in self._positions:
+            self._board.add_snake(position)
+
         self._direction: tuple[int] = c.LEFT
         self._has_direction_changed: bool = False
+        self._keys: ZobristKeys = zobrist_keys(self._board.size)
+        self._rehash()
 
     @property
     def length(self) -> int:
         return self._length
 
     @property
-    def positions(self) -> tuple[tuple[int, ...], ...]:
-        return tuple(self._positions)
+    def zobrist_hash(self) -> int:
+        return self._hash
+
+    @property
+    def board(self) -> Board:
+        return self._board
+
+    @property
+    def positions(self) -> SequenceView:
+        return self._positions_view
 
     @property
     def direction(self) -> tuple[int]:
@@ -35,7 +73,32 @@ class Snake:
         """
         Get the current position of the snake's head.
         """
-        return self.positions[0]
+        return self._positions[0]
+
+    def get_tail_position(self) -> tuple[int, ...]:
+        """
+        Get the current position of the snake's tail.
+        """
+        return self._positions[-1]
+
+    def iter_segments(self) -> Iterator[tuple[tuple[int, ...], tuple[int, ...]]]:
+        """
+        Iterate over the straight runs of the body, from the head to the tail.
+
+        Yields:
+            tuple[tuple[int, int], tuple[int, int]]: the first and last cell of a run
+        """
+        positions = iter(self._positions)
+        start = end = next(positions)
+        step = None
+        for position in positions:
+            new_step = (position[0] - end[0], position[1] - end[1])
+            if step is not None and new_step != step:
+                yield start, end
+                start = end
+            step = new_step
+            end = position
+        yield start, end
 
     def get_snake_body_positions(self) -> tuple[tuple[int, ...], ...]:
         """
@@ -49,6 +112,27 @@ class Snake:
 
         return tuple(display_positions)
 
+    def occupies(self, position: tuple[int, ...]) -> bool:
+        """
+        Check whether any segment of the snake is on the given cell.
+
+        Args:
+            position (tuple[int, int]): the cell to check
+
+        Returns:
+            bool: True if the cell is occupied by the snake, False otherwise
+        """
+        return self._board.snake_count(position) > 0
+
+    def has_self_collision(self) -> bool:
+        """
+        Check whether the head shares its cell with another segment.
+
+        Returns:
+            bool: True if the head overlaps the body, False otherwise
+        """
+        return self._board.snake_count(self.get_head_position()) > 1
+
     def move(self) -> tuple[int, ...]:
         """
         Move the snake by one cell.
@@ -57,16 +141,149 @@ class Snake:
             tuple[int, int]: the tail of the snake
         """
         tail = self._positions.pop()
+        self._board.remove_snake(tail)
         new_head = self._get_next_head_position()
-        self._positions.insert(0, new_head)
+        old_head = self._positions[0]
+        self._positions.appendleft(new_head)
+        self._board.add_snake(new_head)
         self._has_direction_changed = False
+        self._hash_move(old_head, new_head, tail, self._positions[-1])
         return tail
 
     def grow(self, tail: tuple[int, ...]) -> None:
         """
         Grow the snake by one cell, adding the tail to the end of the snake.
         """
+        self._hash_grow(self._positions[-1], tail)
         self._positions.append(tail)
+        self._board.add_snake(tail)
+
+    def retract_head(self) -> tuple[int, ...]:
+        """
+        Remove the head, undoing the second half of a move.
+
+        Returns:
+            tuple[int, int]: the removed cell
+        """
+        head = self._positions.popleft()
+        self._board.remove_snake(head)
+        self._hash_retract(head, self._positions[0])
+        return head
+
+    def restore_direction(
+        self, direction: tuple[int, ...], has_direction_changed: bool
+    ) -> None:
+        """
+        Set the direction of an earlier frame, without the turning rules.
+
+        Args:
+            direction (tuple[int, int]): the direction
+            has_direction_changed (bool): whether the direction had already changed
+                since the last move
+        """
+        self._hash ^= self._keys.directions[self._direction]
+        self._hash ^= self._keys.directions[direction]
+        self._direction = direction
+        self._has_direction_changed = has_direction_changed
+
+    def snapshot(self) -> tuple:
+        """
+        Capture the body, direction and hash, to be restored with restore.
+        The board is captured separately.
+
+        Returns:
+            tuple: the captured state
+        """
+        return (
+            tuple(self._positions),
+            self._direction,
+            self._has_direction_changed,
+            self._hash,
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        Restore a state captured with snapshot.
+        """
+        positions, self._direction, self._has_direction_changed, self._hash = snapshot
+        self._positions.clear()
+        self._positions.extend(positions)
+
+    def copy(self, board: Board) -> "Snake":
+        """
+        Copy the snake onto a copy of its board, without marking the cells again.
+
+        Args:
+            board (Board): the copied board
+
+        Returns:
+            Snake: the copy
+        """
+        snake = self.__class__.__new__(self.__class__)
+        snake._board = board
+        snake._length = self._length
+        snake._positions = self._positions.copy()
+        snake._positions_view = SequenceView(snake._positions)
+        snake._direction = self._direction
+        snake._has_direction_changed = self._has_direction_changed
+        snake._keys = self._keys
+        snake._hash = self._hash
+        return snake
+
+    def _rehash(self) -> None:
+        """
+        Compute the Zobrist hash of the snake from scratch.
+        """
+        self._hash = snake_hash(self._keys, list(self.positions), self._direction)
+
+    def _hash_move(
+        self,
+        old_head: tuple[int, ...],
+        new_head: tuple[int, ...],
+        tail: tuple[int, ...],
+        new_tail: tuple[int, ...],
+    ) -> None:
+        """
+        Update the hash for a move: the head marker passes to the new head, which
+        links back to the old one, and the tail marker passes to the new tail, which
+        no longer links to the old one.
+        """
+        keys = self._keys
+        self._hash ^= (
+            keys.head[old_head]
+            ^ keys.head[new_head]
+            ^ keys.link(new_head, old_head)
+            ^ keys.tail[tail]
+            ^ keys.link(new_tail, tail)
+            ^ keys.tail[new_tail]
+        )
+
+    def _hash_grow(self, last: tuple[int, ...], tail: tuple[int, ...]) -> None:
+        """
+        Update the hash for a new tail cell following the last one.
+        """
+        keys = self._keys
+        self._hash ^= keys.tail[last] ^ keys.link(last, tail) ^ keys.tail[tail]
+
+    def _hash_retract(self, head: tuple[int, ...], new_head: tuple[int, ...]) -> None:
+        """
+        Update the hash for a removed head cell.
+        """
+        keys = self._keys
+        self._hash ^= keys.head[head] ^ keys.link(head, new_head) ^ keys.head[new_head]
+
+    def _initial_positions(self) -> list[tuple[int, int]]:
+        """
+        Get the cells the snake starts on, in the middle of the board.
+
+        Returns:
+            list[tuple[int, int]]: the starting cells, head first
+        """
+        middle = self._board.size // 2
+        return [
+            (middle, middle),  # middle of the grid
+            (middle + 1, middle),  # one cell to the right, behind the head
+        ]
 
     def _get_next_head_position(self) -> tuple[int, ...]:
         """
@@ -75,7 +292,7 @@ class Snake:
         Returns:
             tuple[int, int]: the next position of the snake's head
         """
-        curr_head_x, curr_head_y = self._positions[0]
+        curr_head_x, curr_head_y = self.get_head_position()
         return (
             curr_head_x + self._direction[0],
             curr_head_y + self._direction[1],
@@ -103,6 +320,8 @@ class Snake:
         if new_dir not in [c.UP, c.LEFT, c.RIGHT, c.DOWN]:
             return False
 
+        self._hash ^= self._keys.directions[self._direction]
+        self._hash ^= self._keys.directions[new_dir]
         self._direction = new_dir
         self._has_direction_changed = True
         return True
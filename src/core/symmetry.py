@@ -0,0 +1,185 @@
+from typing import NamedTuple
+
+from src.utils import constants as c
+
+# The 8 symmetries of the square board as 2x2 matrices ((xx, xy), (yx, yy)) acting
+# on steps, so that a step (dx, dy) becomes (xx*dx + xy*dy, yx*dx + yy*dy).
+TRANSFORMS = (
+    ((1, 0), (0, 1)),  # identity
+    ((0, -1), (1, 0)),  # rotate 90° clockwise
+    ((-1, 0), (0, -1)),  # rotate 180°
+    ((0, 1), (-1, 0)),  # rotate 90° counterclockwise
+    ((-1, 0), (0, 1)),  # mirror left to right
+    ((1, 0), (0, -1)),  # mirror top to bottom
+    ((0, 1), (1, 0)),  # mirror along the main diagonal
+    ((0, -1), (-1, 0)),  # mirror along the anti-diagonal
+)
+IDENTITY = 0
+
+
+class CanonicalState(NamedTuple):
+    """
+    The parts of a game that symmetries move around, in one orientation
+    Hashable and ordered, so it can key caches and pick the canonical orientation
+
+    Attributes:
+        positions (tuple[tuple[int, int], ...]): The cells of the snake, head first
+        direction (tuple[int, int]): The direction of the snake
+        food_pos (tuple[int, int] | None): The food position
+        bonus_food_pos (tuple[int, int] | None): The bonus food position
+    """
+
+    positions: tuple[tuple[int, ...], ...]
+    direction: tuple[int, ...]
+    food_pos: tuple[int, ...] | None
+    bonus_food_pos: tuple[int, ...] | None
+
+
+def inverse_transform(transform: int) -> int:
+    """
+    Get the symmetry that undoes another one
+
+    Args:
+        transform (int): The index of the symmetry in TRANSFORMS
+
+    Returns:
+        int: The index of the inverse symmetry
+    """
+    (xx, xy), (yx, yy) = TRANSFORMS[transform]
+    return TRANSFORMS.index(((xx, yx), (xy, yy)))  # rotations are orthogonal
+
+
+def transform_direction(direction: tuple[int, ...], transform: int) -> tuple[int, int]:
+    """
+    Apply a symmetry to a direction
+
+    Args:
+        direction (tuple[int, int]): The direction
+        transform (int): The index of the symmetry in TRANSFORMS
+
+    Returns:
+        tuple[int, int]: The transformed direction
+    """
+    (xx, xy), (yx, yy) = TRANSFORMS[transform]
+    return xx * direction[0] + xy * direction[1], yx * direction[0] + yy * direction[1]
+
+
+def transform_position(
+    position: tuple[int, ...] | None, transform: int, size: int = c.GRID_SIZE
+) -> tuple[int, int] | None:
+    """
+    Apply a symmetry to a cell of the board, about the centre of the board
+
+    Args:
+        position (tuple[int, int] | None): The cell, or None
+        transform (int): The index of the symmetry in TRANSFORMS
+        size (int): The width and height of the board
+
+    Returns:
+        tuple[int, int] | None: The transformed cell, or None
+    """
+    if position is None:
+        return None
+    (xx, xy), (yx, yy) = TRANSFORMS[transform]
+    last = size - 1
+    return (
+        xx * position[0] + xy * position[1] + last * (1 - xx - xy) // 2,
+        yx * position[0] + yy * position[1] + last * (1 - yx - yy) // 2,
+    )
+
+
+def transform_state(
+    state: CanonicalState, transform: int, size: int = c.GRID_SIZE
+) -> CanonicalState:
+    """
+    Apply a symmetry to a state
+
+    Args:
+        state (CanonicalState): The state in its current orientation
+        transform (int): The index of the symmetry in TRANSFORMS
+        size (int): The width and height of the board
+
+    Returns:
+        CanonicalState: The transformed state
+    """
+    (xx, xy), (yx, yy) = TRANSFORMS[transform]
+    last = size - 1
+    offset_x = last * (1 - xx - xy) // 2
+    offset_y = last * (1 - yx - yy) // 2
+    return CanonicalState(
+        tuple(
+            (xx * x + xy * y + offset_x, yx * x + yy * y + offset_y)
+            for x, y in state.positions
+        ),
+        transform_direction(state.direction, transform),
+        transform_position(state.food_pos, transform, size),
+        transform_position(state.bonus_food_pos, transform, size),
+    )
+
+
+def state_of(game_state) -> CanonicalState:
+    """
+    Get the symmetric parts of a game in its own orientation
+
+    Args:
+        game_state (GameState): The game
+
+    Returns:
+        CanonicalState: The state, untransformed
+    """
+    return CanonicalState(
+        tuple(game_state.snake.positions),
+        game_state.snake.direction,
+        game_state.food_system.food_pos,
+        game_state.food_system.bonus_food_pos,
+    )
+
+
+def canonicalize(game_state) -> tuple[CanonicalState, int]:
+    """
+    Map a game to its canonical orientation, the smallest of its 8 symmetric
+    states, so that rotated and mirrored positions share one cache entry
+    Directions chosen for the canonical state are mapped back to the game with
+    from_canonical_direction
+
+    Args:
+        game_state (GameState): The game
+
+    Returns:
+        tuple[CanonicalState, int]: The canonical state and the index of the
+            symmetry that maps the game onto it
+    """
+    state = state_of(game_state)
+    size = game_state.board.size
+    return min(
+        (transform_state(state, transform, size), transform)
+        for transform in range(len(TRANSFORMS))
+    )
+
+
+def to_canonical_direction(direction: tuple[int, ...], transform: int) -> tuple:
+    """
+    Map a direction in the game to the canonical orientation
+
+    Args:
+        direction (tuple[int, int]): The direction in the game
+        transform (int): The symmetry returned by canonicalize
+
+    Returns:
+        tuple[int, int]: The direction in the canonical orientation
+    """
+    return transform_direction(direction, transform)
+
+
+def from_canonical_direction(direction: tuple[int, ...], transform: int) -> tuple:
+    """
+    Map a direction chosen in the canonical orientation back to the game
+
+    Args:
+        direction (tuple[int, int]): The direction in the canonical orientation
+        transform (int): The symmetry returned by canonicalize
+
+    Returns:
+        tuple[int, int]: The direction to play in the game
+    """
+    return transform_direction(direction, inverse_transform(transform))
@@ -0,0 +1,53 @@
+from collections.abc import Iterator, Sequence
+from itertools import islice
+from typing import Any
+
+
+class SequenceView(Sequence):
+    """
+    Read-only, zero-copy view over a list or deque owned by another object.
+
+    The view is created once and always reflects the current contents of the
+    underlying container, so reading it never copies the data.
+    Slicing returns a tuple copy of just the requested items, reading the
+    container only up to the end of the slice when the step is positive.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Sequence):
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._items))
+            if step > 0:
+                return tuple(islice(self._items, start, stop, step))
+            return tuple(self._items)[index]
+        return self._items[index]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator:
+        return reversed(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._items
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SequenceView):
+            other = other._items
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self._items) == len(other) and all(
+            a == b for a, b in zip(self._items, other)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._items)!r})"
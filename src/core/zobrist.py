@@ -0,0 +1,203 @@
+from functools import cache
+
+from src.utils import constants as c
+from src.utils.rng import Rng, derive_seed
+
+ZOBRIST_SEED = 0x5A0B_2157
+
+
+class _KeyTable(dict):
+    """
+    The keys of one feature by position, derived from the seed of the table and
+    the index of the cell the first time a position is looked up, and kept after.
+    """
+
+    def __init__(self, seed: int, stride: int):
+        super().__init__()
+        self._seed: int = seed
+        self._stride: int = stride
+
+    def __missing__(self, position: tuple[int, ...]) -> int:
+        key = self[position] = derive_seed(
+            self._seed, (position[1] + 1) * self._stride + position[0] + 1
+        )
+        return key
+
+
+class ZobristKeys:
+    """
+    Random 64-bit keys for Zobrist hashing of games on one board size.
+
+    A game is hashed by XOR-ing one key per feature: every snake cell keyed by the
+    step to the next cell towards the tail (or as the tail), the head cell, the
+    direction of the snake, and the food and bonus food cells. Keying the body by
+    its links means two snakes on the same cells in a different order hash
+    differently, and every move, growth or direction change only swaps a handful of
+    keys. The keys come from a fixed seed, so hashes agree across processes.
+
+    The tables are dicts keyed by position, so the hot paths look keys up without
+    computing cell indices. A key is derived from the seed and the index of its
+    cell on first use rather than up front, so creating the keys costs the same
+    for any board size and only the cells a game visits take memory.
+
+    Args:
+        size (int): The width and height of the playable area in cells
+    """
+
+    def __init__(self, size: int):
+        rng = Rng(derive_seed(ZOBRIST_SEED, size))
+        stride = size + 2
+        self.head: dict[tuple[int, ...], int] = _KeyTable(rng.next_u64(), stride)
+        self.tail: dict[tuple[int, ...], int] = _KeyTable(rng.next_u64(), stride)
+        self.food: dict[tuple[int, ...], int] = _KeyTable(rng.next_u64(), stride)
+        self.bonus_food: dict[tuple[int, ...], int] = _KeyTable(rng.next_u64(), stride)
+        self.links: dict[tuple[int, ...], dict[tuple[int, ...], int]] = {
+            step: _KeyTable(rng.next_u64(), stride)
+            for step in (c.UP, c.RIGHT, c.DOWN, c.LEFT)
+        }
+        self.directions: dict[tuple[int, ...], int] = {
+            direction: rng.next_u64() for direction in (c.UP, c.RIGHT, c.DOWN, c.LEFT)
+        }
+        self._seed: int = rng.next_u64()
+
+    def link(self, position: tuple[int, ...], next_position: tuple[int, ...]) -> int:
+        """
+        Get the key of a snake cell followed by another cell towards the tail.
+
+        Args:
+            position (tuple[int, int]): The cell
+            next_position (tuple[int, int]): The next cell of the body, normally a
+                neighbour
+
+        Returns:
+            int: The key
+        """
+        step = (next_position[0] - position[0], next_position[1] - position[1])
+        links = self.links.get(step)
+        if links is not None:
+            return links[position]
+        return derive_seed(self._seed, *position, *next_position)
+
+
+@cache
+def zobrist_keys(size: int) -> ZobristKeys:
+    """
+    Get the shared Zobrist keys for a board size.
+
+    Args:
+        size (int): The width and height of the playable area in cells
+
+    Returns:
+        ZobristKeys: The keys
+    """
+    return ZobristKeys(size)
+
+
+def snake_hash(
+    keys: ZobristKeys,
+    positions: list[tuple[int, ...]],
+    direction: tuple[int, ...],
+) -> int:
+    """
+    Hash a snake from scratch.
+
+    Args:
+        keys (ZobristKeys): The keys for the board size
+        positions (list[tuple[int, int]]): The cells of the body, head first
+        direction (tuple[int, int]): The direction of the snake
+
+    Returns:
+        int: The hash
+    """
+    value = keys.directions[direction] ^ keys.head[positions[0]]
+    value ^= keys.tail[positions[-1]]
+    for position, next_position in zip(positions, positions[1:]):
+        value ^= keys.link(position, next_position)
+    return value
+
+
+def moved_snake_hash(
+    keys: ZobristKeys,
+    value: int,
+    old_head: tuple[int, ...],
+    head: tuple[int, ...],
+    old_tail: tuple[int, ...],
+    tail: tuple[int, ...],
+) -> int:
+    """
+    Get the hash of a snake after one move from its hash before, the head advancing
+    to a new cell and the tail following it, or staying when the snake grew.
+    Comparing the result with the hash of a snake tells in O(1) whether it changed
+    by exactly that move.
+
+    Args:
+        keys (ZobristKeys): The keys for the board size
+        value (int): The hash before the move
+        old_head (tuple[int, int]): The head before the move
+        head (tuple[int, int]): The head after the move
+        old_tail (tuple[int, int]): The tail before the move
+        tail (tuple[int, int]): The tail after the move
+
+    Returns:
+        int: The hash after the move
+    """
+    value ^= keys.head[old_head] ^ keys.head[head] ^ keys.link(head, old_head)
+    if tail != old_tail:
+        value ^= keys.tail[old_tail] ^ keys.tail[tail] ^ keys.link(tail, old_tail)
+    return value
+
+
+def followed_snake_hash(
+    keys: ZobristKeys,
+    value: int,
+    old_ends: tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]],
+    ends: tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]],
+) -> int | None:
+    """
+    Get the hash a snake should have after at most one move and one turn, from its
+    hash and its head, tail and direction before and after.
+    If the result equals the hash of the snake, it changed by exactly that move
+    and turn, which tells in O(1) whether what was derived from the snake before
+    can be updated instead of rebuilt.
+
+    Args:
+        keys (ZobristKeys): The keys for the board size
+        value (int): The hash before
+        old_ends (tuple): The head, tail and direction before
+        ends (tuple): The head, tail and direction after
+
+    Returns:
+        int | None: The expected hash, or None if no single move changes the ends
+            that way
+    """
+    old_head, old_tail, old_direction = old_ends
+    head, tail, direction = ends
+    if direction != old_direction:
+        value ^= keys.directions[old_direction] ^ keys.directions[direction]
+    if head != old_head:
+        return moved_snake_hash(keys, value, old_head, head, old_tail, tail)
+    if tail != old_tail:
+        return None
+    return value
+
+
+def compute_hash(game_state) -> int:
+    """
+    Hash a game from scratch, the reference for the hash GameState maintains
+    incrementally.
+
+    Args:
+        game_state (GameState): The game to hash
+
+    Returns:
+        int: The hash
+    """
+    keys = zobrist_keys(game_state.board.size)
+    snake = game_state.snake
+    value = snake_hash(keys, list(snake.positions), snake.direction)
+    food_system = game_state.food_system
+    if food_system.food_pos is not None:
+        value ^= keys.food[food_system.food_pos]
+    if food_system.bonus_food_pos is not None:
+        value ^= keys.bonus_food[food_system.bonus_food_pos]
+    return value
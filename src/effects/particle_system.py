@@ -1,17 +1,47 @@
-from src.effects.particle import Particle
+from src.core.hooks import EffectsHook
 
+import numpy as np
 import pygame
 
 
-class ParticleSystem:
+class ParticleSystem(EffectsHook):
     """
     A simple particle system class that manages a collection of particles.
+
+    The particles are stored as a struct of arrays: one NumPy buffer each for the
+    positions, velocities, remaining and initial lifetimes and colour indices, with
+    the live particles packed at the front. A frame moves and ages all of them in a
+    few vectorised operations, dead particles are compacted away in place, and a
+    spawn draws the random velocities and lifetimes of the whole burst at once.
+    The buffers double in size when full, so spawning stays amortised O(1).
+
+    Particles are drawn from small circle sprites baked once per colour at a set of
+    alpha levels, and all of them are blitted in a single Surface.blits call. The
+    sprites carry per-pixel alpha, so the particles fade out as they age, which
+    drawing circles with an RGBA colour on the opaque screen did not do.
     """
 
-    def __init__(self, screen: pygame.Surface):
+    SIZE = 2  # radius of a particle in pixels
+    SPEED = 2.0  # largest speed along each axis, in pixels per frame
+    MIN_LIFETIME = 30  # shortest lifetime in frames
+    MAX_LIFETIME = 60  # longest lifetime in frames
+    ALPHA_LEVELS = 16  # alpha levels baked per colour, from transparent to opaque
+
+    def __init__(self, screen: pygame.Surface, capacity: int = 256):
         self.screen = screen
-        self.particles: list = []
         self.num_particles: int = 10
+        self._count: int = 0
+        self._rng: np.random.Generator = np.random.default_rng()
+        self._color_indices: dict[tuple, int] = {}
+        self._sprites: list[pygame.Surface] = []
+        self._allocate(capacity)
+
+    @property
+    def count(self) -> int:
+        """
+        The number of live particles
+        """
+        return self._count
 
     def spawn_particles(self, x: int, y: int, color: tuple) -> None:
         """
@@ -22,24 +52,160 @@ class ParticleSystem:
             y (int): The y-coordinate of the spawn position.
             color (tuple): The color of the particles.
         """
-        for _ in range(self.num_particles):
-            self.particles.append(Particle(x, y, color))
+        start, end = self._count, self._count + self.num_particles
+        if end > len(self._x):
+            self._allocate(max(end, 2 * len(self._x)))
+
+        color_index = self._color_indices.get(color)
+        if color_index is None:
+            color_index = self._color_indices[color] = len(self._color_indices)
+            self._bake_sprites(color)
+
+        count = end - start
+        self._x[start:end] = x
+        self._y[start:end] = y
+        self._vx[start:end] = self._rng.uniform(-self.SPEED, self.SPEED, count)
+        self._vy[start:end] = self._rng.uniform(-self.SPEED, self.SPEED, count)
+        self._life[start:end] = self._rng.integers(
+            self.MIN_LIFETIME, self.MAX_LIFETIME, count, endpoint=True
+        )
+        self._initial_life[start:end] = self._life[start:end]
+        self._color[start:end] = color_index
+        self._count = end
 
     def update(self) -> None:
         """
         Update the particles in the system.
         Remove particles that are no longer alive.
         """
-        self.particles = [particle for particle in self.particles if particle.update()]
+        count = self._count
+        if count == 0:
+            return
+        self._x[:count] += self._vx[:count]
+        self._y[:count] += self._vy[:count]
+        life = self._life[:count]
+        life -= 1
 
-    def draw(self) -> None:
+        alive = life > 0
+        live = int(np.count_nonzero(alive))
+        if live < count:
+            for buffer in self._buffers():
+                buffer[:live] = buffer[:count][alive]
+            self._count = live
+
+    def draw(self, view: tuple[int, int, int, int] | None = None) -> None:
         """
         Draw the particles on the screen.
+
+        Args:
+            view (tuple[int, int, int, int] | None): The area of the board shown on
+                the screen, as (x, y, width, height); particles outside it are
+                skipped and the others drawn relative to it. The whole screen if
+                not given.
+        """
+        count = self._count
+        if count == 0:
+            return
+        xs = self._x[:count].astype(np.int64)
+        ys = self._y[:count].astype(np.int64)
+        shown = slice(None)
+        if view is not None:
+            left, top, width, height = view
+            xs -= left
+            ys -= top
+            size = self.SIZE
+            shown = (
+                (xs >= -size)
+                & (xs < width + size)
+                & (ys >= -size)
+                & (ys < height + size)
+            )
+        alphas = (self._life[:count] / self._initial_life[:count] * 255).astype(
+            np.int64
+        )
+        levels = (alphas * (self.ALPHA_LEVELS - 1) + 127) // 255
+        sprite_indices = (
+            self._color[:count].astype(np.int64) * self.ALPHA_LEVELS + levels
+        )
+        xs -= self.SIZE
+        ys -= self.SIZE
+        self.screen.blits(
+            zip(
+                map(self._sprites.__getitem__, sprite_indices[shown].tolist()),
+                zip(xs[shown].tolist(), ys[shown].tolist()),
+            ),
+            False,
+        )
+
+    def get_bounds(self) -> tuple[int, int, int, int] | None:
+        """
+        Get the screen area the particles cover.
+
+        Returns:
+            tuple[int, int, int, int] | None: The area as (x, y, width, height), or
+                None if there are no particles.
+        """
+        count = self._count
+        if count == 0:
+            return None
+        xs = self._x[:count].astype(np.int64)
+        ys = self._y[:count].astype(np.int64)
+        left = int(xs.min()) - self.SIZE
+        top = int(ys.min()) - self.SIZE
+        right = int(xs.max()) + self.SIZE
+        bottom = int(ys.max()) + self.SIZE
+        return left, top, right - left + 1, bottom - top + 1
+
+    def _bake_sprites(self, color: tuple) -> None:
+        """
+        Draw the circle of a particle in a colour at every alpha level
+
+        Args:
+            color (tuple): The color of the particles
         """
-        for particle in self.particles:
+        diameter = 2 * self.SIZE + 1
+        for level in range(self.ALPHA_LEVELS):
+            sprite = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+            alpha = level * 255 // (self.ALPHA_LEVELS - 1)
             pygame.draw.circle(
-                self.screen,
-                particle.color,
-                (int(particle.x), int(particle.y)),
-                particle.size,
+                sprite, (*color[:3], alpha), (self.SIZE, self.SIZE), self.SIZE
             )
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._sprites.append(sprite)
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Allocate the buffers for a number of particles, keeping the live ones
+
+        Args:
+            capacity (int): The number of particles the buffers can hold
+        """
+        count = self._count
+        previous = self._buffers() if count else []
+        self._x = np.zeros(capacity, np.float64)
+        self._y = np.zeros(capacity, np.float64)
+        self._vx = np.zeros(capacity, np.float64)
+        self._vy = np.zeros(capacity, np.float64)
+        self._life = np.zeros(capacity, np.int32)
+        self._initial_life = np.zeros(capacity, np.int32)
+        self._color = np.zeros(capacity, np.uint16)
+        for buffer, old in zip(self._buffers(), previous):
+            buffer[:count] = old[:count]
+
+    def _buffers(self) -> list[np.ndarray]:
+        """
+        Get the buffers that hold one value per particle
+
+        Returns:
+            list[np.ndarray]: The buffers, all the same length
+        """
+        return [
+            self._x,
+            self._y,
+            self._vx,
+            self._vy,
+            self._life,
+            self._initial_life,
+            self._color,
+        ]
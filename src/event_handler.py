@@ -1,4 +1,6 @@
 from src.core.game_state import GameState
+from src.core.rewind import RewindBuffer
+from src.simulation.replay import ReplayRecorder
 from src.ui.ui_components import get_start_button_rect
 from src.utils import constants as c
 from src.utils.screenshot import ScreenshotManager
@@ -17,12 +19,18 @@ class EventHandler:
         game_state (GameState): The current game state
         screenshot_manager (ScreenshotManager): The screenshot manager
                 to take screenshots
+        replay_recorder (ReplayRecorder): The recorder that saves every game
+                as a replay
+        rewind_buffer (RewindBuffer): The last seconds of the game, to rewind
+                with the B key
 
     """
 
     def __init__(self, game_state: GameState) -> None:
         self.game_state = game_state
         self.screenshot_manager = ScreenshotManager()
+        self.replay_recorder = ReplayRecorder()
+        self.rewind_buffer = RewindBuffer()
 
     def handle_events(self) -> bool:
         """
@@ -57,6 +65,7 @@ class EventHandler:
                 - S key or DOWN arrow key: Move the snake down
                 - D key or RIGHT arrow key: Move the snake right
                 - C key: Take a screenshot
+                - B key: Rewind the last seconds and pause the game
                 - SPACE key: Pause or start the game
 
 
@@ -66,6 +75,7 @@ class EventHandler:
         # Restart the game
         if event.key == pygame.K_r:
             self.game_state.reset()
+            self.replay_recorder.start(self.game_state)
 
         # Exit the game
         elif event.key == pygame.K_q:
@@ -91,6 +101,10 @@ class EventHandler:
                     pygame.display.get_surface(), self.game_state
                 )
 
+        # Rewind the game
+        elif event.key == pygame.K_b:
+            self._handle_rewind()
+
         # Pause or start the game
         elif event.key == pygame.K_SPACE:
             self._handle_space_key()
@@ -106,6 +120,7 @@ class EventHandler:
         """
         if not self.game_state.start_screen:
             self.game_state.pause_game()
+            self.replay_recorder.record_paused(True)
             self.game_state.exit_to_start_screen()
             return True
         else:
@@ -119,13 +134,31 @@ class EventHandler:
             key (int): The key pressed by the user
         """
         if key == pygame.K_w or key == pygame.K_UP:
-            self.game_state.snake.change_direction(c.UP)
+            direction = c.UP
         elif key == pygame.K_a or key == pygame.K_LEFT:
-            self.game_state.snake.change_direction(c.LEFT)
+            direction = c.LEFT
         elif key == pygame.K_s or key == pygame.K_DOWN:
-            self.game_state.snake.change_direction(c.DOWN)
+            direction = c.DOWN
         elif key == pygame.K_d or key == pygame.K_RIGHT:
-            self.game_state.snake.change_direction(c.RIGHT)
+            direction = c.RIGHT
+        else:
+            return
+
+        if self.game_state.snake.change_direction(direction):
+            self.replay_recorder.record_direction(direction)
+
+    def _handle_rewind(self) -> None:
+        """
+        Handle the rewind key press event
+        Step the game back by up to REWIND_SECONDS and pause it, so the earlier
+        position can be inspected before continuing
+        The replay of the game is dropped, since it can no longer be re-simulated
+        """
+        if self.game_state.start_screen:
+            return
+        if self.rewind_buffer.rewind(c.REWIND_SECONDS * 60):
+            self.replay_recorder.cancel()
+            self.game_state.pause_game()
 
     def _handle_space_key(self) -> None:
         """
@@ -136,10 +169,13 @@ class EventHandler:
         """
         if not self.game_state.paused:
             self.game_state.pause_game()
+            self.replay_recorder.record_paused(True)
             return
         if self.game_state.start_screen:
             self.game_state.start_game()
+            self.replay_recorder.start(self.game_state)
         self.game_state.continue_game()
+        self.replay_recorder.record_paused(False)
 
     def _handle_start_screen_click(self) -> None:
         """
@@ -148,3 +184,4 @@ class EventHandler:
         button_rect = get_start_button_rect()
         if button_rect.collidepoint(pygame.mouse.get_pos()):
             self.game_state.start_game()
+            self.replay_recorder.start(self.game_state)
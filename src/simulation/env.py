@@ -0,0 +1,205 @@
+from typing import Any
+
+from src.core.game_state import GameState
+from src.simulation.policies import DIRECTIONS
+
+import numpy as np
+
+BODY_PLANE = 0
+HEAD_PLANE = 1
+FOOD_PLANE = 2
+BONUS_FOOD_PLANE = 3
+NUM_PLANES = 4
+
+
+class SnakeEnv:
+    """
+    Gym-style reinforcement learning environment around GameState.
+
+    Every step advances the game by one snake move. Actions are indices into
+    DIRECTIONS (up, right, down, left), and the reward is the score gained.
+
+    The observation is one preallocated float32 buffer holding four size × size
+    occupancy planes (body, head, food, bonus food) followed by the one-hot current
+    direction. It is rebuilt only on reset and updated in place on every step from
+    the cells that changed, so the same array is returned every time; copy it to
+    keep an old observation.
+
+    Args:
+        seed (int | None): The seed for the first game
+        max_moves (int | None): The number of moves after which an episode is
+            truncated, unlimited if not given
+        observe (bool): Whether to maintain the observation buffer
+    """
+
+    def __init__(
+        self, seed: int | None = None, max_moves: int | None = None, observe=True
+    ):
+        self._seed: int | None = seed
+        self._max_moves: int | None = max_moves
+        self._observe: bool = observe
+        self._moves: int = 0
+
+        self.game_state: GameState = GameState(seed=seed)
+        size = self.game_state.board.size
+        self._observation: np.ndarray = np.zeros(
+            NUM_PLANES * size * size + len(DIRECTIONS), dtype=np.float32
+        )
+        self._planes: np.ndarray = self._observation[
+            : NUM_PLANES * size * size
+        ].reshape(NUM_PLANES, size, size)
+        self._direction: np.ndarray = self._observation[NUM_PLANES * size * size :]
+
+    @property
+    def observation(self) -> np.ndarray:
+        return self._observation
+
+    @property
+    def planes(self) -> np.ndarray:
+        """
+        The occupancy planes of the observation, shaped (4, size, size) and
+        indexed [plane, y, x]
+        """
+        return self._planes
+
+    @property
+    def direction(self) -> np.ndarray:
+        """
+        The one-hot direction part of the observation, ordered like DIRECTIONS
+        """
+        return self._direction
+
+    def reset(self, seed: int | None = None) -> tuple[np.ndarray | None, dict]:
+        """
+        Start a new episode
+
+        Args:
+            seed (int | None): The seed for the new game; the current random
+                generator carries on if not given
+
+        Returns:
+            tuple[np.ndarray | None, dict]: The observation and an empty info dict
+        """
+        if seed is not None:
+            self.game_state = GameState(seed=seed)
+        else:
+            self.game_state.reset()
+        self.game_state.food_system.spawn_food()
+        self._moves = 0
+
+        if not self._observe:
+            return None, {}
+
+        self._observation.fill(0)
+        for x, y in self.game_state.snake.positions:
+            self._planes[BODY_PLANE, y, x] = 1
+        self._set(HEAD_PLANE, self.game_state.snake.get_head_position(), 1)
+        self._set(FOOD_PLANE, self.game_state.food_system.food_pos, 1)
+        self._set(BONUS_FOOD_PLANE, self.game_state.food_system.bonus_food_pos, 1)
+        self._direction[DIRECTIONS.index(self.game_state.snake.direction)] = 1
+        return self._observation, {}
+
+    def step(
+        self, action: int | None
+    ) -> tuple[np.ndarray | None, int, bool, bool, dict[str, Any]]:
+        """
+        Advance the game by one snake move
+
+        Args:
+            action (int | None): The index of the new direction in DIRECTIONS, or
+                None to keep the current direction
+
+        Returns:
+            tuple: The observation, the reward, whether the game is over, whether
+                the episode was cut off at max_moves, and an info dict with the
+                score and the cause of death
+        """
+        game_state = self.game_state
+        if game_state.game_over:
+            info = {"score": game_state.score, "cause": game_state.game_over_cause}
+            return self._observation if self._observe else None, 0, True, False, info
+
+        snake = game_state.snake
+        food_system = game_state.food_system
+        old_head = snake.get_head_position()
+        old_tail = snake.get_tail_position()
+        old_direction = snake.direction
+        old_food = food_system.food_pos
+        old_bonus_food = food_system.bonus_food_pos
+
+        result = game_state.step(None if action is None else DIRECTIONS[action])
+        self._moves += 1
+        truncated = (
+            self._max_moves is not None
+            and self._moves >= self._max_moves
+            and not result.game_over
+        )
+
+        if self._observe:
+            board = game_state.board
+            head = snake.get_head_position()
+            if board.snake_count(old_tail) == 0:
+                self._set(BODY_PLANE, old_tail, 0)
+            self._set(HEAD_PLANE, old_head, 0)
+            self._set(BODY_PLANE, head, 1)
+            self._set(HEAD_PLANE, head, 1)
+
+            if food_system.food_pos != old_food:
+                self._set(FOOD_PLANE, old_food, 0)
+                self._set(FOOD_PLANE, food_system.food_pos, 1)
+            if food_system.bonus_food_pos != old_bonus_food:
+                self._set(BONUS_FOOD_PLANE, old_bonus_food, 0)
+                self._set(BONUS_FOOD_PLANE, food_system.bonus_food_pos, 1)
+            if snake.direction != old_direction:
+                self._direction[DIRECTIONS.index(old_direction)] = 0
+                self._direction[DIRECTIONS.index(snake.direction)] = 1
+
+        info = {"score": game_state.score, "cause": game_state.game_over_cause}
+        return (
+            self._observation if self._observe else None,
+            result.reward,
+            result.game_over,
+            truncated,
+            info,
+        )
+
+    def _set(self, plane: int, position: tuple[int, ...] | None, value: int) -> None:
+        """
+        Set one cell of an observation plane, ignoring missing positions and the
+        wall cells outside the board
+
+        Args:
+            plane (int): The index of the plane
+            position (tuple[int, int] | None): The cell to set
+            value (int): The value to write
+        """
+        if position is not None and not self.game_state.board.is_wall(position):
+            self._planes[plane, position[1], position[0]] = value
+
+
+def build_planes(game_state: GameState) -> np.ndarray:
+    """
+    Build the occupancy planes of a game state from scratch, the reference that
+    SnakeEnv keeps up to date incrementally
+
+    Args:
+        game_state (GameState): The game state to encode
+
+    Returns:
+        np.ndarray: The planes, shaped (4, size, size)
+    """
+    size = game_state.board.size
+    planes = np.zeros((NUM_PLANES, size, size), dtype=np.float32)
+    for x, y in game_state.snake.positions:
+        if 0 <= x < size and 0 <= y < size:
+            planes[BODY_PLANE, y, x] = 1
+    head = game_state.snake.get_head_position()
+    if not game_state.board.is_wall(head):
+        planes[HEAD_PLANE, head[1], head[0]] = 1
+    for plane, position in [
+        (FOOD_PLANE, game_state.food_system.food_pos),
+        (BONUS_FOOD_PLANE, game_state.food_system.bonus_food_pos),
+    ]:
+        if position is not None:
+            planes[plane, position[1], position[0]] = 1
+    return planes
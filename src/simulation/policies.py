@@ -0,0 +1,42 @@
+from src.core.game_state import GameState
+from src.utils import constants as c
+
+DIRECTIONS = (c.UP, c.RIGHT, c.DOWN, c.LEFT)
+
+
+def greedy_policy(game_state: GameState) -> tuple[int, ...]:
+    """
+    Pick the direction that brings the head closest to the food without moving
+    onto a lethal cell. Keeps the current direction if every move is lethal.
+
+    Args:
+        game_state (GameState): The current game state
+
+    Returns:
+        tuple[int, int]: The chosen direction
+    """
+    snake = game_state.snake
+    board = game_state.board
+    head_x, head_y = snake.get_head_position()
+    target = game_state.food_system.bonus_food_pos or game_state.food_system.food_pos
+    if target is None:
+        target = (head_x, head_y)
+
+    best_direction = snake.direction
+    best_distance = None
+    for direction in DIRECTIONS:
+        if (
+            direction[0] + snake.direction[0] == 0
+            and direction[1] + snake.direction[1] == 0
+        ):
+            continue
+
+        next_pos = (head_x + direction[0], head_y + direction[1])
+        if board.is_lethal(next_pos):
+            continue
+
+        distance = abs(next_pos[0] - target[0]) + abs(next_pos[1] - target[1])
+        if best_distance is None or distance < best_distance:
+            best_direction = direction
+            best_distance = distance
+    return best_direction
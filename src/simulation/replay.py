@@ -0,0 +1,540 @@
+"""
+Record games as compact binary replays and re-simulate them headlessly.
+
+A replay stores the random seed of the game and the player's inputs, so every
+frame can be re-simulated exactly. Its layout is:
+
+    header    b"SNKR", the format version, then as varints the grid size, the
+              keyframe interval and the bonus food timings, then the seed as
+              8 little-endian bytes and the number of frames
+    events    a varint count, then one varint per input holding the frames since
+              the previous input shifted left by 3 bits, above a 3-bit code: a
+              direction index (0-3) or PAUSE_TOGGLE
+    keyframes a varint count, then for every keyframe interval its size and the
+              encoded game state, with the body packed as 2-bit steps
+
+Keyframes let a replayer jump close to any frame instead of re-simulating the
+whole game, and a ten-minute game takes a few KB.
+
+Usage:
+    python -m src.simulation.replay path/to/replay.snkr [frame]
+"""
+
+from bisect import bisect_left
+from datetime import datetime
+import os
+import sys
+import time
+from typing import NamedTuple
+
+from src.core.game_state import GameState, Keyframe
+from src.simulation.policies import DIRECTIONS
+from src.utils import constants as c
+
+MAGIC = b"SNKR"
+VERSION = 1
+KEYFRAME_INTERVAL = 1200  # 20 seconds * 60 FPS
+PAUSE_TOGGLE = 4
+CAUSES = (None, "wall", "self", "board_full")
+
+
+class Replay(NamedTuple):
+    """
+    A recorded game
+
+    Attributes:
+        seed (int): The state of the game's random generator when it started
+        frames (int): The number of frames played
+        events (tuple[tuple[int, int], ...]): The inputs as (frame, code) pairs,
+            applied after that many frames
+        keyframes (tuple[bytes, ...]): The encoded game after every keyframe
+            interval
+        grid_size (int): The size of the board
+        keyframe_interval (int): The frames between two keyframes
+    """
+
+    seed: int
+    frames: int
+    events: tuple[tuple[int, int], ...]
+    keyframes: tuple[bytes, ...]
+    grid_size: int = c.GRID_SIZE
+    keyframe_interval: int = KEYFRAME_INTERVAL
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """
+    Append an unsigned integer in 7-bit groups, low group first
+
+    Args:
+        out (bytearray): The buffer to append to
+        value (int): The non-negative integer
+    """
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """
+    Read an unsigned integer written by _write_varint
+
+    Args:
+        data (bytes): The encoded data
+        offset (int): Where the integer starts
+
+    Returns:
+        tuple[int, int]: The integer and the offset after it
+    """
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _cell(position: tuple[int, ...] | None, grid_size: int) -> int:
+    """
+    Number a cell of the board including its wall ring, with 0 for no cell
+    """
+    if position is None:
+        return 0
+    return (position[1] + 1) * (grid_size + 2) + position[0] + 2
+
+
+def _position(cell: int, grid_size: int) -> tuple[int, int] | None:
+    """
+    Get the cell numbered by _cell
+    """
+    if cell == 0:
+        return None
+    y, x = divmod(cell - 1, grid_size + 2)
+    return x - 1, y - 1
+
+
+def encode_keyframe(keyframe: Keyframe, grid_size: int = c.GRID_SIZE) -> bytes:
+    """
+    Encode a keyframe compactly
+
+    Args:
+        keyframe (Keyframe): The keyframe to encode
+        grid_size (int): The size of the board
+
+    Returns:
+        bytes: The encoded keyframe
+    """
+    out = bytearray(keyframe.rng_state.to_bytes(8, "little"))
+    for value in (
+        keyframe.score,
+        keyframe.frame_count,
+        keyframe.move_delay,
+        keyframe.bonus_food_spawn_timer,
+        keyframe.bonus_food_duration_timer,
+    ):
+        _write_varint(out, value)
+    out.append(
+        DIRECTIONS.index(keyframe.direction)
+        | keyframe.has_direction_changed << 2
+        | keyframe.paused << 3
+        | keyframe.new_food << 4
+        | CAUSES.index(keyframe.game_over_cause) << 5
+    )
+    _write_varint(out, _cell(keyframe.food_pos, grid_size))
+    _write_varint(out, _cell(keyframe.bonus_food_pos, grid_size))
+
+    positions = keyframe.positions
+    _write_varint(out, len(positions))
+    _write_varint(out, _cell(positions[0], grid_size))
+    packed = 0
+    for i in range(1, len(positions)):
+        step = (
+            positions[i][0] - positions[i - 1][0],
+            positions[i][1] - positions[i - 1][1],
+        )
+        packed |= DIRECTIONS.index(step) << 2 * (i - 1)
+    out += packed.to_bytes((len(positions) + 2) // 4, "little")
+    return bytes(out)
+
+
+def decode_keyframe(data: bytes, grid_size: int = c.GRID_SIZE) -> Keyframe:
+    """
+    Decode a keyframe encoded with encode_keyframe
+
+    Args:
+        data (bytes): The encoded keyframe
+        grid_size (int): The size of the board
+
+    Returns:
+        Keyframe: The decoded keyframe
+    """
+    rng_state = int.from_bytes(data[:8], "little")
+    offset = 8
+    values = []
+    for _ in range(5):
+        value, offset = _read_varint(data, offset)
+        values.append(value)
+    score, frame_count, move_delay, spawn_timer, duration_timer = values
+    flags = data[offset]
+    food_cell, offset = _read_varint(data, offset + 1)
+    bonus_food_cell, offset = _read_varint(data, offset)
+
+    length, offset = _read_varint(data, offset)
+    head_cell, offset = _read_varint(data, offset)
+    packed = int.from_bytes(data[offset : offset + (length + 2) // 4], "little")
+    positions = [_position(head_cell, grid_size)]
+    for i in range(length - 1):
+        step_x, step_y = DIRECTIONS[packed >> 2 * i & 3]
+        x, y = positions[-1]
+        positions.append((x + step_x, y + step_y))
+
+    return Keyframe(
+        rng_state=rng_state,
+        score=score,
+        frame_count=frame_count,
+        move_delay=move_delay,
+        paused=bool(flags & 8),
+        game_over_cause=CAUSES[flags >> 5 & 3],
+        direction=DIRECTIONS[flags & 3],
+        has_direction_changed=bool(flags & 4),
+        positions=tuple(positions),
+        food_pos=_position(food_cell, grid_size),
+        new_food=bool(flags & 16),
+        bonus_food_pos=_position(bonus_food_cell, grid_size),
+        bonus_food_spawn_timer=spawn_timer,
+        bonus_food_duration_timer=duration_timer,
+    )
+
+
+def encode_replay(replay: Replay) -> bytes:
+    """
+    Encode a replay in the binary replay format
+
+    Args:
+        replay (Replay): The replay to encode
+
+    Returns:
+        bytes: The encoded replay
+    """
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    for value in (
+        replay.grid_size,
+        replay.keyframe_interval,
+        c.BONUS_FOOD_SPAWN_INTERVAL,
+        c.BONUS_FOOD_DURATION,
+    ):
+        _write_varint(out, value)
+    out += replay.seed.to_bytes(8, "little")
+    _write_varint(out, replay.frames)
+
+    _write_varint(out, len(replay.events))
+    previous = 0
+    for frame, code in replay.events:
+        _write_varint(out, (frame - previous) << 3 | code)
+        previous = frame
+
+    _write_varint(out, len(replay.keyframes))
+    for keyframe in replay.keyframes:
+        _write_varint(out, len(keyframe))
+        out += keyframe
+    return bytes(out)
+
+
+def decode_replay(data: bytes) -> Replay:
+    """
+    Decode a replay encoded with encode_replay
+
+    Args:
+        data (bytes): The encoded replay
+
+    Returns:
+        Replay: The decoded replay
+
+    Raises:
+        ValueError: If the data is not a replay, or was recorded with other bonus
+            food timings than the current ones
+    """
+    if data[:4] != MAGIC or data[4] != VERSION:
+        raise ValueError("Not a replay of this version")
+    offset = 5
+    values = []
+    for _ in range(4):
+        value, offset = _read_varint(data, offset)
+        values.append(value)
+    grid_size, keyframe_interval, spawn_interval, duration = values
+    if (spawn_interval, duration) != (
+        c.BONUS_FOOD_SPAWN_INTERVAL,
+        c.BONUS_FOOD_DURATION,
+    ):
+        raise ValueError("Replay was recorded with other bonus food timings")
+    seed = int.from_bytes(data[offset : offset + 8], "little")
+    frames, offset = _read_varint(data, offset + 8)
+
+    count, offset = _read_varint(data, offset)
+    events = []
+    frame = 0
+    for _ in range(count):
+        value, offset = _read_varint(data, offset)
+        frame += value >> 3
+        events.append((frame, value & 7))
+
+    count, offset = _read_varint(data, offset)
+    keyframes = []
+    for _ in range(count):
+        size, offset = _read_varint(data, offset)
+        keyframes.append(data[offset : offset + size])
+        offset += size
+    return Replay(
+        seed, frames, tuple(events), tuple(keyframes), grid_size, keyframe_interval
+    )
+
+
+def load_replay(path: str) -> Replay:
+    """
+    Load a replay file
+
+    Args:
+        path (str): The path of the file
+
+    Returns:
+        Replay: The loaded replay
+    """
+    with open(path, "rb") as file:
+        return decode_replay(file.read())
+
+
+class ReplayRecorder:
+    """
+    Records the game played in the window
+    The event handler reports the start of every game and the player's inputs, and
+    the game loop reports every frame; a replay file is written when a game ends.
+
+    Args:
+        base_path (str): The directory to save replays in
+        keyframe_interval (int): The frames between two keyframes
+    """
+
+    def __init__(self, base_path="assets/replays", keyframe_interval=KEYFRAME_INTERVAL):
+        self.base_path = base_path
+        self._keyframe_interval: int = keyframe_interval
+        self._game_state: GameState | None = None
+        self._seed: int = 0
+        self._frames: int = 0
+        self._paused: bool = False
+        self._events: list[tuple[int, int]] = []
+        self._keyframes: list[bytes] = []
+
+    @property
+    def recording(self) -> bool:
+        return self._game_state is not None
+
+    def start(self, game_state: GameState) -> None:
+        """
+        Start recording a game that has just been reset, dropping any unfinished
+        recording
+
+        Args:
+            game_state (GameState): The game to record
+        """
+        self._game_state = game_state
+        self._seed = game_state.rng.getstate()
+        self._frames = 0
+        self._paused = game_state.paused
+        self._events = []
+        self._keyframes = []
+
+    def record_direction(self, direction: tuple[int, ...]) -> None:
+        """
+        Record a direction change accepted by the snake
+
+        Args:
+            direction (tuple[int, int]): The new direction
+        """
+        if self.recording:
+            self._events.append((self._frames, DIRECTIONS.index(direction)))
+
+    def record_paused(self, paused: bool) -> None:
+        """
+        Record whether the game is paused after handling an input
+
+        Args:
+            paused (bool): Whether the game is paused
+        """
+        if self.recording and paused != self._paused:
+            self._paused = paused
+            self._events.append((self._frames, PAUSE_TOGGLE))
+
+    def tick(self) -> Replay | None:
+        """
+        Record one frame, after the game state has been updated and the food
+        spawned
+        Stores a keyframe every keyframe interval and saves the replay once the game
+        is over
+
+        Returns:
+            Replay | None: The replay if the game has just ended, None otherwise
+        """
+        if not self.recording:
+            return None
+
+        self._frames += 1
+        if self._game_state.game_over:
+            replay = self.finish()
+            self.save(replay)
+            return replay
+        if self._frames % self._keyframe_interval == 0:
+            self._keyframes.append(
+                encode_keyframe(
+                    self._game_state.keyframe(), self._game_state.board.size
+                )
+            )
+        return None
+
+    def cancel(self) -> None:
+        """
+        Stop recording without saving, e.g. after the game has been rewound
+        """
+        self._game_state = None
+
+    def finish(self) -> Replay:
+        """
+        Stop recording
+
+        Returns:
+            Replay: The recorded game
+        """
+        replay = Replay(
+            self._seed,
+            self._frames,
+            tuple(self._events),
+            tuple(self._keyframes),
+            self._game_state.board.size,
+            self._keyframe_interval,
+        )
+        self._game_state = None
+        return replay
+
+    def save(self, replay: Replay) -> str:
+        """
+        Write a replay file named after the current time
+
+        Args:
+            replay (Replay): The replay to save
+
+        Returns:
+            str: The path of the file
+        """
+        os.makedirs(self.base_path, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = os.path.join(self.base_path, f"replay_{timestamp}.snkr")
+        with open(filepath, "wb") as file:
+            file.write(encode_replay(replay))
+        print(f"Replay saved: {filepath}")
+        return filepath
+
+
+class Replayer:
+    """
+    Re-simulates a replay headlessly, frame by frame
+    Seeking restores the nearest keyframe before the target and re-simulates only
+    the frames after it, so any frame is reached in at most one keyframe interval.
+
+    Args:
+        replay (Replay): The replay to play
+    """
+
+    def __init__(self, replay: Replay):
+        self._replay: Replay = replay
+        self._event_frames: list[int] = [frame for frame, _ in replay.events]
+        self._restore(0)
+
+    @property
+    def game_state(self) -> GameState:
+        return self._game_state
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+    def seek(self, frame: int) -> GameState:
+        """
+        Re-simulate the game up to a frame
+
+        Args:
+            frame (int): The number of frames played, between 0 and replay.frames
+
+        Returns:
+            GameState: The game after that many frames
+
+        Raises:
+            ValueError: If the frame is outside the replay
+        """
+        if not 0 <= frame <= self._replay.frames:
+            raise ValueError(f"Frame {frame} is outside the replay")
+
+        interval = self._replay.keyframe_interval
+        keyframe = min(frame // interval, len(self._replay.keyframes))
+        if frame < self._frame or keyframe * interval > self._frame:
+            self._restore(keyframe)
+        while self._frame < frame:
+            self._advance()
+        return self._game_state
+
+    def _restore(self, keyframe: int) -> None:
+        """
+        Jump to the start of the game or to a keyframe
+
+        Args:
+            keyframe (int): The number of keyframe intervals to jump past
+        """
+        grid_size = self._replay.grid_size
+        if keyframe == 0:
+            self._game_state = GameState(seed=self._replay.seed, board_size=grid_size)
+            self._game_state.start_game()
+        else:
+            self._game_state = GameState.from_keyframe(
+                decode_keyframe(self._replay.keyframes[keyframe - 1], grid_size),
+                board_size=grid_size,
+            )
+        self._frame = keyframe * self._replay.keyframe_interval
+        self._next_event = bisect_left(self._event_frames, self._frame)
+
+    def _advance(self) -> None:
+        """
+        Apply the inputs made after the current frame and play the next frame
+        """
+        game_state = self._game_state
+        events = self._replay.events
+        while self._next_event < len(events) and events[self._next_event][0] == (
+            self._frame
+        ):
+            code = events[self._next_event][1]
+            if code == PAUSE_TOGGLE:
+                if game_state.paused:
+                    game_state.continue_game()
+                else:
+                    game_state.pause_game()
+            else:
+                game_state.snake.change_direction(DIRECTIONS[code])
+            self._next_event += 1
+
+        game_state.update()
+        game_state.food_system.spawn_food()
+        self._frame += 1
+
+
+def main() -> None:
+    replay = load_replay(sys.argv[1])
+    frame = int(sys.argv[2]) if len(sys.argv) > 2 else replay.frames
+    start = time.perf_counter()
+    game_state = Replayer(replay).seek(frame)
+    elapsed = time.perf_counter() - start
+    print(f"frame {frame} of {replay.frames}: score {game_state.score}")
+    print(f"re-simulated in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Run many headless games across processes and aggregate their results.
+
+Games are grouped into chunks, the unit of work sent to a worker process. Every game
+gets an independent seed derived from the run seed and the game's index, so a run
+gives the same report whatever the number of workers, the chunk size or the order
+chunks finish in.
+
+Usage:
+    python -m src.simulation.runner --games 10000 --workers 8 --seed 1
+"""
+
+from argparse import ArgumentParser
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+from src.core.game_state import GameState
+from src.simulation.policies import greedy_policy
+from src.utils.rng import derive_seed
+
+Policy = Callable[[GameState], tuple[int, ...]]
+
+
+class GameRecord(NamedTuple):
+    """
+    Result of one simulated game
+
+    Attributes:
+        seed (int): The seed the game was played with
+        score (int): The final score
+        length (int): The final length of the snake
+        moves (int): The number of moves survived
+        cause (str): Why the game ended: "wall", "self", "board_full" or
+            "max_moves" if it was cut off
+    """
+
+    seed: int
+    score: int
+    length: int
+    moves: int
+    cause: str
+
+
+class Report:
+    """
+    Aggregated results of a simulation run, updated one game at a time so that
+    results can be streamed in from workers in any order
+    """
+
+    def __init__(self):
+        self.games: int = 0
+        self.scores: Counter = Counter()
+        self.lengths: Counter = Counter()
+        self.moves: Counter = Counter()
+        self.causes: Counter = Counter()
+
+    def add(self, record: GameRecord) -> None:
+        """
+        Add the result of one game to the report
+
+        Args:
+            record (GameRecord): The result to add
+        """
+        self.games += 1
+        self.scores[record.score] += 1
+        self.lengths[record.length] += 1
+        self.moves[record.moves] += 1
+        self.causes[record.cause] += 1
+
+    def summary(self) -> str:
+        """
+        Format the report as a table of statistics
+
+        Returns:
+            str: The formatted report
+        """
+        lines = [f"games: {self.games}"]
+        for name, histogram in [
+            ("score", self.scores),
+            ("length", self.lengths),
+            ("moves", self.moves),
+        ]:
+            lines.append(
+                f"{name:<7} mean {_mean(histogram):8.2f}"
+                f"  p10 {_percentile(histogram, 0.1):6}"
+                f"  p50 {_percentile(histogram, 0.5):6}"
+                f"  p90 {_percentile(histogram, 0.9):6}"
+                f"  max {max(histogram, default=0):6}"
+            )
+        for cause, count in self.causes.most_common():
+            lines.append(f"death by {cause:<11} {count / self.games:7.1%}")
+        return "\n".join(lines)
+
+
+def play_game(seed: int, max_moves: int, policy: Policy = greedy_policy) -> GameRecord:
+    """
+    Play one headless game to the end
+
+    Args:
+        seed (int): The seed for the game
+        max_moves (int): The number of moves after which the game is cut off
+        policy (Policy): The function choosing the direction for every move
+
+    Returns:
+        GameRecord: The result of the game
+    """
+    game_state = GameState(seed=seed)
+    moves = 0
+    while moves < max_moves:
+        moves += 1
+        if game_state.step(policy(game_state)).game_over:
+            break
+
+    return GameRecord(
+        seed,
+        game_state.score,
+        len(game_state.snake.positions),
+        moves,
+        game_state.game_over_cause or "max_moves",
+    )
+
+
+def run_chunk(
+    seed: int, first_game: int, games: int, max_moves: int, policy: Policy
+) -> list[GameRecord]:
+    """
+    Play a chunk of games in a worker process
+
+    Args:
+        seed (int): The seed of the whole run
+        first_game (int): The index of the chunk's first game within the run
+        games (int): The number of games in the chunk
+        max_moves (int): The number of moves after which a game is cut off
+        policy (Policy): The function choosing the direction for every move
+
+    Returns:
+        list[GameRecord]: The results of the games
+    """
+    return [
+        play_game(derive_seed(seed, game_index), max_moves, policy)
+        for game_index in range(first_game, first_game + games)
+    ]
+
+
+def run(
+    games: int,
+    workers: int | None = None,
+    chunk_size: int = 50,
+    seed: int = 0,
+    max_moves: int = 10_000,
+    policy: Policy = greedy_policy,
+) -> Report:
+    """
+    Play games across a pool of worker processes
+
+    Args:
+        games (int): The number of games to play
+        workers (int | None): The number of worker processes, one per CPU by default
+        chunk_size (int): The number of games sent to a worker at a time
+        seed (int): The seed of the whole run
+        max_moves (int): The number of moves after which a game is cut off
+        policy (Policy): A module-level function choosing the direction for every
+            move
+
+    Returns:
+        Report: The aggregated results
+    """
+    report = Report()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                run_chunk,
+                seed,
+                start,
+                min(chunk_size, games - start),
+                max_moves,
+                policy,
+            )
+            for start in range(0, games, chunk_size)
+        ]
+        for future in as_completed(futures):
+            for record in future.result():
+                report.add(record)
+    return report
+
+
+def _mean(histogram: Counter) -> float:
+    total = sum(histogram.values())
+    return sum(value * count for value, count in histogram.items()) / max(total, 1)
+
+
+def _percentile(histogram: Counter, fraction: float) -> int:
+    rank = fraction * sum(histogram.values())
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen >= rank:
+            return value
+    return 0
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Run headless Snake games in parallel.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-moves", type=int, default=10_000)
+    args = parser.parse_args()
+
+    report = run(
+        args.games,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+        max_moves=args.max_moves,
+    )
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
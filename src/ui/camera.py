@@ -0,0 +1,91 @@
+from src.utils import constants as c
+
+
+class Camera:
+    """
+    The part of a board larger than the screen that is shown, following the head
+
+    The camera keeps the head in the middle of the view, and stops at the edges of
+    the board so it never shows the area outside it.
+
+    Attributes:
+        left (int): The first column shown
+        top (int): The first row shown
+        width (int): The number of columns shown
+        height (int): The number of rows shown
+    """
+
+    def __init__(self, width: int = c.GRID_SIZE, height: int = c.GRID_SIZE) -> None:
+        self.left: int = 0
+        self.top: int = 0
+        self.width: int = width
+        self.height: int = height
+
+    @property
+    def cells(self) -> tuple[int, int, int, int]:
+        """
+        The cells shown, as (left, top, width, height)
+        """
+        return self.left, self.top, self.width, self.height
+
+    @property
+    def view(self) -> tuple[int, int, int, int]:
+        """
+        The area of the board shown in pixels, as (x, y, width, height)
+        """
+        return (
+            self.left * c.CELL_SIZE,
+            self.top * c.CELL_SIZE,
+            self.width * c.CELL_SIZE,
+            self.height * c.CELL_SIZE,
+        )
+
+    def fits(self, board_size: int) -> bool:
+        """
+        Check whether a whole board is shown without scrolling
+
+        Args:
+            board_size (int): The width and height of the board in cells
+
+        Returns:
+            bool: True if the board is not larger than the view
+        """
+        return board_size <= self.width and board_size <= self.height
+
+    def follow(self, head: tuple[int, ...], board_size: int) -> None:
+        """
+        Move the view to centre the head, as far as the edges of the board allow
+
+        Args:
+            head (tuple[int, int]): The cell of the head
+            board_size (int): The width and height of the board in cells
+        """
+        self.left = max(0, min(head[0] - self.width // 2, board_size - self.width))
+        self.top = max(0, min(head[1] - self.height // 2, board_size - self.height))
+
+    def is_visible(self, cell: tuple[int, ...]) -> bool:
+        """
+        Check whether a cell is shown
+
+        Args:
+            cell (tuple[int, int]): The cell
+
+        Returns:
+            bool: True if the cell is within the view
+        """
+        return (
+            self.left <= cell[0] < self.left + self.width
+            and self.top <= cell[1] < self.top + self.height
+        )
+
+    def to_screen(self, cell: tuple[int, ...]) -> tuple[int, int]:
+        """
+        Get the pixel position of a cell on the screen
+
+        Args:
+            cell (tuple[int, int]): The cell
+
+        Returns:
+            tuple[int, int]: The top left corner of the cell on the screen
+        """
+        return (cell[0] - self.left) * c.CELL_SIZE, (cell[1] - self.top) * c.CELL_SIZE
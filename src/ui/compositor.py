@@ -0,0 +1,197 @@
+from typing import Callable
+
+from src.utils import constants as c
+
+import pygame
+
+_UNSET = object()
+
+
+def _draw_nothing(target: pygame.Surface) -> None:
+    """
+    Draw function of an empty layer
+
+    Args:
+        target (pygame.Surface): The surface the layer would draw on
+    """
+
+
+class Layer:
+    """
+    One layer of the screen, drawn over the layers below it
+
+    A layer draws cached content and is only re-rendered when the key of its inputs
+    changes. It remembers the areas it covers and collects the areas that changed
+    since the last composition, so the compositor redraws only those.
+
+    Attributes:
+        rects (list[pygame.Rect]): The areas the layer currently draws on
+        dirty (list[pygame.Rect]): The areas changed since the last composition
+        opaque (bool): Whether the layer hides everything below its areas
+    """
+
+    def __init__(self) -> None:
+        self.rects: list[pygame.Rect] = []
+        self.dirty: list[pygame.Rect] = []
+        self.opaque: bool = False
+        self._draw: Callable[[pygame.Surface], None] = _draw_nothing
+        self._key: object = _UNSET
+
+    def set_content(
+        self,
+        key: object,
+        make_content: Callable[
+            [], tuple[list[pygame.Rect], Callable[[pygame.Surface], None]]
+        ],
+        opaque: bool = False,
+    ) -> bool:
+        """
+        Replace the content of the layer, unless its inputs are unchanged
+
+        Args:
+            key (object): Identifies the inputs of the content
+            make_content (Callable): Renders the content and returns the areas it
+                covers and the function that draws it
+            opaque (bool): Whether the content hides everything below its areas
+
+        Returns:
+            bool: True if the content was re-rendered
+        """
+        if key == self._key:
+            return False
+        self._key = key
+        self.dirty.extend(self.rects)
+        self.rects, self._draw = make_content()
+        self.dirty.extend(self.rects)
+        self.opaque = opaque
+        return True
+
+    def set_sprites(
+        self,
+        key: object,
+        make_sprites: Callable[[], list[tuple[pygame.Surface, pygame.Rect]]],
+        opaque: bool = False,
+    ) -> bool:
+        """
+        Replace the content of the layer with surfaces blitted in one call, unless
+        its inputs are unchanged
+
+        Args:
+            key (object): Identifies the inputs of the content
+            make_sprites (Callable): Returns the surfaces and where to blit them
+            opaque (bool): Whether the content hides everything below its areas
+
+        Returns:
+            bool: True if the content was re-rendered
+        """
+
+        def make_content():
+            sprites = make_sprites()
+            return [
+                pygame.Rect(position[0], position[1], *surface.get_size())
+                for surface, position in sprites
+            ], lambda target: target.blits(sprites, False)
+
+        return self.set_content(key, make_content, opaque)
+
+    def clear(self) -> None:
+        """
+        Remove the content of the layer
+        """
+        self.set_content(None, lambda: ([], _draw_nothing))
+
+    def invalidate(self, rects: list[pygame.Rect]) -> None:
+        """
+        Mark areas as changed after the cached content was modified in place
+
+        Args:
+            rects (list[pygame.Rect]): The areas that changed
+        """
+        self.dirty.extend(rects)
+
+    def draw(self, target: pygame.Surface) -> None:
+        """
+        Draw the content of the layer
+
+        Args:
+            target (pygame.Surface): The surface to draw on
+        """
+        self._draw(target)
+
+
+class Compositor:
+    """
+    Composites a stack of layers onto the screen
+
+    Only the areas where a layer changed are redrawn, clipped to those areas and
+    starting from the topmost opaque layer that covers them, and pushed to the
+    display with pygame.display.update(rects). When too many areas changed, or too
+    much of the screen, the whole screen is redrawn and flipped instead.
+
+    Attributes:
+        screen (pygame.Surface): The screen to composite on
+        layers (list[Layer]): The layers, from the bottom up
+    """
+
+    def __init__(self, screen: pygame.Surface, layers: list[Layer]) -> None:
+        self.screen = screen
+        self.layers = layers
+        self._composed: bool = False
+
+    def compose(self) -> None:
+        """
+        Redraw the areas that changed since the last composition and show them
+        """
+        screen_rect = self.screen.get_rect()
+        dirty = []
+        for layer in self.layers:
+            dirty.extend(rect.clip(screen_rect) for rect in layer.dirty)
+            layer.dirty.clear()
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+
+        if not self._composed or self._is_too_dirty(dirty, screen_rect):
+            self._composed = True
+            self._draw(screen_rect)
+            pygame.display.flip()
+            return
+        if not dirty:
+            return
+
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self._draw(rect)
+        self.screen.set_clip(None)
+        pygame.display.update(dirty)
+
+    def _draw(self, area: pygame.Rect) -> None:
+        """
+        Draw the layers that show in an area, assuming the screen is clipped to it
+
+        Args:
+            area (pygame.Rect): The area to draw
+        """
+        first = 0
+        for index in range(len(self.layers) - 1, -1, -1):
+            layer = self.layers[index]
+            if layer.opaque and any(rect.contains(area) for rect in layer.rects):
+                first = index
+                break
+        for layer in self.layers[first:]:
+            if area.collidelist(layer.rects) != -1:
+                layer.draw(self.screen)
+
+    @staticmethod
+    def _is_too_dirty(dirty: list[pygame.Rect], screen_rect: pygame.Rect) -> bool:
+        """
+        Check whether redrawing the whole screen is cheaper than the changed areas
+
+        Args:
+            dirty (list[pygame.Rect]): The changed areas
+            screen_rect (pygame.Rect): The area of the screen
+
+        Returns:
+            bool: True if the whole screen should be redrawn
+        """
+        return len(dirty) > c.MAX_DIRTY_RECTS or sum(
+            rect.width * rect.height for rect in dirty
+        ) > c.MAX_DIRTY_AREA * (screen_rect.width * screen_rect.height)
@@ -0,0 +1,50 @@
+from functools import cache, lru_cache
+
+from src.utils import constants as c
+
+import pygame
+
+
+@cache
+def get_font(name: str | None, size: int) -> pygame.font.Font:
+    """
+    Get the font for a name and size, looked up and loaded only once.
+
+    Args:
+        name (str | None): The system font name, or None for the default font
+        size (int): The font size
+
+    Returns:
+        pygame.font.Font: The shared font
+    """
+    return pygame.font.SysFont(name, size)
+
+
+@lru_cache(maxsize=c.TEXT_CACHE_SIZE)
+def render_text(
+    name: str | None, size: int, text: str, color: tuple, antialias: bool = True
+) -> pygame.Surface:
+    """
+    Render text, reusing the surface of the last identical render.
+    Static labels are rendered once, and changing text such as the score only when
+    it changes. The surface is shared, so it must only be blitted, never drawn on.
+
+    Args:
+        name (str | None): The system font name, or None for the default font
+        size (int): The font size
+        text (str): The text to render
+        color (tuple): The color of the text
+        antialias (bool): Whether to smooth the edges of the text
+
+    Returns:
+        pygame.Surface: The rendered text
+    """
+    return get_font(name, size).render(text, antialias, color)
+
+
+def clear_font_caches() -> None:
+    """
+    Forget all loaded fonts and rendered text, e.g. after pygame.quit().
+    """
+    render_text.cache_clear()
+    get_font.cache_clear()
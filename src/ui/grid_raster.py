@@ -0,0 +1,73 @@
+from src.core.board import Board
+from src.utils import constants as c
+
+import numpy as np
+import pygame
+
+
+def _build_palette() -> np.ndarray:
+    """
+    Map every possible cell value of the board to the color it is drawn with
+
+    Returns:
+        np.ndarray: The RGB color of each cell value, shape (256, 3)
+    """
+    values = np.arange(256)
+    return np.select(
+        [
+            (values & Board.BONUS_FOOD)[:, None] != 0,
+            (values & Board.FOOD)[:, None] != 0,
+            (values >= Board.SNAKE)[:, None],
+        ],
+        [
+            np.array(c.MINT_GREEN),
+            np.array(c.PASTEL_PINK),
+            np.array(c.PASTEL_GREEN),
+        ],
+        np.array(c.BACKGROUND),
+    ).astype(np.uint8)
+
+
+_PALETTE = _build_palette()
+
+
+class GridRaster:
+    """
+    Rasterises the board from its occupancy grid instead of drawing cell by cell
+
+    The colors of all cells are looked up at once from the cell values of the
+    board, written into a surface with one pixel per cell through pygame.surfarray,
+    and scaled up to cell size in a single pygame.transform.scale. The cost depends
+    only on the size of the board, not on how long the snake is. The head, eyes,
+    particles and HUD are drawn over the result.
+
+    Args:
+        size (int): The width and height of the board in cells
+        cell_size (int): The width and height of a cell in pixels
+    """
+
+    def __init__(self, size: int = c.GRID_SIZE, cell_size: int = c.CELL_SIZE):
+        self.size: int = size
+        self._pixels: np.ndarray = np.empty((size, size, 3), dtype=np.uint8)
+        self._grid: pygame.Surface = pygame.Surface((size, size))
+        self.surface: pygame.Surface = pygame.Surface(
+            (size * cell_size, size * cell_size)
+        )
+
+    def render(self, board: Board) -> pygame.Surface:
+        """
+        Rasterise the cells of a board
+
+        Args:
+            board (Board): The board, of the size of the raster
+
+        Returns:
+            pygame.Surface: The board at cell size, reused by the next render
+        """
+        stride = board.size + 2
+        cells = np.frombuffer(board.cells, dtype=np.uint8).reshape(stride, stride)
+        # surfarray indexes pixels by (x, y), the board is stored row by row
+        np.take(_PALETTE, cells[1:-1, 1:-1].T, axis=0, out=self._pixels)
+        pygame.surfarray.blit_array(self._grid, self._pixels)
+        pygame.transform.scale(self._grid, self.surface.get_size(), self.surface)
+        return self.surface
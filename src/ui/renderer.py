@@ -1,21 +1,81 @@
+from functools import partial
+from typing import NamedTuple
+
+from src.core.board import Board
 from src.core.game_state import GameState
 from src.core.snake import Snake
-from src.ui.ui_components import create_rectangle, draw_instructions, draw_start_screen
+from src.core.zobrist import followed_snake_hash, zobrist_keys
+from src.ui.camera import Camera
+from src.ui.compositor import Compositor, Layer
+from src.ui.fonts import render_text
+from src.ui.grid_raster import GridRaster
+from src.ui.snake_runs import SnakeRuns
+from src.ui.sprite_atlas import SpriteAtlas
+from src.ui.ui_components import (
+    create_rectangle,
+    draw_instructions,
+    draw_start_screen,
+    get_start_button_rect,
+)
 from src.utils import constants as c
 
 import pygame
 
 
+class _SnakeFrame(NamedTuple):
+    """
+    The snake as last painted on the entities layer, to find what one move changed
+    """
+
+    snake: Snake
+    board: Board
+    zobrist_hash: int
+    head: tuple[int, ...]
+    tail: tuple[int, ...]
+    direction: tuple[int, ...]
+
+
 class Renderer:
     """
     Class to render the game state on the screen
 
+    By default every frame is drawn from scratch and flipped. With dirty_rects the
+    frame is composited from cached layers (background, board, entities, HUD,
+    effects and modal screens), each re-rendered only when its inputs change, and
+    only the changed regions of the screen are redrawn and pushed to the display.
+    With grid_raster as well, the board layer is rasterised from the occupancy
+    grid of the board in one scaled blit, and only the head is drawn over it.
+    A board larger than the screen is shown through a camera that follows the
+    head, drawing only what is in view.
+
     Attributes:
         screen (pygame.Surface): The screen to render on
+        camera (Camera): The part of the board shown when it is larger than the
+            screen
+        dirty_rects (bool): Whether to composite cached layers and update only the
+            changed regions
+        grid_raster (bool): Whether to rasterise the composited board from its
+            occupancy grid instead of drawing the snake and food cell by cell
     """
 
-    def __init__(self, screen: pygame.Surface) -> None:
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        dirty_rects: bool = False,
+        grid_raster: bool = False,
+    ) -> None:
         self.screen = screen
+        self.dirty_rects = dirty_rects
+        self.grid_raster = grid_raster
+        self._raster: GridRaster | None = None
+        self._atlas: SpriteAtlas = SpriteAtlas()
+        self.camera: Camera = Camera()
+        self._overlay: pygame.Surface | None = None
+        self._compositor: Compositor | None = None
+        self._snake_frame: _SnakeFrame | None = None
+        self._snake_runs: SnakeRuns = SnakeRuns()
+        self._food: tuple = (None, None)
+        self._frame: int = 0
 
     def render(self, game_state: GameState) -> None:
         """
@@ -24,125 +84,498 @@ class Renderer:
         Args:
             game_state (GameState): The current game state
         """
+        if not game_state.start_screen and not self.camera.fits(game_state.board.size):
+            self._render_viewport(game_state)
+            return
+        if self.dirty_rects:
+            self._render_composited(game_state)
+            return
+
         self.screen.fill(c.BACKGROUND)
 
         if game_state.start_screen:
             draw_start_screen(self.screen)
         else:
             self._draw_snake(game_state.snake)
-            self._draw_food(game_state.food_system.food_pos)
+            if not game_state.food_system.board_full:
+                self._draw_food(game_state.food_system.food_pos)
+            if game_state.food_system.bonus_food_active:
+                self._draw_food(game_state.food_system.bonus_food_pos, bonus_food=True)
             self._draw_score(game_state.score)
             game_state.particle_system.update()
             game_state.particle_system.draw()
 
-            if game_state.food_system.bonus_food_active:
-                self._draw_food(game_state.food_system.bonus_food_pos, bonus_food=True)
-
             if game_state.game_over:
                 self._draw_game_over()
 
         pygame.display.flip()
 
-    def _draw_snake(self, snake: Snake) -> None:
+    def _render_viewport(self, game_state: GameState) -> None:
         """
-        Render the snake on the screen
+        Render a board larger than the screen through the camera, which follows
+        the head
+
+        Only the snake cells, food and particles within the view are drawn. The
+        body cells are found by querying the board for the cells in view rather
+        than walking the snake, so the cost depends on the size of the screen, not
+        on that of the board or the snake. Every move scrolls the whole view, so
+        the frame is drawn from scratch and the composited layers are dropped.
 
         Args:
-            snake (Snake): The snake to render
+            game_state (GameState): The current game state
         """
-        snake_head, *snake_body = snake.get_snake_body_positions()
-        for segment in snake_body:
-            create_rectangle(
-                self.screen,
-                c.PASTEL_GREEN,
-                segment[0],
-                segment[1],
-                c.CELL_SIZE,
-                c.CELL_SIZE,
-            )
+        self._compositor = None
+        camera = self.camera
+        snake = game_state.snake
+        head = snake.get_head_position()
+        camera.follow(head, game_state.board.size)
+        self.screen.fill(c.BACKGROUND)
+
+        blits = [
+            self._atlas.body(camera.to_screen(cell))
+            for cell in game_state.board.snake_cells_in(*camera.cells)
+        ]
+        blits.append(self._atlas.head(camera.to_screen(head), snake.direction))
+        food_system = game_state.food_system
+        for position, bonus_food in [
+            (None if food_system.board_full else food_system.food_pos, False),
+            (
+                food_system.bonus_food_pos if food_system.bonus_food_active else None,
+                True,
+            ),
+        ]:
+            if position is not None and camera.is_visible(position):
+                blits.append(
+                    self._atlas.food(
+                        (position[0] - camera.left, position[1] - camera.top),
+                        bonus_food,
+                    )
+                )
+        self.screen.blits(blits, False)
 
-        create_rectangle(
+        self._draw_score(game_state.score)
+        game_state.particle_system.update()
+        game_state.particle_system.draw(camera.view)
+        if game_state.game_over:
+            self._draw_game_over()
+        pygame.display.flip()
+
+    def _create_layers(self) -> None:
+        """
+        Create the layers of the screen and the compositor that shows them
+        """
+        screen_rect = self.screen.get_rect()
+        self._snake_frame = None
+        self._background_layer = Layer()
+        self._background_layer.set_content(
+            c.BACKGROUND,
+            lambda: ([screen_rect], lambda target: target.fill(c.BACKGROUND)),
+            opaque=True,
+        )
+        self._board_layer = Layer()
+        self._entities = pygame.Surface(screen_rect.size, pygame.SRCALPHA)
+        self._entities_layer = Layer()
+        if not self.grid_raster:
+            self._entities_layer.set_sprites(
+                self._entities, lambda: [(self._entities, (0, 0))]
+            )
+        self._hud_layer = Layer()
+        self._effects_layer = Layer()
+        self._modal_layer = Layer()
+        self._start_screen = pygame.Surface(screen_rect.size)
+        self._compositor = Compositor(
             self.screen,
-            c.DARKER_PASTEL_GREEN,
-            snake_head[0],
-            snake_head[1],
-            c.CELL_SIZE,
-            c.CELL_SIZE,
+            [
+                self._background_layer,
+                self._board_layer,
+                self._entities_layer,
+                self._hud_layer,
+                self._effects_layer,
+                self._modal_layer,
+            ],
         )
 
-        snake_right_eye, snake_left_eye = self._get_eyes_positions(
-            snake_head, snake.direction
+    def _render_composited(self, game_state: GameState) -> None:
+        """
+        Update the layers whose inputs changed and composite the changed regions
+
+        Args:
+            game_state (GameState): The current game state
+        """
+        if self._compositor is None:
+            self._create_layers()
+        self._frame += 1
+
+        if game_state.start_screen:
+            hovered = get_start_button_rect().collidepoint(pygame.mouse.get_pos())
+            self._modal_layer.set_sprites(
+                ("start_screen", hovered), self._start_screen_sprites, opaque=True
+            )
+            self._hud_layer.clear()
+            self._effects_layer.clear()
+            self._compositor.compose()
+            return
+
+        if self.grid_raster:
+            self._update_raster(game_state)
+        else:
+            self._update_entities(game_state)
+        score = game_state.score
+        self._hud_layer.set_sprites(
+            score,
+            lambda: [(self._render_score(score), self._get_score_rect(score))],
         )
-        pygame.draw.rect(
-            self.screen,
-            c.TEXT_COLOR,
-            (snake_right_eye[0], snake_right_eye[1], c.EYE_SIZE, c.EYE_SIZE),
+
+        particle_system = game_state.particle_system
+        particle_system.update()
+        bounds = particle_system.get_bounds()
+        if bounds is None:
+            self._effects_layer.clear()
+        else:
+            self._effects_layer.set_content(
+                self._frame,
+                lambda: ([pygame.Rect(bounds)], lambda target: particle_system.draw()),
+            )
+
+        if game_state.game_over:
+            self._modal_layer.set_content(
+                "game_over",
+                lambda: (
+                    [self.screen.get_rect()],
+                    lambda target: self._draw_game_over(),
+                ),
+            )
+        else:
+            self._modal_layer.clear()
+        self._compositor.compose()
+
+    def _start_screen_sprites(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """
+        Render the start screen onto its cached surface
+
+        Returns:
+            list[tuple[pygame.Surface, tuple[int, int]]]: The start screen and where
+                to blit it
+        """
+        draw_start_screen(self._start_screen)
+        return [(self._start_screen, (0, 0))]
+
+    def _update_raster(self, game_state: GameState) -> None:
+        """
+        Rasterise the board layer when the snake or food changed, and draw the head
+        with its eyes over it
+
+        Args:
+            game_state (GameState): The current game state
+        """
+        board = game_state.board
+        snake = game_state.snake
+        if self._raster is None or self._raster.size != board.size:
+            self._raster = GridRaster(board.size)
+        # a turn changes the hash but not the cells
+        cells_hash = (
+            game_state.zobrist_hash
+            ^ zobrist_keys(board.size).directions[snake.direction]
         )
-        pygame.draw.rect(
-            self.screen,
-            c.TEXT_COLOR,
-            (snake_left_eye[0], snake_left_eye[1], c.EYE_SIZE, c.EYE_SIZE),
+        self._board_layer.set_sprites(
+            (board, cells_hash),
+            lambda: [(self._raster.render(board), (0, 0))],
+            opaque=True,
+        )
+
+        head = snake.get_head_position()
+        direction = snake.direction
+        food_system = game_state.food_system
+        food = [
+            (food_system.food_pos, False),
+            (
+                food_system.bonus_food_pos if food_system.bonus_food_active else None,
+                True,
+            ),
+        ]
+        if food_system.board_full:
+            food[0] = (None, False)
+        self._entities_layer.set_content(
+            (head, direction, tuple(food)),
+            lambda: (
+                [self._head_rect(head, direction)],
+                partial(self._draw_raster_head, head, direction, food),
+            ),
         )
 
-    def _get_eyes_positions(
-        self, head_pos: tuple[int, ...], direction: tuple[int, ...]
-    ) -> tuple[tuple[int, ...], ...]:
+    def _draw_raster_head(
+        self,
+        head: tuple[int, ...],
+        direction: tuple[int, ...],
+        food: list[tuple[tuple[int, ...] | None, bool]],
+        target: pygame.Surface,
+    ) -> None:
         """
-        Calculate eyes positions based on head position and direction
+        Draw the head with its eyes over the rasterised board, and the food over
+        the eyes where they reach into a food cell
 
         Args:
-            head_pos (tuple): The position of the head
+            head (tuple): The cell of the head
             direction (tuple): The direction of the snake
+            food (list): The food and bonus food cells, or None, and whether each is
+                the bonus
+            target (pygame.Surface): The surface to draw on
+        """
+        self._draw_head(
+            (head[0] * c.CELL_SIZE, head[1] * c.CELL_SIZE), direction, target
+        )
+        head_rect = self._head_rect(head, direction)
+        for position, bonus_food in food:
+            if position is not None and head_rect.colliderect(
+                self._cell_rect(position)
+            ):
+                self._draw_food(position, bonus_food, target)
+
+    def _update_entities(self, game_state: GameState) -> None:
+        """
+        Update the entities layer for the frame
+
+        The snake stays painted on the persistent layer between frames. A move only
+        repaints the old head as body, paints the new head and clears the vacated
+        tail, and a turn only repaints the head, so the cost does not depend on the
+        length of the snake. The layer is rebuilt when the game is reset, the
+        screen resized, or the snake changed in any other way, e.g. by a rewind.
+
+        Args:
+            game_state (GameState): The current game state
+        """
+        snake = game_state.snake
+        food_system = game_state.food_system
+        food = (
+            None if food_system.board_full else food_system.food_pos,
+            food_system.bonus_food_pos if food_system.bonus_food_active else None,
+        )
+        frame = _SnakeFrame(
+            snake,
+            game_state.board,
+            snake.zobrist_hash,
+            snake.get_head_position(),
+            snake.get_tail_position(),
+            snake.direction,
+        )
+        if self._entities.get_size() != self.screen.get_size():
+            self._entities = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            self._snake_frame = None
+
+        previous, previous_food = self._snake_frame, self._food
+        self._snake_frame, self._food = frame, food
+        dirty = None if previous is None else self._find_snake_changes(previous, frame)
+        if dirty is None:
+            self._paint_entities(game_state)
+            self._entities_layer.invalidate([self._entities.get_rect()])
+            return
+
+        for old, new in zip(previous_food, food):
+            if old != new:
+                dirty.extend(self._cell_rect(cell) for cell in (old, new) if cell)
+        surface_rect = self._entities.get_rect()
+        dirty = [rect.clip(surface_rect) for rect in dirty]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+        for rect in dirty:
+            self._repaint_entities(game_state, rect)
+        self._entities_layer.invalidate(dirty)
+
+    def _find_snake_changes(
+        self, previous: _SnakeFrame, frame: _SnakeFrame
+    ) -> list[pygame.Rect] | None:
+        """
+        Find the areas a move or turn of the snake changed since the last frame
+
+        Args:
+            previous (_SnakeFrame): The snake as last painted
+            frame (_SnakeFrame): The snake now
 
         Returns:
-            tuple: The positions of the eyes
+            list[pygame.Rect] | None: The areas to repaint, or None if the snake
+                changed by more than one move and the layer has to be rebuilt
         """
+        if frame.snake is not previous.snake or frame.board is not previous.board:
+            return None
 
-        if direction == c.LEFT:
-            return (
-                (head_pos[0] + c.EYE_DEPTH, head_pos[1] - c.EYE_OFFSET_SIDE_FAR),
-                (head_pos[0] + c.EYE_DEPTH, head_pos[1] + c.EYE_OFFSET_SIDE_NEAR),
-            )
-        elif direction == c.UP:
-            return (
-                (head_pos[0] + c.EYE_OFFSET_NEAR, head_pos[1] - c.EYE_DEPTH_UP),
-                (head_pos[0] + c.EYE_OFFSET_FAR, head_pos[1] - c.EYE_DEPTH_UP),
+        expected = followed_snake_hash(
+            zobrist_keys(frame.board.size),
+            previous.zobrist_hash,
+            (previous.head, previous.tail, previous.direction),
+            (frame.head, frame.tail, frame.direction),
+        )
+        if expected != frame.zobrist_hash:
+            return None
+
+        dirty = []
+        if frame.head != previous.head or frame.direction != previous.direction:
+            dirty.append(self._head_rect(previous.head, previous.direction))
+            dirty.append(self._head_rect(frame.head, frame.direction))
+        if frame.tail != previous.tail:
+            dirty.append(self._cell_rect(previous.tail))
+        return dirty
+
+    def _paint_entities(self, game_state: GameState) -> None:
+        """
+        Paint the whole snake and the food on the cleared entities layer
+
+        Args:
+            game_state (GameState): The current game state
+        """
+        self._entities.fill((0, 0, 0, 0))
+        self._draw_snake(game_state.snake, self._entities)
+        self._entities.blits(self._food_blits(None), False)
+
+    def _repaint_entities(self, game_state: GameState, rect: pygame.Rect) -> None:
+        """
+        Repaint one area of the entities layer from the cells of the board under it
+
+        Args:
+            game_state (GameState): The current game state
+            rect (pygame.Rect): The area to repaint
+        """
+        self._entities.set_clip(rect)
+        self._entities.fill((0, 0, 0, 0))
+        board = game_state.board
+        blits = [
+            self._atlas.body((x * c.CELL_SIZE, y * c.CELL_SIZE))
+            for y in range(
+                rect.top // c.CELL_SIZE, (rect.bottom - 1) // c.CELL_SIZE + 1
             )
-        elif direction == c.RIGHT:
-            return (
-                (
-                    head_pos[0] + c.CELL_SIZE - c.EYE_DEPTH - c.EYE_SIZE,
-                    head_pos[1] - c.EYE_OFFSET_SIDE_FAR,
-                ),
-                (
-                    head_pos[0] + c.CELL_SIZE - c.EYE_DEPTH - c.EYE_SIZE,
-                    head_pos[1] + c.EYE_OFFSET_SIDE_NEAR,
-                ),
+            for x in range(
+                rect.left // c.CELL_SIZE, (rect.right - 1) // c.CELL_SIZE + 1
             )
-        elif direction == c.DOWN:
-            return (
-                (head_pos[0] + c.EYE_OFFSET_NEAR, head_pos[1] + c.EYE_DEPTH),
-                (head_pos[0] + c.EYE_OFFSET_FAR, head_pos[1] + c.EYE_DEPTH),
+            if board.snake_count((x, y))
+        ]
+        frame = self._snake_frame
+        if rect.colliderect(self._head_rect(frame.head, frame.direction)):
+            blits.append(
+                self._atlas.head(
+                    (frame.head[0] * c.CELL_SIZE, frame.head[1] * c.CELL_SIZE),
+                    frame.direction,
+                )
             )
+        blits.extend(self._food_blits(rect))
+        self._entities.blits(blits, False)
+        self._entities.set_clip(None)
+
+    def _food_blits(self, rect: pygame.Rect | None) -> list[tuple]:
+        """
+        Get the blits of the food and bonus food on the entities layer
+
+        Args:
+            rect (pygame.Rect | None): Only the food in this area, or all of it
+
+        Returns:
+            list[tuple]: The blits from the sprite atlas
+        """
+        food_pos, bonus_food_pos = self._food
+        return [
+            self._atlas.food(position, bonus_food)
+            for position, bonus_food in [(food_pos, False), (bonus_food_pos, True)]
+            if position is not None
+            and (rect is None or rect.colliderect(self._cell_rect(position)))
+        ]
+
+    def _head_rect(
+        self, head: tuple[int, ...], direction: tuple[int, ...]
+    ) -> pygame.Rect:
+        """
+        Get the area the head covers with its eyes
+
+        Args:
+            head (tuple): The cell of the head
+            direction (tuple): The direction of the snake
+
+        Returns:
+            pygame.Rect: The area of the head
+        """
+        return self._atlas.head_rect(
+            (head[0] * c.CELL_SIZE, head[1] * c.CELL_SIZE), direction
+        )
+
+    @staticmethod
+    def _cell_rect(cell: tuple[int, ...]) -> pygame.Rect:
+        """
+        Get the area of a cell of the board
+
+        Args:
+            cell (tuple): The cell
+
+        Returns:
+            pygame.Rect: The area of the cell
+        """
+        return pygame.Rect(
+            cell[0] * c.CELL_SIZE, cell[1] * c.CELL_SIZE, c.CELL_SIZE, c.CELL_SIZE
+        )
+
+    def _get_score_rect(self, score: int) -> pygame.Rect:
+        """
+        Get the area the score text covers
+
+        Args:
+            score (int): The score
+
+        Returns:
+            pygame.Rect: The area of the score text
+        """
+        return self._render_score(score).get_rect(
+            midtop=(c.WINDOW_SIZE // 2, c.SCORE_PADDING)
+        )
+
+    def _draw_snake(self, snake: Snake, surface: pygame.Surface | None = None) -> None:
+        """
+        Render the snake on the screen, one rectangle per straight run of the body
+        and the head over it
+
+        Args:
+            snake (Snake): The snake to render
+            surface (pygame.Surface | None): The surface to draw on, the screen by
+                default
+        """
+        surface = self.screen if surface is None else surface
+        self._snake_runs.update(snake)
+        for rect in self._snake_runs.rects():
+            create_rectangle(surface, c.PASTEL_GREEN, *rect)
+        head = snake.get_head_position()
+        self._draw_head(
+            (head[0] * c.CELL_SIZE, head[1] * c.CELL_SIZE), snake.direction, surface
+        )
 
-    def _draw_food(self, food_pos: tuple[int, ...], bonus_food: bool = False) -> None:
+    def _draw_head(
+        self,
+        snake_head: tuple[int, ...],
+        direction: tuple[int, ...],
+        surface: pygame.Surface | None = None,
+    ) -> None:
+        """
+        Render the head of the snake with its eyes
+
+        Args:
+            snake_head (tuple): The pixel position of the head
+            direction (tuple): The direction of the snake
+            surface (pygame.Surface | None): The surface to draw on, the screen by
+                default
+        """
+        surface = self.screen if surface is None else surface
+        surface.blit(*self._atlas.head(snake_head, direction))
+
+    def _draw_food(
+        self,
+        food_pos: tuple[int, ...],
+        bonus_food: bool = False,
+        surface: pygame.Surface | None = None,
+    ) -> None:
         """
         Render the food on the screen
 
         Args:
             food_pos (tuple): The position of the food
             bonus_food (bool): Whether the food is a bonus
+            surface (pygame.Surface | None): The surface to draw on, the screen by
+                default
         """
-        color = c.MINT_GREEN if bonus_food else c.PASTEL_PINK
-
-        create_rectangle(
-            self.screen,
-            color,
-            food_pos[0] * c.CELL_SIZE,
-            food_pos[1] * c.CELL_SIZE,
-            c.CELL_SIZE,
-            c.CELL_SIZE,
-        )
+        surface = self.screen if surface is None else surface
+        surface.blit(*self._atlas.food(food_pos, bonus_food))
 
     def _draw_game_over(self) -> None:
         """
@@ -154,20 +587,23 @@ class Renderer:
 
     def _draw_game_over_overlay(self) -> None:
         """
-        Render the overlay for the game over screen
+        Render the overlay for the game over screen, created once and reused
         """
-        overlay = pygame.Surface((c.WINDOW_SIZE, c.WINDOW_SIZE))
-        overlay.set_alpha(c.OVERLAY_ALPHA)
-        overlay.fill(c.GAME_OVER_COLOR)
-        self.screen.blit(overlay, (0, 0))
+        if self._overlay is None:
+            self._overlay = pygame.Surface((c.WINDOW_SIZE, c.WINDOW_SIZE))
+            self._overlay.set_alpha(c.OVERLAY_ALPHA)
+            self._overlay.fill(c.GAME_OVER_COLOR)
+        self.screen.blit(self._overlay, (0, 0))
 
     def _draw_game_over_text(self) -> None:
         """
         Render the game over text
         """
-        game_over_font = pygame.font.SysFont(c.GAME_OVER_FONT, c.GAME_OVER_FONT_SIZE)
-        game_over_surface = game_over_font.render(
-            c.GAME_OVER_TEXT, True, c.GAME_OVER_TEXT_COLOR
+        game_over_surface = render_text(
+            c.GAME_OVER_FONT,
+            c.GAME_OVER_FONT_SIZE,
+            c.GAME_OVER_TEXT,
+            c.GAME_OVER_TEXT_COLOR,
         )
         game_over_rect = game_over_surface.get_rect(
             center=(c.WINDOW_SIZE // 2, c.GAME_OVER_TEXT_POS)
@@ -181,10 +617,22 @@ class Renderer:
         Args:
             score (int): The score to render
         """
-        font = pygame.font.SysFont(c.SCORE_FONT, c.SCORE_FONT_SIZE)
-        score_text = f"{c.SCORE_TEXT} {score}"
-        score_surface = font.render(score_text, True, c.SCORE_COLOR)
+        score_surface = self._render_score(score)
         score_rect = score_surface.get_rect(
             midtop=(c.WINDOW_SIZE // 2, c.SCORE_PADDING)
         )
         self.screen.blit(score_surface, score_rect)
+
+    def _render_score(self, score: int) -> pygame.Surface:
+        """
+        Render the score text, which is cached until the score changes
+
+        Args:
+            score (int): The score to render
+
+        Returns:
+            pygame.Surface: The rendered score
+        """
+        return render_text(
+            c.SCORE_FONT, c.SCORE_FONT_SIZE, f"{c.SCORE_TEXT} {score}", c.SCORE_COLOR
+        )
@@ -0,0 +1,129 @@
+from collections import deque
+
+from src.core.corners import advance_head, retract_tail
+from src.core.snake import Snake
+from src.core.zobrist import followed_snake_hash, zobrist_keys
+from src.utils import constants as c
+
+import pygame
+
+
+class SnakeRuns:
+    """
+    The straight runs of the body of a snake, kept up to date as it moves
+
+    Consecutive collinear cells are merged into runs, so the body is drawn with one
+    rectangle per run instead of one per cell, and a snake moving in long straight
+    lines costs a draw call per turn rather than per cell. The runs are kept as the
+    corners of the body, head and tail included. A move only extends the run at the
+    head, or starts a new one, and shortens the run at the tail, once the Zobrist
+    hash has confirmed in O(1) that the snake changed by exactly that move. Any
+    other change, e.g. a reset or a rewind, rebuilds the corners from
+    Snake.iter_segments.
+    """
+
+    def __init__(self) -> None:
+        self._corners: deque[tuple[int, ...]] = deque()
+        self._snake: Snake | None = None
+        self._zobrist_hash: int = 0
+        self._direction: tuple[int, ...] | None = None
+
+    @property
+    def corners(self) -> tuple[tuple[int, ...], ...]:
+        return tuple(self._corners)
+
+    def update(self, snake: Snake) -> None:
+        """
+        Bring the runs up to date with the snake
+
+        Args:
+            snake (Snake): The snake, as it is now
+        """
+        head, tail = snake.get_head_position(), snake.get_tail_position()
+        if not self._follow(snake, head, tail):
+            self._rebuild(snake)
+        self._snake = snake
+        self._zobrist_hash = snake.zobrist_hash
+        self._direction = snake.direction
+
+    def rects(self) -> list[pygame.Rect]:
+        """
+        Get the area of every run, from the head to the tail
+
+        Returns:
+            list[pygame.Rect]: The areas, each spanning the cells of one run
+        """
+        corners = self._corners
+        if len(corners) == 1:
+            return [_span_rect(corners[0], corners[0])]
+        return [
+            _span_rect(corners[index], corners[index + 1])
+            for index in range(len(corners) - 1)
+        ]
+
+    def _follow(
+        self, snake: Snake, head: tuple[int, ...], tail: tuple[int, ...]
+    ) -> bool:
+        """
+        Update the corners in place if the snake made one move since the last update
+
+        Args:
+            snake (Snake): The snake
+            head (tuple[int, int]): The head of the snake
+            tail (tuple[int, int]): The tail of the snake
+
+        Returns:
+            bool: False if the snake changed in any other way
+        """
+        corners = self._corners
+        if snake is not self._snake or not corners:
+            return False
+        old_head, old_tail = corners[0], corners[-1]
+        expected = followed_snake_hash(
+            zobrist_keys(snake.board.size),
+            self._zobrist_hash,
+            (old_head, old_tail, self._direction),
+            (head, tail, snake.direction),
+        )
+        if expected != snake.zobrist_hash:
+            return False
+
+        if tail != old_tail:
+            retract_tail(corners)
+        if head != old_head:
+            advance_head(corners, head)
+        return bool(corners) and corners[0] == head and corners[-1] == tail
+
+    def _rebuild(self, snake: Snake) -> None:
+        """
+        Compute the corners of a snake from scratch
+
+        Args:
+            snake (Snake): The snake
+        """
+        corners = self._corners
+        corners.clear()
+        for start, end in snake.iter_segments():
+            if not corners:
+                corners.append(start)
+            if end != start:
+                corners.append(end)
+
+
+def _span_rect(start: tuple[int, ...], end: tuple[int, ...]) -> pygame.Rect:
+    """
+    Get the area of the cells from one cell to another on the same row or column
+
+    Args:
+        start (tuple[int, int]): The cell at one end
+        end (tuple[int, int]): The cell at the other end
+
+    Returns:
+        pygame.Rect: The area spanning both cells and those between them
+    """
+    return pygame.Rect(
+        min(start[0], end[0]) * c.CELL_SIZE,
+        min(start[1], end[1]) * c.CELL_SIZE,
+        (abs(end[0] - start[0]) + 1) * c.CELL_SIZE,
+        (abs(end[1] - start[1]) + 1) * c.CELL_SIZE,
+    )
@@ -0,0 +1,176 @@
+from src.ui.ui_components import create_rectangle
+from src.utils import constants as c
+
+import pygame
+
+
+def get_eyes_positions(
+    head_pos: tuple[int, ...], direction: tuple[int, ...]
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Calculate eyes positions based on head position and direction
+
+    Args:
+        head_pos (tuple): The position of the head
+        direction (tuple): The direction of the snake
+
+    Returns:
+        tuple: The positions of the eyes
+    """
+
+    if direction == c.LEFT:
+        return (
+            (head_pos[0] + c.EYE_DEPTH, head_pos[1] - c.EYE_OFFSET_SIDE_FAR),
+            (head_pos[0] + c.EYE_DEPTH, head_pos[1] + c.EYE_OFFSET_SIDE_NEAR),
+        )
+    elif direction == c.UP:
+        return (
+            (head_pos[0] + c.EYE_OFFSET_NEAR, head_pos[1] - c.EYE_DEPTH_UP),
+            (head_pos[0] + c.EYE_OFFSET_FAR, head_pos[1] - c.EYE_DEPTH_UP),
+        )
+    elif direction == c.RIGHT:
+        return (
+            (
+                head_pos[0] + c.CELL_SIZE - c.EYE_DEPTH - c.EYE_SIZE,
+                head_pos[1] - c.EYE_OFFSET_SIDE_FAR,
+            ),
+            (
+                head_pos[0] + c.CELL_SIZE - c.EYE_DEPTH - c.EYE_SIZE,
+                head_pos[1] + c.EYE_OFFSET_SIDE_NEAR,
+            ),
+        )
+    elif direction == c.DOWN:
+        return (
+            (head_pos[0] + c.EYE_OFFSET_NEAR, head_pos[1] + c.EYE_DEPTH),
+            (head_pos[0] + c.EYE_OFFSET_FAR, head_pos[1] + c.EYE_DEPTH),
+        )
+
+
+class SpriteAtlas:
+    """
+    The head, body and food sprites, drawn once into a single surface
+
+    Each head sprite holds the head cell and its eyes for one direction, including
+    the pixels where the eyes reach past the cell, and is transparent elsewhere, so
+    blitting it gives exactly what drawing the rectangles gave. Sprites are
+    returned as (atlas, position, area) blits, to be drawn in batches with
+    Surface.blits.
+
+    Attributes:
+        surface (pygame.Surface): The atlas, in the display pixel format once a
+            display exists
+    """
+
+    def __init__(self) -> None:
+        cell = pygame.Rect(0, 0, c.CELL_SIZE, c.CELL_SIZE)
+        bounds = {
+            direction: cell.unionall(
+                [
+                    pygame.Rect(eye, (c.EYE_SIZE, c.EYE_SIZE))
+                    for eye in get_eyes_positions((0, 0), direction)
+                ]
+            )
+            for direction in (c.UP, c.RIGHT, c.DOWN, c.LEFT)
+        }
+        height = max(rect.height for rect in bounds.values())
+        width = sum(rect.width for rect in bounds.values()) + 3 * c.CELL_SIZE
+        self.surface: pygame.Surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+
+        self._heads: dict[tuple[int, ...], tuple[pygame.Rect, tuple[int, int]]] = {}
+        x = 0
+        for direction, rect in bounds.items():
+            origin = (x - rect.x, -rect.y)
+            create_rectangle(
+                self.surface,
+                c.DARKER_PASTEL_GREEN,
+                origin[0],
+                origin[1],
+                c.CELL_SIZE,
+                c.CELL_SIZE,
+            )
+            for eye in get_eyes_positions(origin, direction):
+                pygame.draw.rect(
+                    self.surface, c.TEXT_COLOR, (*eye, c.EYE_SIZE, c.EYE_SIZE)
+                )
+            self._heads[direction] = (
+                pygame.Rect(x, 0, rect.width, rect.height),
+                (rect.x, rect.y),
+            )
+            x += rect.width
+
+        self._tiles: dict[tuple, pygame.Rect] = {}
+        for color in (c.PASTEL_GREEN, c.PASTEL_PINK, c.MINT_GREEN):
+            create_rectangle(self.surface, color, x, 0, c.CELL_SIZE, c.CELL_SIZE)
+            self._tiles[color] = pygame.Rect(x, 0, c.CELL_SIZE, c.CELL_SIZE)
+            x += c.CELL_SIZE
+
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+    def head(
+        self, head_pos: tuple[int, ...], direction: tuple[int, ...]
+    ) -> tuple[pygame.Surface, tuple[int, int], pygame.Rect]:
+        """
+        Get the blit of the head with its eyes
+
+        Args:
+            head_pos (tuple): The pixel position of the head cell
+            direction (tuple): The direction of the snake
+
+        Returns:
+            tuple[pygame.Surface, tuple[int, int], pygame.Rect]: The blit
+        """
+        area, (offset_x, offset_y) = self._heads[direction]
+        return self.surface, (head_pos[0] + offset_x, head_pos[1] + offset_y), area
+
+    def head_rect(
+        self, head_pos: tuple[int, ...], direction: tuple[int, ...]
+    ) -> pygame.Rect:
+        """
+        Get the area the head covers with its eyes
+
+        Args:
+            head_pos (tuple): The pixel position of the head cell
+            direction (tuple): The direction of the snake
+
+        Returns:
+            pygame.Rect: The area of the head
+        """
+        area, (offset_x, offset_y) = self._heads[direction]
+        return pygame.Rect(
+            head_pos[0] + offset_x, head_pos[1] + offset_y, area.width, area.height
+        )
+
+    def body(
+        self, segment: tuple[int, ...]
+    ) -> tuple[pygame.Surface, tuple[int, ...], pygame.Rect]:
+        """
+        Get the blit of a body cell
+
+        Args:
+            segment (tuple): The pixel position of the cell
+
+        Returns:
+            tuple[pygame.Surface, tuple[int, int], pygame.Rect]: The blit
+        """
+        return self.surface, segment, self._tiles[c.PASTEL_GREEN]
+
+    def food(
+        self, food_pos: tuple[int, ...], bonus_food: bool = False
+    ) -> tuple[pygame.Surface, tuple[int, int], pygame.Rect]:
+        """
+        Get the blit of a food
+
+        Args:
+            food_pos (tuple): The grid position of the food
+            bonus_food (bool): Whether the food is a bonus
+
+        Returns:
+            tuple[pygame.Surface, tuple[int, int], pygame.Rect]: The blit
+        """
+        return (
+            self.surface,
+            (food_pos[0] * c.CELL_SIZE, food_pos[1] * c.CELL_SIZE),
+            self._tiles[c.MINT_GREEN if bonus_food else c.PASTEL_PINK],
+        )
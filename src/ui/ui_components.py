@@ -1,3 +1,4 @@
+from src.ui.fonts import render_text
 from src.utils import constants as c
 
 import pygame
@@ -46,8 +47,9 @@ def create_title(screen: pygame.Surface) -> None:
     Args:
         screen (pygame.Surface): The screen to draw on
     """
-    title_font = pygame.font.SysFont(c.TITLE_FONT, c.TITLE_FONT_SIZE)
-    title_surface = title_font.render(c.TITLE_TEXT, True, c.TITLE_COLOR)
+    title_surface = render_text(
+        c.TITLE_FONT, c.TITLE_FONT_SIZE, c.TITLE_TEXT, c.TITLE_COLOR
+    )
     title_rect = title_surface.get_rect(centerx=c.WINDOW_SIZE // 2, y=c.TITLE_Y_POS)
 
     screen.blit(title_surface, title_rect)
@@ -90,8 +92,9 @@ def _draw_start_button(screen: pygame.Surface | None) -> pygame.Rect:
 
     pygame.draw.rect(screen, button_color, button_rect)
 
-    button_font = pygame.font.SysFont(None, c.START_BUTTON_FONT_SIZE)
-    button_surface = button_font.render(c.START_BUTTON_TEXT, True, button_text_color)
+    button_surface = render_text(
+        None, c.START_BUTTON_FONT_SIZE, c.START_BUTTON_TEXT, button_text_color
+    )
     text_rect = button_surface.get_rect(center=button_rect.center)
 
     screen.blit(button_surface, text_rect)
@@ -112,8 +115,9 @@ def draw_instructions(
     """
     curr_y_pos = c.INSTRUCTIONS_POS
     for instruction in c.INSTRUCTIONS[first:last]:
-        font = pygame.font.SysFont(c.INSTRUCTIONS_FONT, c.INSTRUCTIONS_FONT_SIZE)
-        instruction_surface = font.render(instruction, True, c.TEXT_COLOR)
+        instruction_surface = render_text(
+            c.INSTRUCTIONS_FONT, c.INSTRUCTIONS_FONT_SIZE, instruction, c.TEXT_COLOR
+        )
         instruction_rect = instruction_surface.get_rect(
             center=(c.WINDOW_SIZE // 2, curr_y_pos)
         )
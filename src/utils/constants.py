@@ -2,6 +2,14 @@
 WINDOW_SIZE = 400  # width and height of the window
 CELL_SIZE = 20  # number of cells in the grid (30x30)
 GRID_SIZE = WINDOW_SIZE // CELL_SIZE  # size of each cell (20x20)
+BOARD_SIZE = GRID_SIZE  # cells per side of the board; larger boards scroll
+
+# RENDERING --------------------------------------------------------------------
+DIRTY_RECT_RENDERING = True  # update only the changed regions of the screen
+MAX_DIRTY_RECTS = 32  # more changed regions than this redraw the whole screen
+MAX_DIRTY_AREA = 0.5  # so does changing more than this fraction of the screen
+GRID_RASTER_RENDERING = False  # rasterise the board from its cells in one blit
+TEXT_CACHE_SIZE = 128  # rendered text surfaces kept for reuse
 
 # COLORS -----------------------------------------------------------------------
 PASTEL_GREEN = (167, 217, 172)  # for snake
@@ -45,6 +53,10 @@ BONUS_FOOD_SIZE = CELL_SIZE  # size of the bonus food
 BONUS_FOOD_SPAWN_INTERVAL = 1200  # 20 seconds * 60 FPS
 BONUS_FOOD_DURATION = 300  # 5 seconds * 60 FPS
 
+# REWIND ----------------------------------------------------------------------
+REWIND_BUFFER_SECONDS = 10  # how far back the game can be rewound
+REWIND_SECONDS = 3  # how far the B key rewinds
+
 # START SCREEN -----------------------------------------------------------------
 # Title
 TITLE_FONT = "impact"
@@ -0,0 +1,88 @@
+import random
+
+MASK_64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _mix(value: int) -> int:
+    """
+    Scramble a 64-bit value with the SplitMix64 finaliser.
+
+    Args:
+        value (int): The value to scramble
+
+    Returns:
+        int: The scrambled 64-bit value
+    """
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+def derive_seed(seed: int, *keys: int) -> int:
+    """
+    Derive an independent 64-bit seed from a base seed and a path of keys,
+    e.g. derive_seed(run_seed, chunk_index, game_index)
+
+    Args:
+        seed (int): The base seed
+        keys (int): The keys identifying the derived stream
+
+    Returns:
+        int: The derived seed
+    """
+    value = _mix((seed + GOLDEN_GAMMA) & MASK_64)
+    for key in keys:
+        value = _mix((value ^ key) + GOLDEN_GAMMA & MASK_64)
+    return value
+
+
+class Rng:
+    """
+    Small SplitMix64 random generator for the simulation core.
+
+    Its whole state is one 64-bit integer, so games can be seeded, snapshotted and
+    replayed cheaply.
+
+    Args:
+        seed (int | None): The seed; a random one is picked if not given
+    """
+
+    def __init__(self, seed: int | None = None):
+        if seed is None:
+            seed = random.getrandbits(64)
+        self._state: int = seed & MASK_64
+
+    def next_u64(self) -> int:
+        """
+        Get the next 64-bit random value.
+
+        Returns:
+            int: A random integer in [0, 2**64)
+        """
+        self._state = (self._state + GOLDEN_GAMMA) & MASK_64
+        return _mix(self._state)
+
+    def randrange(self, n: int) -> int:
+        """
+        Get a random integer in [0, n).
+
+        Args:
+            n (int): The exclusive upper bound, at most 2**32
+
+        Returns:
+            int: The random integer
+        """
+        return (self.next_u64() * n) >> 64
+
+    def getstate(self) -> int:
+        """
+        Get the generator state, to be restored with setstate.
+        """
+        return self._state
+
+    def setstate(self, state: int) -> None:
+        """
+        Restore a generator state returned by getstate.
+        """
+        self._state = state
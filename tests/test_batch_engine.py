@@ -0,0 +1,141 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from src.core.batch_engine import DIRECTIONS, KEEP_DIRECTION, BatchEngine
+from src.core.board import Board
+from src.core.game_state import GameState
+from src.utils import constants as c
+
+import numpy as np
+
+
+def _first_free_cell(board):
+    for index in board._spawn_cells[1:]:
+        if board._cells[index] == 0:
+            return index % board._stride - 1, index // board._stride - 1
+    return None
+
+
+def _first_free_cells(engine, games):
+    free = engine._free_cells(games)
+    cells = free.argmax(axis=1)
+    cells[~free.any(axis=1)] = -1
+    return cells
+
+
+class BatchEngineShould(unittest.TestCase):
+    def setUp(self):
+        self.engine = BatchEngine(3, seed=0)
+
+    def test_init_placesSnakesInTheMiddle(self):
+        self.assertEqual([[10, 10]] * 3, self.engine.head_positions().tolist())
+        self.assertEqual([2, 2, 2], self.engine.lengths.tolist())
+        self.assertEqual(2, self.engine.occupancy[0].sum())
+        self.assertEqual(1, self.engine.occupancy[0, 10, 11])
+
+    def test_occupancy_isReadOnly(self):
+        with self.assertRaises(ValueError):
+            self.engine.occupancy[0, 0, 0] = 1
+
+    def test_step_movesEverySnakeOneCell(self):
+        self.engine.step()
+        self.assertEqual([[9, 10]] * 3, self.engine.head_positions().tolist())
+        self.assertEqual(0, self.engine.occupancy[0, 10, 11])
+
+    def test_step_appliesActions(self):
+        up, down = DIRECTIONS.index(c.UP), DIRECTIONS.index(c.DOWN)
+        self.engine.step(np.array([up, down, KEEP_DIRECTION]))
+        self.assertEqual(
+            [[10, 9], [10, 11], [9, 10]], self.engine.head_positions().tolist()
+        )
+
+    def test_step_ignoresReversingActions(self):
+        self.engine.step(np.full(3, DIRECTIONS.index(c.RIGHT)))
+        self.assertEqual([[9, 10]] * 3, self.engine.head_positions().tolist())
+
+    def test_step_spawnsFoodOnFreeCells(self):
+        self.engine.step()
+        for x, y in self.engine.food_positions():
+            self.assertTrue(1 <= x <= c.GRID_SIZE - 2 and 1 <= y <= c.GRID_SIZE - 2)
+            self.assertEqual(0, self.engine.occupancy[0, y, x])
+
+    def test_step_growsSnakeAndScores_whenFoodEaten(self):
+        self.engine.step()
+        self.engine._food[0] = self.engine._start_cells[0] - 2
+        result = self.engine.step()
+        self.assertEqual([1, 0, 0], result.reward.tolist())
+        self.assertEqual([3, 2, 2], self.engine.lengths.tolist())
+
+    def test_step_resetsGame_whenSnakeHitsWall(self):
+        game_over = np.zeros(3, dtype=bool)
+        for _ in range(c.GRID_SIZE // 2 + 1):
+            game_over |= self.engine.step().game_over
+        self.assertTrue(game_over.all())
+        self.assertEqual([[10, 10]] * 3, self.engine.head_positions().tolist())
+        self.assertEqual([0, 0, 0], self.engine.scores.tolist())
+
+    @patch.object(BatchEngine, "_sample_free_cells", _first_free_cells)
+    @patch.object(Board, "random_free_cell", _first_free_cell)
+    def test_step_matchesGameStateStep_overRandomGames(self):
+        num_games = 4
+        engine = BatchEngine(num_games)
+        games = [GameState() for _ in range(num_games)]
+        rng = random.Random(3)
+        bonus_food_seen = False
+
+        for _ in range(2000):
+            actions = [
+                DIRECTIONS.index(rng.choice(DIRECTIONS)) if rng.random() < 0.3 else -1
+                for _ in range(num_games)
+            ]
+            for i, game_state in enumerate(games):
+                actions[i] = _avoid_death(game_state, actions[i])
+
+            result = engine.step(np.array(actions))
+            for i, game_state in enumerate(games):
+                direction = DIRECTIONS[actions[i]] if actions[i] >= 0 else None
+                expected = game_state.step(direction)
+                self.assertEqual(expected.reward, result.reward[i])
+                self.assertEqual(expected.game_over, result.game_over[i])
+                self.assertEqual(game_state.score, result.score[i])
+                if expected.game_over:
+                    games[i] = GameState()
+                    continue
+
+                self.assertEqual(
+                    list(game_state.snake.get_head_position()),
+                    engine.head_positions()[i].tolist(),
+                )
+                self.assertEqual(len(game_state.snake.positions), engine.lengths[i])
+                self.assertEqual(
+                    list(game_state.food_system.food_pos),
+                    engine.food_positions()[i].tolist(),
+                )
+                bonus_food_pos = game_state.food_system.bonus_food_pos
+                self.assertEqual(
+                    list(bonus_food_pos or (-1, -1)),
+                    engine.bonus_food_positions()[i].tolist(),
+                )
+                bonus_food_seen |= bonus_food_pos is not None
+
+        self.assertTrue(bonus_food_seen)
+
+
+def _avoid_death(game_state, action):
+    snake = game_state.snake
+    head_x, head_y = snake.get_head_position()
+    direction = DIRECTIONS[action] if action >= 0 else snake.direction
+    if (
+        direction[0] + snake.direction[0] == 0
+        and direction[1] + snake.direction[1] == 0
+    ):
+        direction = snake.direction
+    if not game_state.board.is_lethal((head_x + direction[0], head_y + direction[1])):
+        return action
+    for candidate in DIRECTIONS:
+        if not game_state.board.is_lethal(
+            (head_x + candidate[0], head_y + candidate[1])
+        ):
+            return DIRECTIONS.index(candidate)
+    return action
@@ -0,0 +1,166 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from src.core.board import Board
+from src.utils.rng import Rng
+
+
+class BoardShould(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(size=4)
+
+    def test_init_setsSize(self):
+        self.assertEqual(4, self.board.size)
+
+    def test_init_leavesPlayableCellsFree(self):
+        for x in range(4):
+            for y in range(4):
+                self.assertTrue(self.board.is_free((x, y)))
+
+    def test_isWall_returnsTrue_forCellsOutsideTheGrid(self):
+        for position in [(-1, 0), (4, 0), (0, -1), (0, 4), (-1, -1), (4, 4)]:
+            self.assertTrue(self.board.is_wall(position))
+
+    def test_isWall_returnsFalse_forCellsInsideTheGrid(self):
+        self.assertFalse(self.board.is_wall((0, 0)))
+        self.assertFalse(self.board.is_wall((3, 3)))
+
+    def test_isLethal_returnsTrue_forWall(self):
+        self.assertTrue(self.board.is_lethal((-1, 2)))
+
+    def test_isLethal_returnsTrue_forSnakeCell(self):
+        self.board.add_snake((1, 1))
+        self.assertTrue(self.board.is_lethal((1, 1)))
+
+    def test_isLethal_returnsFalse_forFoodCell(self):
+        self.board.set_flag((1, 1), Board.FOOD)
+        self.assertFalse(self.board.is_lethal((1, 1)))
+
+    def test_addSnake_countsOverlappingSegments(self):
+        self.board.add_snake((1, 1))
+        self.board.add_snake((1, 1))
+        self.assertEqual(2, self.board.snake_count((1, 1)))
+
+    def test_removeSnake_freesCell(self):
+        self.board.add_snake((1, 1))
+        self.board.remove_snake((1, 1))
+        self.assertTrue(self.board.is_free((1, 1)))
+
+    def test_setFlag_marksFood(self):
+        self.board.set_flag((2, 1), Board.FOOD)
+        self.assertTrue(self.board.has_food((2, 1)))
+        self.assertFalse(self.board.is_free((2, 1)))
+
+    def test_setFlag_keepsSnakeCount(self):
+        self.board.add_snake((2, 1))
+        self.board.set_flag((2, 1), Board.BONUS_FOOD)
+        self.assertEqual(1, self.board.snake_count((2, 1)))
+        self.assertTrue(self.board.has_bonus_food((2, 1)))
+
+    def test_clearFlag_removesOnlyThatFlag(self):
+        self.board.set_flag((2, 1), Board.FOOD)
+        self.board.set_flag((2, 1), Board.BONUS_FOOD)
+        self.board.clear_flag((2, 1), Board.FOOD)
+        self.assertFalse(self.board.has_food((2, 1)))
+        self.assertTrue(self.board.has_bonus_food((2, 1)))
+
+    def test_init_indexesOnlyInnerCellsAsFree(self):
+        self.assertEqual(4, self.board.free_cell_count)
+
+    def test_randomFreeCell_returnsInnerCell(self):
+        self.assertIn(self.board.random_free_cell(), [(1, 1), (1, 2), (2, 1), (2, 2)])
+
+    def test_randomFreeCell_returnsOnlyRemainingFreeCell(self):
+        self.board.add_snake((1, 1))
+        self.board.add_snake((1, 2))
+        self.board.set_flag((2, 1), Board.FOOD)
+        for _ in range(20):
+            self.assertEqual((2, 2), self.board.random_free_cell())
+
+    def test_randomFreeCell_returnsNone_whenBoardFull(self):
+        for position in [(1, 1), (1, 2), (2, 1), (2, 2)]:
+            self.board.add_snake(position)
+        self.assertEqual(0, self.board.free_cell_count)
+        self.assertIsNone(self.board.random_free_cell())
+
+    def test_randomFreeCell_returnsFreedCellAgain(self):
+        for position in [(1, 1), (1, 2), (2, 1), (2, 2)]:
+            self.board.add_snake(position)
+        self.board.remove_snake((2, 1))
+        self.assertEqual((2, 1), self.board.random_free_cell())
+
+    def test_freeCellCount_ignoresOverlappingSegments(self):
+        self.board.add_snake((1, 1))
+        self.board.add_snake((1, 1))
+        self.board.remove_snake((1, 1))
+        self.assertEqual(3, self.board.free_cell_count)
+
+    def test_randomFreeCell_drawsEveryFreeCell(self):
+        board = Board(size=6)
+        board.add_snake((2, 2))
+        drawn = {board.random_free_cell() for _ in range(2000)}
+        expected = {(x, y) for x in range(1, 5) for y in range(1, 5)} - {(2, 2)}
+        self.assertEqual(expected, drawn)
+
+    def test_randomFreeCell_drawsKthFreeCellInRowOrder(self):
+        board = Board(size=8)
+        cells = [(x, y) for y in range(8) for x in range(8)]
+        occupied = set()
+        shuffle = random.Random(0)
+        for position in shuffle.sample(cells, 40):
+            board.add_snake(position)
+            occupied.add(position)
+        for position in shuffle.sample(sorted(occupied), 15):
+            board.remove_snake(position)
+            occupied.discard(position)
+
+        free = [
+            (x, y) for y in range(1, 7) for x in range(1, 7) if (x, y) not in occupied
+        ]
+        self.assertEqual(len(free), board.free_cell_count)
+        with patch.object(board._rng, "randrange", side_effect=range(len(free))):
+            self.assertEqual(free, [board.random_free_cell() for _ in free])
+
+    def test_snakeCellsIn_returnsOnlySnakeCellsInRectangle(self):
+        board = Board(size=8)
+        for position in [(1, 1), (2, 1), (2, 2), (6, 6), (2, 5)]:
+            board.add_snake(position)
+        board.set_flag((3, 2), Board.FOOD)
+
+        self.assertEqual([(1, 1), (2, 1), (2, 2)], board.snake_cells_in(1, 1, 3, 3))
+
+    def test_snakeCellsIn_clipsRectangleToBoard(self):
+        self.board.add_snake((0, 0))
+        self.board.add_snake((3, 3))
+
+        self.assertEqual([(0, 0), (3, 3)], self.board.snake_cells_in(-2, -2, 9, 9))
+
+    def test_copy_isIndependent(self):
+        copy = self.board.copy()
+        copy.add_snake((1, 1))
+        self.assertEqual(0, self.board.snake_count((1, 1)))
+        self.assertEqual(4, self.board.free_cell_count)
+
+    def test_restore_returnsToSnapshot(self):
+        snapshot = self.board.snapshot()
+        self.board.add_snake((1, 1))
+        self.board.set_flag((2, 2), Board.FOOD)
+        self.board.restore(snapshot)
+        self.assertEqual(snapshot, self.board.snapshot())
+        self.assertTrue(self.board.is_free((1, 1)))
+
+    def test_randomFreeCell_dependsOnlyOnOccupancy(self):
+        for filled in [
+            [(1, 1), (2, 1)],
+            [(x, y) for x in range(1, 5) for y in (1, 2, 3)] + [(1, 4)],
+        ]:
+            first, second = Board(size=6, rng=Rng(1)), Board(size=6, rng=Rng(1))
+            for position in filled:
+                first.add_snake(position)
+            for position in reversed(filled):
+                second.add_snake(position)
+            self.assertEqual(
+                [first.random_free_cell() for _ in range(10)],
+                [second.random_free_cell() for _ in range(10)],
+            )
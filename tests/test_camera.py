@@ -0,0 +1,51 @@
+import unittest
+
+from src.ui.camera import Camera
+from src.utils import constants as c
+
+
+class CameraShould(unittest.TestCase):
+    def setUp(self):
+        self.camera = Camera(10, 8)
+
+    def test_follow_centresHead(self):
+        self.camera.follow((50, 40), 100)
+
+        self.assertEqual((45, 36, 10, 8), self.camera.cells)
+
+    def test_follow_stopsAtTopLeftOfBoard(self):
+        self.camera.follow((2, 1), 100)
+
+        self.assertEqual((0, 0), (self.camera.left, self.camera.top))
+
+    def test_follow_stopsAtBottomRightOfBoard(self):
+        self.camera.follow((99, 98), 100)
+
+        self.assertEqual((90, 92), (self.camera.left, self.camera.top))
+
+    def test_fits_returnsTrue_onlyForBoardsNotLargerThanView(self):
+        self.assertTrue(self.camera.fits(8))
+        self.assertFalse(self.camera.fits(9))
+
+    def test_isVisible_returnsTrue_onlyForCellsInView(self):
+        self.camera.follow((50, 40), 100)
+
+        self.assertTrue(self.camera.is_visible((45, 36)))
+        self.assertTrue(self.camera.is_visible((54, 43)))
+        self.assertFalse(self.camera.is_visible((55, 40)))
+        self.assertFalse(self.camera.is_visible((50, 35)))
+
+    def test_toScreen_returnsPixelPositionInView(self):
+        self.camera.follow((50, 40), 100)
+
+        self.assertEqual(
+            (5 * c.CELL_SIZE, 4 * c.CELL_SIZE), self.camera.to_screen((50, 40))
+        )
+
+    def test_view_returnsShownAreaInPixels(self):
+        self.camera.follow((50, 40), 100)
+
+        self.assertEqual(
+            (45 * c.CELL_SIZE, 36 * c.CELL_SIZE, 10 * c.CELL_SIZE, 8 * c.CELL_SIZE),
+            self.camera.view,
+        )
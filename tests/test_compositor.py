@@ -0,0 +1,121 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from src.ui.compositor import Compositor, Layer
+from src.utils import constants as c
+
+import pygame
+
+
+def _content(rects, draw=None):
+    return lambda: (rects, draw or Mock())
+
+
+class LayerShould(unittest.TestCase):
+    def setUp(self):
+        self.layer = Layer()
+
+    def test_setContent_rendersContent_whenKeyChanges(self):
+        make_content = Mock(return_value=([pygame.Rect(0, 0, 10, 10)], Mock()))
+
+        self.assertTrue(self.layer.set_content(1, make_content))
+        self.assertFalse(self.layer.set_content(1, make_content))
+        self.assertTrue(self.layer.set_content(2, make_content))
+
+        self.assertEqual(make_content.call_count, 2)
+
+    def test_setContent_marksOldAndNewAreasDirty(self):
+        old_rect, new_rect = pygame.Rect(0, 0, 10, 10), pygame.Rect(50, 50, 10, 10)
+        self.layer.set_content(1, _content([old_rect]))
+        self.layer.dirty.clear()
+
+        self.layer.set_content(2, _content([new_rect]))
+
+        self.assertEqual([old_rect, new_rect], self.layer.dirty)
+        self.assertEqual([new_rect], self.layer.rects)
+
+    def test_setSprites_coversSpriteAreas(self):
+        sprite = pygame.Surface((30, 20))
+
+        self.layer.set_sprites(1, lambda: [(sprite, (5, 6))])
+
+        self.assertEqual([pygame.Rect(5, 6, 30, 20)], self.layer.rects)
+
+    def test_clear_marksContentDirty(self):
+        rect = pygame.Rect(0, 0, 10, 10)
+        self.layer.set_content(1, _content([rect]))
+        self.layer.dirty.clear()
+
+        self.layer.clear()
+        self.layer.clear()
+
+        self.assertEqual([rect], self.layer.dirty)
+        self.assertEqual([], self.layer.rects)
+
+
+class CompositorShould(unittest.TestCase):
+    def setUp(self):
+        self.screen = pygame.Surface((c.WINDOW_SIZE, c.WINDOW_SIZE))
+        self.bottom, self.top = Layer(), Layer()
+        self.bottom_draw, self.top_draw = Mock(), Mock()
+        self.bottom.set_content(
+            1, _content([self.screen.get_rect()], self.bottom_draw), opaque=True
+        )
+        self.compositor = Compositor(self.screen, [self.bottom, self.top])
+
+    def _compose(self):
+        with (
+            patch("pygame.display.flip") as mock_flip,
+            patch("pygame.display.update") as mock_update,
+        ):
+            self.compositor.compose()
+        return mock_flip, mock_update
+
+    def test_compose_flips_onFirstComposition(self):
+        mock_flip, mock_update = self._compose()
+
+        mock_flip.assert_called_once()
+        mock_update.assert_not_called()
+        self.bottom_draw.assert_called_once_with(self.screen)
+
+    def test_compose_doesNothing_whenNothingChanged(self):
+        self._compose()
+
+        mock_flip, mock_update = self._compose()
+
+        mock_flip.assert_not_called()
+        mock_update.assert_not_called()
+        self.bottom_draw.assert_called_once()
+
+    def test_compose_updatesOnlyChangedAreas(self):
+        self._compose()
+        rect = pygame.Rect(10, 10, 20, 20)
+        self.top.set_content(1, _content([rect], self.top_draw))
+
+        mock_flip, mock_update = self._compose()
+
+        mock_flip.assert_not_called()
+        mock_update.assert_called_once_with([rect])
+        self.assertEqual(self.bottom_draw.call_count, 2)
+        self.top_draw.assert_called_once_with(self.screen)
+
+    def test_compose_skipsLayersBelowOpaqueLayer(self):
+        self._compose()
+        self.top.set_content(
+            1, _content([self.screen.get_rect()], self.top_draw), opaque=True
+        )
+        self.top.dirty = [pygame.Rect(0, 0, 10, 10)]
+
+        self._compose()
+
+        self.bottom_draw.assert_called_once()
+        self.top_draw.assert_called_once()
+
+    def test_compose_flips_whenTooMuchChanged(self):
+        self._compose()
+        self.top.set_content(1, _content([self.screen.get_rect()], self.top_draw))
+
+        mock_flip, mock_update = self._compose()
+
+        mock_flip.assert_called_once()
+        mock_update.assert_not_called()
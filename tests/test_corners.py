@@ -0,0 +1,36 @@
+from collections import deque
+import unittest
+
+from src.core.corners import advance_head, retract_tail, step_towards
+
+
+class CornersShould(unittest.TestCase):
+    def test_stepTowards_returnsUnitStep(self):
+        self.assertEqual((1, 0), step_towards((2, 5), (7, 5)))
+        self.assertEqual((0, -1), step_towards((2, 5), (2, 1)))
+        self.assertEqual((0, 0), step_towards((2, 5), (2, 5)))
+
+    def test_retractTail_shortensTailRun(self):
+        corners = deque([(5, 5), (5, 8), (3, 8)])
+        self.assertEqual((3, 8), retract_tail(corners))
+        self.assertEqual(deque([(5, 5), (5, 8), (4, 8)]), corners)
+
+    def test_retractTail_dropsCorner_whenRunIsUsedUp(self):
+        corners = deque([(5, 5), (5, 8), (4, 8)])
+        self.assertEqual((4, 8), retract_tail(corners))
+        self.assertEqual(deque([(5, 5), (5, 8)]), corners)
+
+    def test_retractTail_emptiesSingleCell(self):
+        corners = deque([(5, 5)])
+        self.assertEqual((5, 5), retract_tail(corners))
+        self.assertEqual(deque(), corners)
+
+    def test_advanceHead_extendsHeadRun_whenGoingStraight(self):
+        corners = deque([(5, 5), (5, 8)])
+        advance_head(corners, (5, 4))
+        self.assertEqual(deque([(5, 4), (5, 8)]), corners)
+
+    def test_advanceHead_startsNewRun_whenTurning(self):
+        corners = deque([(5, 5), (5, 8)])
+        advance_head(corners, (6, 5))
+        self.assertEqual(deque([(6, 5), (5, 5), (5, 8)]), corners)
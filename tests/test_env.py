@@ -0,0 +1,94 @@
+import random
+import unittest
+
+from src.simulation.env import (
+    BODY_PLANE,
+    FOOD_PLANE,
+    HEAD_PLANE,
+    SnakeEnv,
+    build_planes,
+)
+from src.simulation.policies import DIRECTIONS
+from src.utils import constants as c
+
+import numpy as np
+
+
+class SnakeEnvShould(unittest.TestCase):
+    def setUp(self):
+        self.env = SnakeEnv(seed=1)
+        self.observation, _ = self.env.reset()
+
+    def test_reset_encodesInitialState(self):
+        game_state = self.env.game_state
+        head_x, head_y = game_state.snake.get_head_position()
+        food_x, food_y = game_state.food_system.food_pos
+        self.assertEqual(2, self.env.planes[BODY_PLANE].sum())
+        self.assertEqual(1, self.env.planes[HEAD_PLANE, head_y, head_x])
+        self.assertEqual(1, self.env.planes[FOOD_PLANE, food_y, food_x])
+        self.assertEqual(1, self.env.direction[DIRECTIONS.index(c.LEFT)])
+
+    def test_step_returnsSameBuffer(self):
+        observation, *_ = self.env.step(None)
+        self.assertIs(self.observation, observation)
+        self.assertTrue(np.shares_memory(observation, self.env.planes))
+
+    def test_step_updatesDirection(self):
+        self.env.step(DIRECTIONS.index(c.UP))
+        self.assertEqual(DIRECTIONS.index(c.UP), int(self.env.direction.argmax()))
+        self.assertEqual(1, self.env.direction.sum())
+
+    def test_step_reportsTerminationAtWall(self):
+        terminated = False
+        while not terminated:
+            _, _, terminated, truncated, info = self.env.step(None)
+        self.assertFalse(truncated)
+        self.assertEqual("wall", info["cause"])
+
+    def test_step_keepsObservation_afterGameOver(self):
+        for turns in [[c.UP], [c.UP, c.RIGHT], [c.DOWN], [c.LEFT]]:
+            self.env.reset(seed=1)
+            for direction in turns:
+                self.env.step(DIRECTIONS.index(direction))
+            terminated = False
+            while not terminated:
+                _, _, terminated, _, _ = self.env.step(None)
+            observation = self.env.observation.copy()
+
+            _, reward, terminated, truncated, info = self.env.step(None)
+
+            self.assertEqual((0, True, False), (reward, terminated, truncated))
+            self.assertEqual("wall", info["cause"])
+            np.testing.assert_array_equal(observation, self.env.observation)
+            np.testing.assert_array_equal(
+                build_planes(self.env.game_state), self.env.planes
+            )
+
+    def test_step_truncatesAtMaxMoves(self):
+        env = SnakeEnv(seed=1, max_moves=2)
+        env.reset()
+        self.assertFalse(env.step(None)[3])
+        self.assertTrue(env.step(None)[3])
+
+    def test_step_withoutObserve_returnsNoObservation(self):
+        env = SnakeEnv(seed=1, observe=False)
+        self.assertIsNone(env.reset()[0])
+        self.assertIsNone(env.step(None)[0])
+
+    def test_step_keepsIncrementalObservationEqualToRebuilt(self):
+        rng = random.Random(0)
+        for seed in range(20):
+            self.env.reset(seed=seed)
+            terminated = False
+            while not terminated:
+                _, _, terminated, _, _ = self.env.step(rng.randrange(4))
+                np.testing.assert_array_equal(
+                    build_planes(self.env.game_state), self.env.planes
+                )
+
+    def test_reset_withSeed_isDeterministic(self):
+        self.env.reset(seed=5)
+        first = [self.env.step(i % 4)[1:3] for i in range(50)]
+        self.env.reset(seed=5)
+        second = [self.env.step(i % 4)[1:3] for i in range(50)]
+        self.assertEqual(first, second)
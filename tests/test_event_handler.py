@@ -200,6 +200,15 @@ class EventHandlerShould(unittest.TestCase):
 
             mock_handle_direction_change.assert_called_once_with(pygame.K_RIGHT)
 
+    def test_handleKeyboard_callsHandleRewind_whenBKey(self):
+        mock_event = Mock()
+        mock_event.key = pygame.K_b
+
+        with patch.object(self.event_handler, "_handle_rewind") as mock_handle_rewind:
+            self.event_handler._handle_keyboard(mock_event)
+
+            mock_handle_rewind.assert_called_once()
+
     def test_handleKeyboard_callsHandleSpaceKey_whenSPACEKey(self):
         mock_event = Mock()
         mock_event.key = pygame.K_SPACE
@@ -273,6 +282,44 @@ class EventHandlerShould(unittest.TestCase):
 
         self.game_state.snake.change_direction.assert_called_once_with(c.RIGHT)
 
+    def test_handleDirectionChange_recordsDirection_whenAccepted(self):
+        self.event_handler.replay_recorder = Mock()
+        self.game_state.snake.change_direction.return_value = True
+
+        self.event_handler._handle_direction_change(pygame.K_w)
+
+        self.event_handler.replay_recorder.record_direction.assert_called_once_with(
+            c.UP
+        )
+
+    def test_handleDirectionChange_doesNotRecord_whenRejected(self):
+        self.event_handler.replay_recorder = Mock()
+        self.game_state.snake.change_direction.return_value = False
+
+        self.event_handler._handle_direction_change(pygame.K_w)
+
+        self.event_handler.replay_recorder.record_direction.assert_not_called()
+
+    def test_handleRewind_rewindsAndPausesGame(self):
+        self.game_state.start_screen = False
+        self.event_handler.rewind_buffer = Mock()
+        self.event_handler.rewind_buffer.rewind.return_value = 180
+
+        self.event_handler._handle_rewind()
+
+        self.event_handler.rewind_buffer.rewind.assert_called_once_with(
+            c.REWIND_SECONDS * 60
+        )
+        self.game_state.pause_game.assert_called_once()
+
+    def test_handleRewind_doesNothing_whenStartScreen(self):
+        self.game_state.start_screen = True
+        self.event_handler.rewind_buffer = Mock()
+
+        self.event_handler._handle_rewind()
+
+        self.event_handler.rewind_buffer.rewind.assert_not_called()
+
     def test_handleSpaceKey_pausesGame_whenNotPaused(self):
         self.game_state.paused = False
 
@@ -288,6 +335,16 @@ class EventHandlerShould(unittest.TestCase):
         self.game_state.start_game.assert_called_once()
         self.game_state.continue_game.assert_called_once()
 
+    def test_handleSpaceKey_startsRecording_whenStartScreen(self):
+        self.event_handler.replay_recorder = Mock()
+        self.game_state.start_screen = True
+
+        self.event_handler._handle_space_key()
+
+        self.event_handler.replay_recorder.start.assert_called_once_with(
+            self.game_state
+        )
+
     def test_handleSpaceKey_continuesGame_whenNotStartScreen(self):
         self.game_state.start_screen = False
 
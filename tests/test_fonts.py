@@ -0,0 +1,39 @@
+import unittest
+from unittest.mock import patch
+
+from src.ui.fonts import clear_font_caches, get_font, render_text
+
+
+class FontsShould(unittest.TestCase):
+    def setUp(self):
+        clear_font_caches()
+
+    def tearDown(self):
+        clear_font_caches()
+
+    def test_getFont_loadsFontOnce_perNameAndSize(self):
+        with patch("pygame.font.SysFont") as mock_font_class:
+            self.assertIs(get_font("arial", 14), get_font("arial", 14))
+            get_font("arial", 20)
+
+            self.assertEqual(mock_font_class.call_count, 2)
+
+    def test_renderText_rendersOnce_perTextColorAndAntialias(self):
+        with patch("pygame.font.SysFont") as mock_font_class:
+            render_text("arial", 14, "SCORE: 1", (0, 0, 0))
+            render_text("arial", 14, "SCORE: 1", (0, 0, 0))
+            render_text("arial", 14, "SCORE: 1", (0, 0, 1))
+            render_text("arial", 14, "SCORE: 1", (0, 0, 0), antialias=False)
+
+            mock_font_class.return_value.render.assert_any_call(
+                "SCORE: 1", False, (0, 0, 0)
+            )
+            self.assertEqual(mock_font_class.return_value.render.call_count, 3)
+
+    def test_clearFontCaches_forgetsFontsAndText(self):
+        with patch("pygame.font.SysFont") as mock_font_class:
+            render_text("arial", 14, "SNAKE", (0, 0, 0))
+            clear_font_caches()
+            render_text("arial", 14, "SNAKE", (0, 0, 0))
+
+            self.assertEqual(mock_font_class.call_count, 2)
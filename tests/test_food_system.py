@@ -1,13 +1,17 @@
 import unittest
 from unittest.mock import Mock, patch
 
+from src.core.board import Board
 from src.core.food_system import FoodSystem
 from src.utils import constants as c
+from src.utils.rng import Rng
 
 
 class FoodSystemShould(unittest.TestCase):
     def setUp(self):
+        self.board = Board()
         self.snake = Mock()
+        self.snake.board = self.board
         self.particle_system = Mock()
         self.food_system = FoodSystem(self.snake, self.particle_system)
 
@@ -20,6 +24,9 @@ class FoodSystemShould(unittest.TestCase):
     def test_init_setsNewFood(self):
         self.assertTrue(self.food_system.new_food)
 
+    def test_init_setsBoardFullToFalse(self):
+        self.assertFalse(self.food_system.board_full)
+
     def test_init_setsBonusFoodPos(self):
         self.assertIsNone(self.food_system.bonus_food_pos)
 
@@ -84,7 +91,7 @@ class FoodSystemShould(unittest.TestCase):
             mock_deactivate_bonus_food.assert_called_once()
 
     def test_handleBonusFood_returnsTrue_whenSnakeHeadPositionEqualsBonusFoodPos(self):
-        self.food_system._bonus_food_pos = [10, 10]
+        self.food_system._bonus_food_pos = (10, 10)
         self.snake.get_head_position.return_value = (10, 10)
 
         with patch.object(
@@ -97,7 +104,7 @@ class FoodSystemShould(unittest.TestCase):
     def test_handleBonusFood_returnsFalse_whenSnakeHeadPositionNotEqualsBonusFoodPos(
         self,
     ):
-        self.food_system._bonus_food_pos = [10, 10]
+        self.food_system._bonus_food_pos = (10, 10)
         self.snake.get_head_position.return_value = (10, 11)
 
         result = self.food_system._handle_bonus_food(None)
@@ -106,14 +113,14 @@ class FoodSystemShould(unittest.TestCase):
     def test_handleBonusFood_incrementsBonusFoodDurationTimer_whenSHPosNotEqualsBFPos(
         self,
     ):
-        self.food_system._bonus_food_pos = [10, 10]
+        self.food_system._bonus_food_pos = (10, 10)
         self.snake.get_head_position.return_value = (10, 11)
 
         self.food_system._handle_bonus_food(None)
         self.assertEqual(1, self.food_system.bonus_food_duration_timer)
 
     def test_collectBonusFood_callsParticleSystemSpawnParticles(self):
-        self.food_system._bonus_food_pos = [10, 10]
+        self.food_system._bonus_food_pos = (10, 10)
         tail = Mock()
 
         with (
@@ -128,7 +135,7 @@ class FoodSystemShould(unittest.TestCase):
             mock_spawn_particles.assert_called_once()
 
     def test_collectBonusFood_callsSnakeGrow(self):
-        self.food_system._bonus_food_pos = [10, 10]
+        self.food_system._bonus_food_pos = (10, 10)
         tail = Mock()
 
         with (
@@ -141,7 +148,7 @@ class FoodSystemShould(unittest.TestCase):
             mock_grow.assert_called_once_with(tail)
 
     def test_collectBonusFood_deactivatesBonusFood(self):
-        self.food_system._bonus_food_pos = [10, 10]
+        self.food_system._bonus_food_pos = (10, 10)
         tail = Mock()
 
         with (
@@ -216,39 +223,58 @@ class FoodSystemShould(unittest.TestCase):
             self.food_system.spawn_food()
             self.assertFalse(self.food_system.new_food)
 
-    def test_validateFoodPosition_returnsRandomPosition_whenPositionValid(self):
-        self.snake.positions = [(5, 5)]
-        random_pos = [3, 3]
+    def test_validateFoodPosition_returnsFreeCell(self):
+        result = self.food_system._validate_food_position()
+        self.assertTrue(self.board.is_free(result))
 
-        with patch("src.core.food_system.get_random_position", return_value=random_pos):
-            result = self.food_system._validate_food_position()
-            self.assertEqual(random_pos, result)
+    def test_validateFoodPosition_avoidsSnakeAndFood(self):
+        for x in range(1, c.GRID_SIZE - 1):
+            for y in range(1, c.GRID_SIZE - 1):
+                if (x, y) == (3, 3):
+                    continue
+                elif (x + y) % 2:
+                    self.board.add_snake((x, y))
+                else:
+                    self.board.set_flag((x, y), Board.BONUS_FOOD)
 
-    def test_validateFoodPosition_returnsDefaultPosition_whenMaxAttemptsReached(self):
-        self.snake.positions = [(1, 1)]
+        self.assertEqual((3, 3), self.food_system._validate_food_position())
 
-        with patch("src.core.food_system.get_random_position", return_value=[1, 1]):
-            result = self.food_system._validate_food_position()
-            self.assertEqual([1, 1], result)
+    def test_validateFoodPosition_returnsNone_whenBoardFull(self):
+        for x in range(1, c.GRID_SIZE - 1):
+            for y in range(1, c.GRID_SIZE - 1):
+                self.board.add_snake((x, y))
 
-    def test_validateFoodPosition_forBonusFood_avoidsSnakeAndFoodPos(self):
-        self.snake.positions = [(5, 5)]
-        self.food_system._food_pos = (2, 2)
-        random_pos = [3, 3]
+        self.assertIsNone(self.food_system._validate_food_position())
 
-        with patch("src.core.food_system.get_random_position", return_value=random_pos):
-            result = self.food_system._validate_food_position(bonus_food=True)
-            self.assertEqual(random_pos, result)
+    def test_spawnFood_setsBoardFull_whenNoFreeCellLeft(self):
+        with patch.object(
+            self.food_system, "_validate_food_position", return_value=None
+        ):
+            self.food_system.spawn_food()
+            self.assertTrue(self.food_system.board_full)
+            self.assertIsNone(self.food_system.food_pos)
 
-    def test_validateFoodPosition_forRegularFood_avoidsBonusFoodPos(self):
-        self.snake.positions = [(5, 5)]
-        self.food_system._bonus_food_active = True
-        self.food_system._bonus_food_pos = (2, 2)
-        random_pos = [3, 3]
+    def test_spawnBonusFood_staysInactive_whenNoFreeCellLeft(self):
+        with patch.object(
+            self.food_system, "_validate_food_position", return_value=None
+        ):
+            self.food_system._spawn_bonus_food()
+            self.assertFalse(self.food_system.bonus_food_active)
+            self.assertEqual(0, self.food_system.bonus_food_spawn_timer)
 
-        with patch("src.core.food_system.get_random_position", return_value=random_pos):
-            result = self.food_system._validate_food_position()
-            self.assertEqual(random_pos, result)
+    def test_spawnFood_marksFoodOnBoard(self):
+        with patch.object(
+            self.food_system, "_validate_food_position", return_value=(3, 3)
+        ):
+            self.food_system.spawn_food()
+            self.assertTrue(self.board.has_food((3, 3)))
+
+    def test_deactivateBonusFood_clearsBonusFoodFromBoard(self):
+        self.food_system._bonus_food_pos = (3, 3)
+        self.board.set_flag((3, 3), Board.BONUS_FOOD)
+
+        self.food_system.deactivate_bonus_food()
+        self.assertFalse(self.board.has_bonus_food((3, 3)))
 
     def test_deactivateBonusFood_setsBonusFoodActiveToFalse(self):
         self.food_system._bonus_food_active = True
@@ -257,7 +283,7 @@ class FoodSystemShould(unittest.TestCase):
         self.assertFalse(self.food_system.bonus_food_active)
 
     def test_deactivateBonusFood_setsBonusFoodPosToNone(self):
-        self.food_system._bonus_food_pos = [10, 10]
+        self.food_system._bonus_food_pos = (10, 10)
 
         self.food_system.deactivate_bonus_food()
         self.assertIsNone(self.food_system.bonus_food_pos)
@@ -269,7 +295,7 @@ class FoodSystemShould(unittest.TestCase):
         self.assertEqual(0, self.food_system.bonus_food_duration_timer)
 
     def test_reset_setsFoodPosToZeros(self):
-        self.food_system._food_pos = [10, 10]
+        self.food_system._food_pos = (10, 10)
 
         self.food_system.reset()
         self.assertEqual((0, 0), self.food_system.food_pos)
@@ -281,7 +307,7 @@ class FoodSystemShould(unittest.TestCase):
         self.assertTrue(self.food_system.new_food)
 
     def test_reset_setsBonusFoodPosToNone(self):
-        self.food_system._bonus_food_pos = [10, 10]
+        self.food_system._bonus_food_pos = (10, 10)
 
         self.food_system.reset()
         self.assertIsNone(self.food_system.bonus_food_pos)
@@ -303,3 +329,34 @@ class FoodSystemShould(unittest.TestCase):
 
         self.food_system.reset()
         self.assertFalse(self.food_system.bonus_food_active)
+
+    def test_foodPos_returnsSameObject_onRepeatedReads(self):
+        self.food_system._food_pos = (4, 4)
+        self.assertIs(self.food_system.food_pos, self.food_system.food_pos)
+
+    def test_skipFrames_matchesRepeatedUpdateBonusFood(self):
+        self.snake.board = Board(rng=Rng(0))
+        self.food_system = FoodSystem(self.snake, self.particle_system)
+        other_snake = Mock()
+        other_snake.board = Board(rng=Rng(0))
+        other_snake.get_head_position.return_value = (0, 0)
+        skipped = FoodSystem(other_snake, self.particle_system)
+        self.snake.get_head_position.return_value = (0, 0)
+
+        for frames in [1, 7, 1199, 250, 1, 49, 2000, 3]:
+            skipped.skip_frames(frames)
+            for _ in range(frames):
+                self.food_system.update_bonus_food(None)
+
+            self.assertEqual(
+                (
+                    self.food_system.bonus_food_pos,
+                    self.food_system.bonus_food_spawn_timer,
+                    self.food_system.bonus_food_duration_timer,
+                ),
+                (
+                    skipped.bonus_food_pos,
+                    skipped.bonus_food_spawn_timer,
+                    skipped.bonus_food_duration_timer,
+                ),
+            )
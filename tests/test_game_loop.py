@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import Mock, call, patch
 
 from src.core.game_loop import game_loop
+from src.utils import constants as c
 
 
 class GameLoopShould(unittest.TestCase):
@@ -26,7 +27,11 @@ class GameLoopShould(unittest.TestCase):
             game_loop(self.screen, self.game_state, self.clock)
 
             mock_eh_class.assert_called_once_with(self.game_state)
-            mock_renderer_class.assert_called_once_with(self.screen)
+            mock_renderer_class.assert_called_once_with(
+                self.screen,
+                dirty_rects=c.DIRTY_RECT_RENDERING,
+                grid_raster=c.GRID_RASTER_RENDERING,
+            )
 
     def test_gameLoop_callsRequiredMethodsInOrder(self):
         mock_event_handler = Mock()
@@ -1,7 +1,13 @@
+import os
+import random
+import subprocess
+import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from src.core.game_state import GameState
+from src.core.segment_snake import SegmentSnake
+from src.utils import constants as c
 
 
 class GameStateShould(unittest.TestCase):
@@ -14,6 +20,12 @@ class GameStateShould(unittest.TestCase):
     def test_init_createsSnake(self):
         self.assertIsNotNone(self.game_state.snake)
 
+    def test_init_createsBoardOfGivenSize(self):
+        game_state = GameState(board_size=50)
+
+        self.assertEqual(50, game_state.board.size)
+        self.assertEqual((25, 25), game_state.snake.get_head_position())
+
     def test_init_setsScoreToZero(self):
         self.assertEqual(0, self.game_state.score)
 
@@ -26,6 +38,25 @@ class GameStateShould(unittest.TestCase):
     def test_init_createsParticleSystem(self):
         self.assertIsNotNone(self.game_state.particle_system)
 
+    def test_init_usesGivenParticleSystem(self):
+        particle_system = Mock()
+        game_state = GameState(particle_system=particle_system)
+        self.assertIs(particle_system, game_state.particle_system)
+
+    def test_import_doesNotLoadPygame(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, src.core.game_state; print('pygame' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        self.assertEqual("False", result.stdout.strip())
+
     def test_init_createsFoodSystem(self):
         self.assertIsNotNone(self.game_state.food_system)
 
@@ -167,18 +198,17 @@ class GameStateShould(unittest.TestCase):
             self.assertFalse(self.game_state._check_wall_collision())
 
     def test_checkSelfCollision_returnsTrue_whenHeadPositionInSnakePositions(self):
-        self.game_state.snake._positions = ((10, 10), (11, 10), (10, 10))
-        with patch.object(
-            self.game_state.snake, "get_head_position", return_value=(10, 10)
-        ):
-            self.assertTrue(self.game_state._check_self_collision())
+        for tail in [(12, 10), (13, 10), (14, 10)]:
+            self.game_state.snake.grow(tail)
+        for direction in [c.UP, c.RIGHT, c.DOWN]:
+            self.game_state.snake.change_direction(direction)
+            self.game_state.snake.move()
+        self.assertTrue(self.game_state._check_self_collision())
 
     def test_checkSelfCollision_returnsFalse_whenHeadPositionNotInSnakePositions(self):
-        self.game_state.snake._positions = ((10, 10), (11, 10))
-        with patch.object(
-            self.game_state.snake, "get_head_position", return_value=(10, 11)
-        ):
-            self.assertFalse(self.game_state._check_self_collision())
+        self.game_state.snake.grow((12, 10))
+        self.game_state.snake.move()
+        self.assertFalse(self.game_state._check_self_collision())
 
     def test_handleFoodCollision_growsSnake(self):
         tail = (10, 10)
@@ -320,8 +350,211 @@ class GameStateShould(unittest.TestCase):
         self.game_state.reset()
         self.assertIsNotNone(self.game_state.snake)
 
+    def test_reset_keepsBoardSize(self):
+        game_state = GameState(board_size=50)
+
+        game_state.reset()
+
+        self.assertEqual(50, game_state.board.size)
+
     def test_reset_createNewFoodSystemAndResetsIt(self):
         with patch("src.core.game_state.FoodSystem") as mock_food_system:
             self.game_state.reset()
             mock_food_system.assert_called_once()
             mock_food_system().reset.assert_called_once()
+
+    def test_init_usesGivenSnakeClass(self):
+        game_state = GameState(snake_class=SegmentSnake)
+        self.assertIsInstance(game_state.snake, SegmentSnake)
+
+    def test_reset_keepsSnakeClass(self):
+        game_state = GameState(snake_class=SegmentSnake)
+        game_state.reset()
+        self.assertIsInstance(game_state.snake, SegmentSnake)
+
+    def test_step_movesSnakeExactlyOnce(self):
+        head_x, head_y = self.game_state.snake.get_head_position()
+        self.game_state.step()
+        self.assertEqual(
+            (head_x - 1, head_y), self.game_state.snake.get_head_position()
+        )
+
+    def test_step_appliesDirection(self):
+        head_x, head_y = self.game_state.snake.get_head_position()
+        self.game_state.step(c.UP)
+        self.assertEqual(
+            (head_x, head_y - 1), self.game_state.snake.get_head_position()
+        )
+
+    def test_step_spawnsFood(self):
+        self.game_state.step()
+        self.assertFalse(self.game_state.food_system.new_food)
+
+    def test_step_returnsRewardAndAteFood_whenFoodEaten(self):
+        self.game_state.food_system.spawn_food()
+        self.game_state.board.clear_flag(self.game_state.food_system.food_pos, 2)
+        self.game_state.food_system._food_pos = (9, 10)
+
+        result = self.game_state.step()
+
+        self.assertEqual(1, result.reward)
+        self.assertTrue(result.ate_food)
+        self.assertFalse(result.game_over)
+        self.assertEqual(3, len(self.game_state.snake.positions))
+
+    def test_step_returnsGameOver_whenSnakeHitsWall(self):
+        result = None
+        for _ in range(c.GRID_SIZE):
+            result = self.game_state.step()
+            if result.game_over:
+                break
+        self.assertTrue(result.game_over)
+        self.assertTrue(self.game_state.game_over)
+
+    def test_step_doesNothing_whenGameOver(self):
+        self.game_state._game_over = True
+        head = self.game_state.snake.get_head_position()
+
+        result = self.game_state.step()
+
+        self.assertEqual((0, True), (result.reward, result.game_over))
+        self.assertEqual(head, self.game_state.snake.get_head_position())
+
+    def test_step_matchesFrameByFrameUpdate_overRandomGames(self):
+        bonus_food_seen = False
+        for seed in range(5):
+            stepped = GameState(seed=seed)
+            updated = GameState(seed=seed)
+            updated.continue_game()
+            rng = random.Random(seed)
+
+            for _ in range(3000):
+                direction = _safe_direction(stepped, rng)
+
+                stepped.step(direction)
+
+                updated.snake.change_direction(direction)
+                while True:
+                    updated.update()
+                    updated.food_system.spawn_food()
+                    if updated._frame_count == 0 or updated.game_over:
+                        break
+
+                self.assertEqual(updated.snake.positions, stepped.snake.positions)
+                self.assertEqual(updated.score, stepped.score)
+                self.assertEqual(updated.game_over, stepped.game_over)
+                self.assertEqual(
+                    _food_state(updated.food_system), _food_state(stepped.food_system)
+                )
+                bonus_food_seen |= stepped.food_system.bonus_food_active
+                if stepped.game_over:
+                    break
+
+        self.assertTrue(bonus_food_seen)
+
+    def test_init_setsGameOverCauseToNone(self):
+        self.assertIsNone(self.game_state.game_over_cause)
+
+    def test_step_setsGameOverCause_whenSnakeHitsWall(self):
+        while not self.game_state.step(c.LEFT).game_over:
+            pass
+        self.assertEqual("wall", self.game_state.game_over_cause)
+
+    def test_step_setsGameOverCause_whenSnakeHitsItself(self):
+        for tail in [(12, 10), (13, 10), (14, 10)]:
+            self.game_state.snake.grow(tail)
+        for direction in [c.UP, c.RIGHT, c.DOWN]:
+            self.game_state.step(direction)
+        self.assertEqual("self", self.game_state.game_over_cause)
+
+    def test_reset_clearsGameOverCause(self):
+        self.game_state._game_over_cause = "wall"
+        self.game_state.reset()
+        self.assertIsNone(self.game_state.game_over_cause)
+
+    def test_init_withSameSeed_spawnsSameFood(self):
+        first, second = GameState(seed=5), GameState(seed=5)
+        for _ in range(3):
+            first.step()
+            second.step()
+        self.assertEqual(first.food_system.food_pos, second.food_system.food_pos)
+
+    def test_fromKeyframe_continuesLikeOriginal(self):
+        game_state = GameState(seed=2)
+        rng = random.Random(2)
+        for _ in range(200):
+            game_state.step(_safe_direction(game_state, rng))
+        restored = GameState.from_keyframe(game_state.keyframe())
+        self.assertEqual(game_state.keyframe(), restored.keyframe())
+
+        for _ in range(200):
+            direction = _safe_direction(game_state, rng)
+            self.assertEqual(game_state.step(direction), restored.step(direction))
+        self.assertEqual(
+            _food_state(game_state.food_system), _food_state(restored.food_system)
+        )
+        self.assertEqual(tuple(game_state.snake.positions), restored.snake.positions)
+
+    def test_clone_playsLikeOriginal(self):
+        game_state = GameState(seed=4)
+        rng = random.Random(4)
+        for _ in range(100):
+            game_state.step(_safe_direction(game_state, rng))
+        clone = game_state.clone()
+
+        for _ in range(300):
+            direction = _safe_direction(game_state, rng)
+            self.assertEqual(game_state.step(direction), clone.step(direction))
+        self.assertEqual(game_state.snake.positions, clone.snake.positions)
+        self.assertEqual(
+            _food_state(game_state.food_system), _food_state(clone.food_system)
+        )
+
+    def test_clone_leavesOriginalUntouched(self):
+        self.game_state.step()
+        snapshot = self.game_state.snapshot()
+        clone = self.game_state.clone()
+        for _ in range(c.GRID_SIZE):
+            clone.step(c.UP)
+        self.assertTrue(clone.game_over)
+        self.assertEqual(snapshot, self.game_state.snapshot())
+
+    def test_clone_doesNotNotifyEffects(self):
+        particle_system = Mock()
+        game_state = GameState(particle_system=particle_system)
+        self.assertIsNot(particle_system, game_state.clone().particle_system)
+
+    def test_restore_rewindsGame_anyNumberOfTimes(self):
+        game_state = GameState(seed=6)
+        rng = random.Random(6)
+        snapshot = game_state.snapshot()
+        directions = [_safe_direction(game_state, rng) for _ in range(50)]
+
+        results = []
+        for _ in range(2):
+            game_state.restore(snapshot)
+            results.append([game_state.step(direction) for direction in directions])
+            results.append(tuple(game_state.snake.positions))
+        self.assertEqual(results[:2], results[2:])
+
+
+def _safe_direction(game_state, rng):
+    directions = [c.UP, c.DOWN, c.LEFT, c.RIGHT]
+    rng.shuffle(directions)
+    head_x, head_y = game_state.snake.get_head_position()
+    for direction in directions:
+        if not game_state.board.is_lethal(
+            (head_x + direction[0], head_y + direction[1])
+        ):
+            return direction
+    return directions[0]
+
+
+def _food_state(food_system):
+    return (
+        food_system.food_pos,
+        food_system.bonus_food_pos,
+        food_system.bonus_food_active,
+        food_system.bonus_food_spawn_timer,
+        food_system.bonus_food_duration_timer,
+    )
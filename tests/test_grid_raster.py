@@ -0,0 +1,55 @@
+import unittest
+
+from src.core.game_state import GameState
+from src.ui.grid_raster import GridRaster
+from src.utils import constants as c
+
+
+class GridRasterShould(unittest.TestCase):
+    def setUp(self):
+        self.game_state = GameState(seed=3)
+        self.game_state.step(c.UP)
+        self.raster = GridRaster()
+
+    def _color_of(self, surface, cell):
+        return tuple(
+            surface.get_at(
+                (cell[0] * c.CELL_SIZE + c.CELL_SIZE // 2, cell[1] * c.CELL_SIZE)
+            )
+        )[:3]
+
+    def test_render_scalesBoardToWindow(self):
+        surface = self.raster.render(self.game_state.board)
+
+        self.assertEqual((c.WINDOW_SIZE, c.WINDOW_SIZE), surface.get_size())
+
+    def test_render_colorsCellsByContent(self):
+        surface = self.raster.render(self.game_state.board)
+
+        for cell in self.game_state.snake.positions:
+            self.assertEqual(c.PASTEL_GREEN, self._color_of(surface, cell))
+        self.assertEqual(
+            c.PASTEL_PINK,
+            self._color_of(surface, self.game_state.food_system.food_pos),
+        )
+
+    def test_render_colorsBonusFood(self):
+        food_system = self.game_state.food_system
+        food_system._bonus_food_spawn_timer = c.BONUS_FOOD_SPAWN_INTERVAL - 1
+        self.game_state.step(c.UP)
+
+        surface = self.raster.render(self.game_state.board)
+
+        self.assertTrue(food_system.bonus_food_active)
+        self.assertEqual(
+            c.MINT_GREEN, self._color_of(surface, food_system.bonus_food_pos)
+        )
+
+    def test_render_leavesFreeCellsInBackgroundColor(self):
+        surface = self.raster.render(self.game_state.board)
+        occupied = set(self.game_state.snake.positions)
+        occupied.add(self.game_state.food_system.food_pos)
+
+        for x in range(c.GRID_SIZE):
+            if (x, 0) not in occupied:
+                self.assertEqual(c.BACKGROUND, self._color_of(surface, (x, 0)))
@@ -1,15 +1,15 @@
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from src.effects.particle_system import ParticleSystem
 
+import pygame
 
-def create_fake_particle(x, y, color):
-    particle = Mock()
-    particle.x = x
-    particle.y = y
-    particle.color = color
-    return particle
+
+def hold_still(particle_system):
+    count = particle_system.count
+    particle_system._vx[:count] = 0
+    particle_system._vy[:count] = 0
 
 
 class ParticleSystemShould(unittest.TestCase):
@@ -23,29 +23,125 @@ class ParticleSystemShould(unittest.TestCase):
     def test_init_setsScreen(self):
         self.assertEqual(self.screen, self.particle_system.screen)
 
-    def test_init_setsParticles(self):
-        self.assertEqual([], self.particle_system.particles)
+    def test_init_startsWithoutParticles(self):
+        self.assertEqual(0, self.particle_system.count)
 
     def test_init_setsNumParticles(self):
         self.assertEqual(10, self.particle_system.num_particles)
 
-    def test_spawnParticles_addsParticlesToParticles(self):
+    def test_spawnParticles_addsParticles(self):
+        self.particle_system.spawn_particles(0, 0, (255, 255, 255))
+        self.assertEqual(10, self.particle_system.count)
+
+    def test_spawnParticles_drawsVelocitiesAndLifetimesInRange(self):
         self.particle_system.spawn_particles(0, 0, (255, 255, 255))
-        self.assertEqual(10, len(self.particle_system.particles))
+        count = self.particle_system.count
+
+        for velocities in [self.particle_system._vx, self.particle_system._vy]:
+            self.assertTrue(
+                ((velocities[:count] >= -2) & (velocities[:count] <= 2)).all()
+            )
+        lifetimes = self.particle_system._life[:count]
+        self.assertTrue(((lifetimes >= 30) & (lifetimes <= 60)).all())
+
+    def test_spawnParticles_growsBuffers_whenFull(self):
+        particle_system = ParticleSystem(self.screen, capacity=15)
+        particle_system.spawn_particles(1, 2, (255, 255, 255))
+        particle_system.spawn_particles(3, 4, (0, 0, 0))
+
+        self.assertEqual(20, particle_system.count)
+        self.assertEqual([1] * 10 + [3] * 10, particle_system._x[:20].tolist())
+        self.assertEqual([0] * 10 + [1] * 10, particle_system._color[:20].tolist())
+
+    def test_update_movesParticles(self):
+        self.particle_system.spawn_particles(10, 20, (255, 255, 255))
+        count = self.particle_system.count
+        vx = self.particle_system._vx[:count].copy()
+        vy = self.particle_system._vy[:count].copy()
+
+        self.particle_system.update()
+
+        self.assertEqual((10 + vx).tolist(), self.particle_system._x[:count].tolist())
+        self.assertEqual((20 + vy).tolist(), self.particle_system._y[:count].tolist())
 
     def test_update_removesDeadParticles(self):
-        self.particle_system.particles = [Mock(), Mock(), Mock()]
-        self.particle_system.particles[1].update.return_value = False
+        self.particle_system.spawn_particles(0, 0, (255, 255, 255))
+        self.particle_system._life[:3] = 1
+        self.particle_system._x[:10] = range(10)
+        hold_still(self.particle_system)
+
         self.particle_system.update()
-        self.assertEqual(2, len(self.particle_system.particles))
-
-    def test_draw_callsPygameDrawCircle(self):
-        self.particle_system.particles = [
-            create_fake_particle(0, 0, (255, 255, 255)),
-            create_fake_particle(0, 0, (255, 255, 255)),
-        ]
-        with patch(
-            "src.effects.particle_system.pygame.draw.circle"
-        ) as mock_draw_circle:
-            self.particle_system.draw()
-            self.assertEqual(2, mock_draw_circle.call_count)
+
+        self.assertEqual(7, self.particle_system.count)
+        self.assertEqual(list(range(3, 10)), self.particle_system._x[:7].tolist())
+
+    def test_update_removesAllParticles_afterLongestLifetime(self):
+        self.particle_system.spawn_particles(0, 0, (255, 255, 255))
+
+        for _ in range(60):
+            self.particle_system.update()
+
+        self.assertEqual(0, self.particle_system.count)
+
+    def test_draw_blitsAllParticlesInOneCall(self):
+        self.particle_system.spawn_particles(0, 0, (255, 255, 255))
+
+        self.particle_system.draw()
+
+        self.screen.blits.assert_called_once()
+        self.assertEqual(10, len(list(self.screen.blits.call_args[0][0])))
+
+    def test_draw_matchesDrawnCircle_atFullAlpha(self):
+        screen = pygame.Surface((20, 20))
+        screen.fill((10, 20, 30))
+        expected = screen.copy()
+        pygame.draw.circle(expected, (200, 100, 50), (7, 9), 2)
+        particle_system = ParticleSystem(screen)
+        particle_system.spawn_particles(7, 9, (200, 100, 50))
+
+        particle_system.draw()
+
+        self.assertEqual(
+            pygame.image.tobytes(expected, "RGB"), pygame.image.tobytes(screen, "RGB")
+        )
+
+    def test_draw_fadesParticles_withRemainingLifetime(self):
+        screen = pygame.Surface((20, 20))
+        screen.fill((0, 0, 0))
+        particle_system = ParticleSystem(screen)
+        particle_system.num_particles = 1
+        particle_system.spawn_particles(7, 9, (255, 255, 255))
+        particle_system._life[0] = 9
+        particle_system._initial_life[0] = 15
+        hold_still(particle_system)
+        particle_system.update()
+
+        particle_system.draw()
+
+        # 8 of 15 frames left blends the colour 8/15 of the way into the screen
+        self.assertAlmostEqual(136, screen.get_at((7, 9)).r, delta=1)
+        self.assertEqual((0, 0, 0, 255), screen.get_at((12, 9)))
+
+    def test_draw_drawsOnlyParticlesInView_relativeToIt(self):
+        self.particle_system.num_particles = 1
+        self.particle_system.spawn_particles(105, 210, (255, 255, 255))
+        self.particle_system.spawn_particles(0, 0, (255, 255, 255))
+        self.particle_system._life[:2] = 10
+        self.particle_system._initial_life[:2] = 10
+
+        self.particle_system.draw((100, 200, 50, 50))
+
+        blits = list(self.screen.blits.call_args[0][0])
+        self.assertEqual(1, len(blits))
+        self.assertEqual((5 - 2, 10 - 2), blits[0][1])
+
+    def test_getBounds_returnsNone_withoutParticles(self):
+        self.assertIsNone(self.particle_system.get_bounds())
+
+    def test_getBounds_coversAllParticles(self):
+        self.particle_system.num_particles = 2
+        self.particle_system.spawn_particles(10, 20, (255, 255, 255))
+        self.particle_system._x[1] = 30.5
+        self.particle_system._y[1] = 5.5
+
+        self.assertEqual((8, 3, 25, 20), self.particle_system.get_bounds())
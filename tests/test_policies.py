@@ -0,0 +1,31 @@
+import unittest
+
+from src.core.game_state import GameState
+from src.simulation.policies import greedy_policy
+from src.utils import constants as c
+
+
+class GreedyPolicyShould(unittest.TestCase):
+    def setUp(self):
+        self.game_state = GameState(seed=0)
+        self.game_state.food_system.spawn_food()
+
+    def _place_food(self, position):
+        self.game_state.board.clear_flag(self.game_state.food_system.food_pos, 2)
+        self.game_state.food_system._food_pos = position
+        self.game_state.board.set_flag(position, 2)
+
+    def test_greedyPolicy_movesTowardsFood(self):
+        self._place_food((10, 3))
+        self.assertEqual(c.UP, greedy_policy(self.game_state))
+
+    def test_greedyPolicy_neverReverses(self):
+        self._place_food((15, 10))
+        self.assertNotEqual(c.RIGHT, greedy_policy(self.game_state))
+
+    def test_greedyPolicy_avoidsWall(self):
+        self._place_food((5, 5))
+        for _ in range(10):
+            self.game_state.step(c.LEFT)
+        self.assertEqual((0, 10), self.game_state.snake.get_head_position())
+        self.assertNotEqual(c.LEFT, greedy_policy(self.game_state))
@@ -1,15 +1,25 @@
 import unittest
 from unittest.mock import Mock, patch
 
+from src.core.game_state import GameState
+from src.core.rewind import RewindBuffer
+from src.core.snake import Snake
+from src.effects.particle_system import ParticleSystem
+from src.ui.fonts import clear_font_caches
 from src.ui.renderer import Renderer
 from src.utils import constants as c
 
+import pygame
+
 
 class RendererShould(unittest.TestCase):
     def setUp(self):
+        clear_font_caches()
         self.screen = Mock()
         self.renderer = Renderer(self.screen)
         self.game_state = Mock()
+        self.game_state.board.size = c.GRID_SIZE
+        self.game_state.food_system.board_full = False
 
     def test_init_initializesSuccessfully(self):
         self.assertIsNotNone(self.renderer)
@@ -79,78 +89,31 @@ class RendererShould(unittest.TestCase):
             self.renderer.render(self.game_state)
             mock_draw_game_over.assert_called_once()
 
-    def test_drawSnake_drawsSnakeBody(self):
-        self.game_state.snake.get_snake_body_positions.return_value = [
-            (0, 0),
-            (1, 1),
-            (2, 2),
-        ]
-
-        with (
-            patch("src.ui.renderer.create_rectangle") as mock_create_rectangle,
-            patch.object(
-                self.renderer, "_get_eyes_positions", return_value=((0, 0), (1, 1))
-            ),
-            patch("pygame.draw.rect"),
-        ):
-            self.renderer._draw_snake(self.game_state.snake)
-            # 2 calls to create_rectangle for the body segments, 1 for the head
-            self.assertEqual(mock_create_rectangle.call_count, 3)
+    def test_drawSnake_drawsOneRectanglePerRun(self):
+        snake = Snake(positions=[(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)])
 
-    def test_getEyesPositions_returnsCorrectPositions_whenFacingLeft(self):
-        head = (100, 100)
-        direction = c.LEFT
-
-        expected_left_eye = (head[0] + c.EYE_DEPTH, head[1] - c.EYE_OFFSET_SIDE_FAR)
-        expected_right_eye = (head[0] + c.EYE_DEPTH, head[1] + c.EYE_OFFSET_SIDE_NEAR)
-
-        eyes = self.renderer._get_eyes_positions(head, direction)
-        self.assertEqual((expected_left_eye, expected_right_eye), eyes)
-
-    def test_getEyesPositions_returnsCorrectPositions_whenFacingRight(self):
-        head = (100, 100)
-        direction = c.RIGHT
-
-        expected_left_eye = (
-            head[0] + c.CELL_SIZE - c.EYE_DEPTH - c.EYE_SIZE,
-            head[1] - c.EYE_OFFSET_SIDE_FAR,
+        with patch("src.ui.renderer.create_rectangle") as mock_create_rectangle:
+            self.renderer._draw_snake(snake)
+
+        # the two straight runs, then the head over the first one
+        cell = c.CELL_SIZE
+        self.assertEqual(
+            [
+                (self.screen, c.PASTEL_GREEN, 0, 0, 3 * cell, cell),
+                (self.screen, c.PASTEL_GREEN, 2 * cell, 0, cell, 3 * cell),
+            ],
+            [call.args for call in mock_create_rectangle.call_args_list],
         )
-        expected_right_eye = (
-            head[0] + c.CELL_SIZE - c.EYE_DEPTH - c.EYE_SIZE,
-            head[1] + c.EYE_OFFSET_SIDE_NEAR,
+        self.screen.blit.assert_called_once_with(
+            *self.renderer._atlas.head((0, 0), c.LEFT)
         )
 
-        eyes = self.renderer._get_eyes_positions(head, direction)
-        self.assertEqual((expected_left_eye, expected_right_eye), eyes)
-
-    def test_getEyesPositions_returnsCorrectPositions_whenFacingUp(self):
-        head = (100, 100)
-        direction = c.UP
-
-        expected_left_eye = (head[0] + c.EYE_OFFSET_NEAR, head[1] - c.EYE_DEPTH_UP)
-        expected_right_eye = (head[0] + c.EYE_OFFSET_FAR, head[1] - c.EYE_DEPTH_UP)
-
-        eyes = self.renderer._get_eyes_positions(head, direction)
-        self.assertEqual((expected_left_eye, expected_right_eye), eyes)
-
-    def test_getEyesPositions_returnsCorrectPositions_whenFacingDown(self):
-        head = (100, 100)
-        direction = c.DOWN
-
-        expected_left_eye = (head[0] + c.EYE_OFFSET_NEAR, head[1] + c.EYE_DEPTH)
-        expected_right_eye = (head[0] + c.EYE_OFFSET_FAR, head[1] + c.EYE_DEPTH)
-
-        eyes = self.renderer._get_eyes_positions(head, direction)
-        self.assertEqual((expected_left_eye, expected_right_eye), eyes)
-
     def test_drawFood_drawsFood(self):
         food_pos = (0, 0)
 
-        with patch("src.ui.renderer.create_rectangle") as mock_create_rectangle:
-            self.renderer._draw_food(food_pos)
-            mock_create_rectangle.assert_called_once_with(
-                self.screen, (255, 198, 214), 0, 0, 20, 20
-            )
+        self.renderer._draw_food(food_pos)
+
+        self.screen.blit.assert_called_once_with(*self.renderer._atlas.food(food_pos))
 
     def test_drawGameOver_drawsGameOverScreen(self):
         with (
@@ -228,3 +191,325 @@ class RendererShould(unittest.TestCase):
                 midtop=(c.WINDOW_SIZE // 2, c.SCORE_PADDING)
             )
             mock_blit.assert_called_once_with(mock_score_surface, "score_rect")
+
+    def test_drawScore_rendersScoreOnlyOnce_whenScoreUnchanged(self):
+        with patch("pygame.font.SysFont") as mock_font_class:
+            for score in [1, 1, 1, 2, 2]:
+                self.renderer._draw_score(score)
+
+            mock_font_class.assert_called_once()
+            self.assertEqual(mock_font_class.return_value.render.call_count, 2)
+
+
+class DirtyRectRendererShould(unittest.TestCase):
+    def setUp(self):
+        clear_font_caches()
+        pygame.font.init()
+        self.screen = pygame.Surface((c.WINDOW_SIZE, c.WINDOW_SIZE))
+        self.renderer = Renderer(self.screen, dirty_rects=True)
+        self.particle_system = ParticleSystem(self.screen)
+        self.game_state = GameState(seed=7, particle_system=self.particle_system)
+        self.game_state.start_game()
+
+    def _render(self):
+        with (
+            patch("pygame.display.flip") as mock_flip,
+            patch("pygame.display.update") as mock_update,
+        ):
+            self.renderer.render(self.game_state)
+        return mock_flip, mock_update
+
+    def _full_render(self):
+        reference = pygame.Surface((c.WINDOW_SIZE, c.WINDOW_SIZE))
+        self.particle_system.screen = reference
+        with (
+            patch.object(self.particle_system, "update"),
+            patch("pygame.display.flip"),
+        ):
+            Renderer(reference).render(self.game_state)
+        self.particle_system.screen = self.screen
+        return pygame.image.tobytes(reference, "RGB")
+
+    def _towards_food(self):
+        head_x, head_y = self.game_state.snake.get_head_position()
+        food_x, food_y = self.game_state.food_system.food_pos
+        vertical = c.DOWN if food_y > head_y else c.UP
+        if food_x == head_x:
+            return vertical
+        horizontal = c.RIGHT if food_x > head_x else c.LEFT
+        if horizontal == (-self.game_state.snake.direction[0], 0):
+            return vertical
+        return horizontal
+
+    def test_render_flips_onFirstFrame(self):
+        mock_flip, mock_update = self._render()
+
+        mock_flip.assert_called_once()
+        mock_update.assert_not_called()
+
+    def test_render_updatesOnlyChangedCells_whenSnakeMoves(self):
+        self.game_state.step(c.UP)
+        self._render()
+        self.game_state.step(c.UP)
+
+        mock_flip, mock_update = self._render()
+
+        mock_flip.assert_not_called()
+        rects = mock_update.call_args[0][0]
+        self.assertLessEqual(len(rects), 4)
+        area = sum(rect.width * rect.height for rect in rects)
+        self.assertLess(area, 5 * c.CELL_SIZE * c.CELL_SIZE)
+
+    def test_render_skipsUpdate_whenNothingChanged(self):
+        self._render()
+
+        mock_flip, mock_update = self._render()
+
+        mock_flip.assert_not_called()
+        mock_update.assert_not_called()
+
+    def test_render_flips_whenGameOverCoversScreen(self):
+        self._render()
+        self.game_state._end_game("wall")
+
+        mock_flip, mock_update = self._render()
+
+        mock_flip.assert_called_once()
+        mock_update.assert_not_called()
+
+    def test_render_matchesFullRender_overGame(self):
+        for _ in range(600):
+            self.game_state.snake.change_direction(self._towards_food())
+            self.game_state.update()
+            self.game_state.food_system.spawn_food()
+            self._render()
+            self.assertEqual(
+                self._full_render(), pygame.image.tobytes(self.screen, "RGB")
+            )
+            if self.game_state.game_over:
+                break
+
+    def test_render_matchesFullRender_onGameOverAndStartScreen(self):
+        with patch("pygame.mouse.get_pos", return_value=(0, 0)):
+            self._render()
+            self.game_state._end_game("wall")
+            for _ in range(3):
+                self._render()
+                self.assertEqual(
+                    self._full_render(), pygame.image.tobytes(self.screen, "RGB")
+                )
+            self.game_state.exit_to_start_screen()
+            self._render()
+            self.assertEqual(
+                self._full_render(), pygame.image.tobytes(self.screen, "RGB")
+            )
+
+    def test_render_skipsUpdate_onStaticScreens(self):
+        with patch("pygame.mouse.get_pos", return_value=(0, 0)):
+            self.game_state._end_game("wall")
+            self._render()
+            mock_flip, mock_update = self._render()
+            mock_flip.assert_not_called()
+            mock_update.assert_not_called()
+
+            self.game_state.exit_to_start_screen()
+            self._render()
+            with patch("src.ui.renderer.draw_start_screen") as mock_draw_start_screen:
+                mock_flip, mock_update = self._render()
+            mock_draw_start_screen.assert_not_called()
+            mock_flip.assert_not_called()
+            mock_update.assert_not_called()
+
+    def test_render_repaintsConstantCells_whenLongSnakeMoves(self):
+        positions = tuple((x, 10) for x in range(3, 18))
+        self.game_state = GameState.from_keyframe(
+            self.game_state.keyframe()._replace(positions=positions),
+            particle_system=self.particle_system,
+        )
+        self._render()
+
+        atlas = self.renderer._atlas
+        with patch.object(atlas, "body", wraps=atlas.body) as mock_body:
+            self.game_state.step(c.UP)
+            self._render()
+
+        self.assertLessEqual(mock_body.call_count, 8)
+        self.assertEqual(self._full_render(), pygame.image.tobytes(self.screen, "RGB"))
+
+    def test_render_rebuildsSnake_afterRewindAndReset(self):
+        rewind_buffer = RewindBuffer()
+        rewind_buffer.record(self.game_state)
+        for _ in range(200):
+            self.game_state.snake.change_direction(self._towards_food())
+            self.game_state.update()
+            self.game_state.food_system.spawn_food()
+            rewind_buffer.record(self.game_state)
+            self._render()
+
+        rewind_buffer.rewind(90)
+        self._render()
+        self.assertEqual(self._full_render(), pygame.image.tobytes(self.screen, "RGB"))
+
+        self.game_state.reset()
+        self.game_state.food_system.spawn_food()
+        self._render()
+        self.assertEqual(self._full_render(), pygame.image.tobytes(self.screen, "RGB"))
+
+
+class GridRasterRendererShould(DirtyRectRendererShould):
+    def setUp(self):
+        super().setUp()
+        self.renderer = Renderer(self.screen, dirty_rects=True, grid_raster=True)
+        self.game_state.update()
+        self.game_state.food_system.spawn_food()
+
+    def test_render_updatesOnlyChangedCells_whenSnakeMoves(self):
+        self._render()
+        self.game_state.snake.change_direction(c.UP)
+
+        mock_flip, mock_update = self._render()
+
+        mock_flip.assert_not_called()
+        rects = mock_update.call_args[0][0]
+        self.assertLessEqual(len(rects), 2)
+
+    def test_render_repaintsConstantCells_whenLongSnakeMoves(self):
+        positions = tuple((x, 10) for x in range(3, 18))
+        self.game_state = GameState.from_keyframe(
+            self.game_state.keyframe()._replace(positions=positions),
+            particle_system=self.particle_system,
+        )
+        self._render()
+
+        atlas = self.renderer._atlas
+        with (
+            patch.object(atlas, "body", wraps=atlas.body) as mock_body,
+            patch.object(atlas, "head", wraps=atlas.head) as mock_head,
+        ):
+            self.game_state.step(c.UP)
+            self._render()
+
+        mock_body.assert_not_called()
+        mock_head.assert_called_once()
+        self.assertEqual(self._full_render(), pygame.image.tobytes(self.screen, "RGB"))
+
+
+class ViewportRendererShould(unittest.TestCase):
+    def setUp(self):
+        clear_font_caches()
+        pygame.font.init()
+        self.board_size = 3 * c.GRID_SIZE
+        self.screen = pygame.Surface((c.WINDOW_SIZE, c.WINDOW_SIZE))
+        self.renderer = Renderer(self.screen)
+        self.particle_system = ParticleSystem(self.screen)
+        # a long snake winding over the rows in the middle of the board
+        positions = tuple(
+            (x if row % 2 == 0 else self.board_size - 1 - x, 20 + row)
+            for row in range(12)
+            for x in range(2, self.board_size - 2)
+        )
+        game_state = GameState(seed=7, board_size=self.board_size)
+        self.game_state = GameState.from_keyframe(
+            game_state.keyframe()._replace(
+                positions=positions, food_pos=(40, 12), new_food=False
+            ),
+            particle_system=self.particle_system,
+            board_size=self.board_size,
+        )
+
+    def _render(self):
+        with patch("pygame.display.flip"):
+            self.renderer.render(self.game_state)
+
+    def _full_board_render(self):
+        size = self.board_size * c.CELL_SIZE
+        board_surface = pygame.Surface((size, size))
+        board_surface.fill(c.BACKGROUND)
+        atlas = self.renderer._atlas
+        snake = self.game_state.snake
+        snake_head, *snake_body = snake.get_snake_body_positions()
+        blits = [atlas.body(segment) for segment in snake_body]
+        blits.append(atlas.head(snake_head, snake.direction))
+        blits.append(atlas.food(self.game_state.food_system.food_pos))
+        board_surface.blits(blits, False)
+
+        view = board_surface.subsurface(self.renderer.camera.view).copy()
+        Renderer(view)._draw_score(self.game_state.score)
+        return pygame.image.tobytes(view, "RGB")
+
+    def test_render_followsHead(self):
+        self.game_state = GameState(seed=7, board_size=self.board_size)
+        self.game_state.start_game()
+
+        self._render()
+
+        head = self.game_state.snake.get_head_position()
+        camera = self.renderer.camera
+        self.assertEqual(
+            (head[0] - c.GRID_SIZE // 2, head[1] - c.GRID_SIZE // 2),
+            (camera.left, camera.top),
+        )
+
+    def test_render_matchesFullBoardRender_inView(self):
+        for direction in [c.UP] * 12 + [c.RIGHT] * 30 + [c.DOWN] * 10:
+            self.game_state.step(direction)
+            self._render()
+
+            self.assertEqual(
+                self._full_board_render(), pygame.image.tobytes(self.screen, "RGB")
+            )
+        camera = self.renderer.camera
+        self.assertEqual((22, 8), (camera.left, camera.top))
+
+    def test_render_drawsOnlyVisibleCells_withoutWalkingSnake(self):
+        snake = self.game_state.snake
+        atlas = self.renderer._atlas
+        with (
+            patch.object(atlas, "body", wraps=atlas.body) as mock_body,
+            patch.object(
+                snake, "get_snake_body_positions", wraps=snake.get_snake_body_positions
+            ) as mock_positions,
+            patch.object(
+                snake, "iter_segments", wraps=snake.iter_segments
+            ) as mock_segments,
+        ):
+            self._render()
+
+        self.assertLessEqual(mock_body.call_count, c.GRID_SIZE * c.GRID_SIZE)
+        self.assertLess(mock_body.call_count, len(snake.positions) // 2)
+        mock_positions.assert_not_called()
+        mock_segments.assert_not_called()
+
+    def test_render_drawsOnlyParticlesInView(self):
+        self._render()
+        camera = self.renderer.camera
+        self.particle_system.spawn_particles(*camera.view[:2], c.PASTEL_PINK)
+        self.particle_system.spawn_particles(0, 0, c.PASTEL_PINK)
+
+        self.particle_system.screen = Mock()
+        self._render()
+
+        blits = list(self.particle_system.screen.blits.call_args[0][0])
+        self.assertEqual(self.particle_system.num_particles, len(blits))
+
+    def test_render_composites_afterViewportGame(self):
+        self.renderer = Renderer(self.screen, dirty_rects=True)
+        self._render()
+        self.game_state = GameState(seed=7, particle_system=self.particle_system)
+        self.game_state.start_game()
+        self.game_state.food_system.spawn_food()
+
+        with (
+            patch("pygame.display.flip") as mock_flip,
+            patch("pygame.display.update"),
+        ):
+            self.renderer.render(self.game_state)
+
+        mock_flip.assert_called_once()
+        reference = pygame.Surface((c.WINDOW_SIZE, c.WINDOW_SIZE))
+        with patch("pygame.display.flip"):
+            Renderer(reference).render(self.game_state)
+        self.assertEqual(
+            pygame.image.tobytes(reference, "RGB"),
+            pygame.image.tobytes(self.screen, "RGB"),
+        )
@@ -0,0 +1,174 @@
+import os
+import tempfile
+import unittest
+
+from src.core.game_state import GameState
+from src.simulation.policies import greedy_policy
+from src.simulation.replay import (
+    PAUSE_TOGGLE,
+    Replayer,
+    ReplayRecorder,
+    decode_keyframe,
+    decode_replay,
+    encode_keyframe,
+    encode_replay,
+    load_replay,
+)
+from src.utils import constants as c
+
+
+def _fingerprint(game_state):
+    food_system = game_state.food_system
+    return (
+        game_state.score,
+        game_state.paused,
+        game_state.rng.getstate(),
+        tuple(game_state.snake.positions),
+        food_system.food_pos,
+        food_system.bonus_food_pos,
+        food_system.bonus_food_spawn_timer,
+        food_system.bonus_food_duration_timer,
+    )
+
+
+class ReplayShould(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Play a game with pauses the way the game loop does, remembering every frame
+        """
+        cls.base_path = tempfile.mkdtemp()
+        recorder = ReplayRecorder(cls.base_path, keyframe_interval=300)
+        game_state = GameState(seed=3)
+        game_state.start_game()
+        recorder.start(game_state)
+
+        cls.frames = [_fingerprint(game_state)]
+        cls.replay = None
+        while cls.replay is None:
+            game_state.update()
+            game_state.food_system.spawn_food()
+            cls.replay = recorder.tick()
+            cls.frames.append(_fingerprint(game_state))
+
+            if len(cls.frames) % 700 in (0, 40):
+                if game_state.paused:
+                    game_state.continue_game()
+                else:
+                    game_state.pause_game()
+                recorder.record_paused(game_state.paused)
+            direction = greedy_policy(game_state)
+            if game_state.snake.change_direction(direction):
+                recorder.record_direction(direction)
+        cls.game_state = game_state
+
+    def test_recorder_leavesGameUnchanged(self):
+        game_state = GameState(seed=3)
+        game_state.start_game()
+
+        for frame, recorded in enumerate(self.frames[1:], 2):
+            game_state.update()
+            game_state.food_system.spawn_food()
+            self.assertEqual(recorded, _fingerprint(game_state))
+
+            if frame % 700 in (0, 40):
+                if game_state.paused:
+                    game_state.continue_game()
+                else:
+                    game_state.pause_game()
+            game_state.snake.change_direction(greedy_policy(game_state))
+
+    def test_recorder_savesReplayWhenGameEnds(self):
+        (filename,) = os.listdir(self.base_path)
+        replay = load_replay(os.path.join(self.base_path, filename))
+        self.assertEqual(self.replay, replay)
+
+    def test_recorder_recordsPauses(self):
+        codes = [code for _, code in self.replay.events]
+        self.assertIn(PAUSE_TOGGLE, codes)
+
+    def test_encodeReplay_roundTrips(self):
+        self.assertEqual(self.replay, decode_replay(encode_replay(self.replay)))
+
+    def test_encodeReplay_fitsTenMinutesInAFewKilobytes(self):
+        ten_minutes = 10 * 60 * 60
+        size = len(encode_replay(self.replay)) * ten_minutes / self.replay.frames
+        self.assertLess(size, 8 * 1024)
+
+    def test_decodeReplay_raisesError_whenNotReplay(self):
+        with self.assertRaises(ValueError):
+            decode_replay(b"PNG" + bytes(20))
+
+    def test_encodeKeyframe_roundTrips(self):
+        keyframe = self.game_state.keyframe()
+        self.assertEqual(keyframe, decode_keyframe(encode_keyframe(keyframe)))
+
+    def test_seek_reachesGameOver(self):
+        game_state = Replayer(self.replay).seek(self.replay.frames)
+        self.assertEqual(self.frames[-1], _fingerprint(game_state))
+        self.assertEqual(self.game_state.game_over_cause, game_state.game_over_cause)
+
+    def test_seek_matchesEveryFrame_inAnyOrder(self):
+        replayer = Replayer(self.replay)
+        frames = list(range(0, self.replay.frames + 1, 37))
+        for frame in frames + frames[::-1]:
+            self.assertEqual(self.frames[frame], _fingerprint(replayer.seek(frame)))
+
+    def test_seek_raisesError_whenFrameOutsideReplay(self):
+        with self.assertRaises(ValueError):
+            Replayer(self.replay).seek(self.replay.frames + 1)
+
+    def test_seek_matchesEveryFrame_onLargerBoard(self):
+        recorder = ReplayRecorder(self.base_path, keyframe_interval=100)
+        game_state = GameState(seed=5, board_size=c.GRID_SIZE + 10)
+        game_state.start_game()
+        recorder.start(game_state)
+        frames = [_fingerprint(game_state)]
+        replay = None
+        while replay is None and len(frames) <= 1000:
+            game_state.update()
+            game_state.food_system.spawn_food()
+            replay = recorder.tick()
+            frames.append(_fingerprint(game_state))
+            direction = greedy_policy(game_state)
+            if game_state.snake.change_direction(direction):
+                recorder.record_direction(direction)
+        replay = replay or recorder.finish()
+
+        replayer = Replayer(replay)
+        self.assertEqual(c.GRID_SIZE + 10, replayer.game_state.board.size)
+        self.assertGreater(len(replay.keyframes), 2)
+        for frame in reversed(range(0, replay.frames + 1, 37)):
+            self.assertEqual(frames[frame], _fingerprint(replayer.seek(frame)))
+
+
+class ReplayRecorderShould(unittest.TestCase):
+    def setUp(self):
+        self.recorder = ReplayRecorder(tempfile.mkdtemp())
+        self.game_state = GameState(seed=1)
+        self.game_state.start_game()
+
+    def test_recordDirection_ignoresInput_whenNotRecording(self):
+        self.recorder.record_direction(c.UP)
+        self.recorder.start(self.game_state)
+        self.assertEqual((), self.recorder.finish().events)
+
+    def test_recordPaused_recordsOnlyChanges(self):
+        self.recorder.start(self.game_state)
+        self.recorder.record_paused(False)
+        self.recorder.record_paused(True)
+        self.recorder.record_paused(True)
+        self.assertEqual(((0, PAUSE_TOGGLE),), self.recorder.finish().events)
+
+    def test_cancel_stopsRecording(self):
+        self.recorder.start(self.game_state)
+        self.recorder.cancel()
+        self.assertFalse(self.recorder.recording)
+        self.assertIsNone(self.recorder.tick())
+
+    def test_tick_storesKeyframeEveryInterval(self):
+        recorder = ReplayRecorder(keyframe_interval=2)
+        recorder.start(self.game_state)
+        for _ in range(5):
+            recorder.tick()
+        self.assertEqual(2, len(recorder.finish().keyframes))
@@ -0,0 +1,133 @@
+import unittest
+
+from src.core.game_state import GameState
+from src.core.rewind import RewindBuffer
+from src.core.segment_snake import SegmentSnake
+from src.simulation.policies import greedy_policy
+
+
+def _fingerprint(game_state):
+    return (
+        game_state.score,
+        game_state.game_over,
+        game_state.paused,
+        game_state.rng.getstate(),
+        game_state.snake.direction,
+        tuple(game_state.snake.positions),
+        game_state.food_system.snapshot(),
+        game_state.board.snapshot()[0],
+    )
+
+
+def _play(game_state, rewind_buffer, frames):
+    """
+    Play frames the way the game loop does, returning the state after each one
+    """
+    history = []
+    for _ in range(frames):
+        game_state.update()
+        game_state.food_system.spawn_food()
+        rewind_buffer.record(game_state)
+        history.append(_fingerprint(game_state))
+        game_state.snake.change_direction(greedy_policy(game_state))
+    return history
+
+
+class RewindBufferShould(unittest.TestCase):
+    def setUp(self):
+        self.game_state = GameState(seed=8)
+        self.game_state.start_game()
+        self.rewind_buffer = RewindBuffer(capacity=600, keyframe_interval=60)
+        self.rewind_buffer.record(self.game_state)
+        self.history = [_fingerprint(self.game_state)]
+        self.history += _play(self.game_state, self.rewind_buffer, 3000)
+
+    def test_record_keepsOnlyCapacityFrames(self):
+        self.assertEqual(600, self.rewind_buffer.available)
+
+    def test_stepBack_undoesEachFrame(self):
+        for frame in range(2999, 2399, -1):
+            self.assertTrue(self.rewind_buffer.step_back())
+            self.assertEqual(self.history[frame], _fingerprint(self.game_state))
+        self.assertFalse(self.rewind_buffer.step_back())
+
+    def test_rewind_restoresEarlierFrame(self):
+        for frames in [1, 59, 60, 130, 200]:
+            self.assertEqual(frames, self.rewind_buffer.rewind(frames))
+            self.assertEqual(
+                self.history[len(self.history) - 1 - frames],
+                _fingerprint(self.game_state),
+            )
+            self.history = self.history[: len(self.history) - frames]
+
+    def test_rewind_stopsAtOldestFrame(self):
+        self.assertEqual(600, self.rewind_buffer.rewind(10_000))
+        self.assertEqual(self.history[2400], _fingerprint(self.game_state))
+
+    def test_record_continuesAfterRewind(self):
+        self.rewind_buffer.rewind(100)
+        self.history = self.history[:-100]
+        self.history += _play(self.game_state, self.rewind_buffer, 50)
+        self.rewind_buffer.rewind(120)
+        self.assertEqual(self.history[-121], _fingerprint(self.game_state))
+
+    def test_record_startsOver_whenGameReset(self):
+        self.game_state.reset()
+        self.rewind_buffer.record(self.game_state)
+        self.assertEqual(0, self.rewind_buffer.available)
+
+    def test_rewind_undoesGameOver(self):
+        game_state = GameState(seed=1)
+        game_state.start_game()
+        rewind_buffer = RewindBuffer()
+        rewind_buffer.record(game_state)
+        while not game_state.game_over:
+            game_state.update()
+            game_state.food_system.spawn_food()
+            rewind_buffer.record(game_state)
+        rewind_buffer.rewind(1)
+        self.assertFalse(game_state.game_over)
+
+    def test_rewind_reachesPlay_afterPausingLongerThanWindow(self):
+        self.game_state.pause_game()
+        paused = _fingerprint(self.game_state)
+        for _ in range(2 * 600):
+            self.game_state.update()
+            self.game_state.food_system.spawn_food()
+            self.rewind_buffer.record(self.game_state)
+
+        # the pause itself is one frame, the others are play before it
+        self.assertEqual(60, self.rewind_buffer.rewind(60))
+
+        self.assertNotEqual(paused, _fingerprint(self.game_state))
+        self.assertEqual(self.history[-60], _fingerprint(self.game_state))
+
+    def test_rewind_reachesPlay_afterWaitingAtGameOver(self):
+        game_state = GameState(seed=1)
+        game_state.start_game()
+        rewind_buffer = RewindBuffer(capacity=600)
+        rewind_buffer.record(game_state)
+        while not game_state.game_over:
+            game_state.update()
+            game_state.food_system.spawn_food()
+            rewind_buffer.record(game_state)
+        positions = tuple(game_state.snake.positions)
+        for _ in range(2 * 600):
+            game_state.update()
+            game_state.food_system.spawn_food()
+            rewind_buffer.record(game_state)
+
+        rewind_buffer.rewind(60)
+
+        self.assertFalse(game_state.game_over)
+        self.assertNotEqual(positions, tuple(game_state.snake.positions))
+
+    def test_stepBack_worksWithSegmentSnake(self):
+        game_state = GameState(snake_class=SegmentSnake, seed=8)
+        game_state.start_game()
+        rewind_buffer = RewindBuffer()
+        rewind_buffer.record(game_state)
+        history = [_fingerprint(game_state)]
+        history += _play(game_state, rewind_buffer, 500)
+        rewind_buffer.rewind(500)
+        self.assertEqual(history[0], _fingerprint(game_state))
@@ -0,0 +1,35 @@
+import unittest
+
+from src.utils.rng import Rng, derive_seed
+
+
+class RngShould(unittest.TestCase):
+    def test_init_withSameSeed_producesSameSequence(self):
+        first, second = Rng(42), Rng(42)
+        self.assertEqual(
+            [first.next_u64() for _ in range(5)], [second.next_u64() for _ in range(5)]
+        )
+
+    def test_init_withDifferentSeeds_producesDifferentSequences(self):
+        self.assertNotEqual(Rng(1).next_u64(), Rng(2).next_u64())
+
+    def test_randrange_returnsValuesInRange(self):
+        rng = Rng(0)
+        values = {rng.randrange(7) for _ in range(1000)}
+        self.assertEqual(set(range(7)), values)
+
+    def test_setstate_restoresSequence(self):
+        rng = Rng(3)
+        state = rng.getstate()
+        expected = [rng.next_u64() for _ in range(3)]
+        rng.setstate(state)
+        self.assertEqual(expected, [rng.next_u64() for _ in range(3)])
+
+
+class DeriveSeedShould(unittest.TestCase):
+    def test_deriveSeed_isDeterministic(self):
+        self.assertEqual(derive_seed(1, 2, 3), derive_seed(1, 2, 3))
+
+    def test_deriveSeed_dependsOnEveryKey(self):
+        seeds = {derive_seed(1, 2, 3), derive_seed(1, 3, 2), derive_seed(2, 2, 3)}
+        self.assertEqual(3, len(seeds))
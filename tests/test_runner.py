@@ -0,0 +1,46 @@
+import unittest
+
+from src.simulation.policies import greedy_policy
+from src.simulation.runner import GameRecord, Report, play_game, run, run_chunk
+
+
+class RunnerShould(unittest.TestCase):
+    def test_playGame_isDeterministicForSeed(self):
+        self.assertEqual(play_game(7, 500), play_game(7, 500))
+
+    def test_playGame_recordsCauseOfDeath(self):
+        record = play_game(7, 10_000)
+        self.assertIn(record.cause, ["wall", "self", "board_full"])
+        self.assertGreater(record.moves, 0)
+
+    def test_playGame_cutsOffAtMaxMoves(self):
+        record = play_game(7, 3)
+        self.assertEqual((3, "max_moves"), (record.moves, record.cause))
+
+    def test_runChunk_givesEveryGameItsOwnSeed(self):
+        records = run_chunk(0, 0, 5, 10, greedy_policy)
+        self.assertEqual(5, len({record.seed for record in records}))
+
+    def test_run_givesSameReport_forAnyWorkersAndChunkSize(self):
+        single = run(12, workers=1, chunk_size=5, seed=3, max_moves=300)
+        pooled = run(12, workers=2, chunk_size=2, seed=3, max_moves=300)
+        self.assertEqual(12, pooled.games)
+        self.assertEqual(single.scores, pooled.scores)
+        self.assertEqual(single.causes, pooled.causes)
+
+
+class ReportShould(unittest.TestCase):
+    def setUp(self):
+        self.report = Report()
+        for score in [1, 2, 3, 10]:
+            self.report.add(GameRecord(0, score, score + 2, score * 10, "wall"))
+
+    def test_add_countsGames(self):
+        self.assertEqual(4, self.report.games)
+        self.assertEqual(4, self.report.causes["wall"])
+
+    def test_summary_includesStatistics(self):
+        summary = self.report.summary()
+        self.assertIn("games: 4", summary)
+        self.assertIn("mean     4.00", summary)
+        self.assertIn("death by wall", summary)
@@ -0,0 +1,124 @@
+import random
+import unittest
+
+from src.core.board import Board
+from src.core.segment_snake import SegmentSnake
+from src.core.snake import Snake
+from src.utils import constants as c
+
+
+class SegmentSnakeShould(unittest.TestCase):
+    def setUp(self):
+        self.snake = SegmentSnake()
+
+    def test_init_setsPositions(self):
+        self.assertEqual(((10, 10), (11, 10)), self.snake.positions)
+
+    def test_init_setsCorners(self):
+        self.assertEqual(((10, 10), (11, 10)), self.snake.corners)
+
+    def test_init_marksPositionsOnBoard(self):
+        self.assertEqual(1, self.snake.board.snake_count((10, 10)))
+        self.assertEqual(1, self.snake.board.snake_count((11, 10)))
+
+    def test_getHeadPosition_returnsHeadPosition(self):
+        self.assertEqual((10, 10), self.snake.get_head_position())
+
+    def test_getTailPosition_returnsTailPosition(self):
+        self.assertEqual((11, 10), self.snake.get_tail_position())
+
+    def test_getSnakeBodyPositions_returnsBodyPositions(self):
+        self.assertEqual(
+            ((200, 200), (220, 200)), self.snake.get_snake_body_positions()
+        )
+
+    def test_move_returnsTail(self):
+        self.assertEqual((11, 10), self.snake.move())
+
+    def test_move_straight_keepsTwoCorners(self):
+        self.snake.grow(self.snake.move())
+        self.snake.grow(self.snake.move())
+        self.snake.move()
+        self.assertEqual(((7, 10), (10, 10)), self.snake.corners)
+
+    def test_move_afterTurn_addsCorner(self):
+        self.snake.grow(self.snake.move())
+        self.snake.change_direction(c.UP)
+        self.snake.move()
+        self.assertEqual(((9, 9), (9, 10), (10, 10)), self.snake.corners)
+
+    def test_move_dropsCorner_whenTailReachesIt(self):
+        self.snake.change_direction(c.UP)
+        self.snake.move()
+        self.snake.move()
+        self.assertEqual(((10, 8), (10, 9)), self.snake.corners)
+
+    def test_move_releasesVacatedTailCell(self):
+        self.snake.move()
+        self.assertFalse(self.snake.occupies((11, 10)))
+        self.assertTrue(self.snake.occupies((9, 10)))
+
+    def test_grow_extendsTailRun(self):
+        self.snake.grow((12, 10))
+        self.assertEqual(((10, 10), (12, 10)), self.snake.corners)
+
+    def test_grow_addsCorner_whenTailTurns(self):
+        self.snake.grow((11, 11))
+        self.assertEqual(((10, 10), (11, 10), (11, 11)), self.snake.corners)
+
+    def test_iterSegments_returnsRunsBetweenCorners(self):
+        self.snake.grow((11, 11))
+        self.assertEqual(
+            [((10, 10), (11, 10)), ((11, 10), (11, 11))],
+            list(self.snake.iter_segments()),
+        )
+
+    def test_init_withPositions_keepsOnlyCorners(self):
+        positions = [(3, 3), (3, 4), (3, 5), (4, 5), (5, 5), (5, 6)]
+        snake = SegmentSnake(Board(), positions)
+        self.assertEqual(((3, 3), (3, 5), (5, 5), (5, 6)), snake.corners)
+        self.assertEqual(tuple(positions), snake.positions)
+
+    def test_retractHead_dropsHeadCorner_whenRunUsedUp(self):
+        self.snake.change_direction(c.UP)
+        tail = self.snake.move()
+        self.snake.retract_head()
+        self.snake.grow(tail)
+        self.assertEqual(((10, 10), (11, 10)), self.snake.corners)
+
+    def test_copy_keepsCornersAndClass(self):
+        self.snake.grow((11, 11))
+        copy = self.snake.copy(self.snake.board.copy())
+        self.assertIsInstance(copy, SegmentSnake)
+        self.assertEqual(self.snake.corners, copy.corners)
+
+    def test_hasSelfCollision_returnsTrue_whenHeadOverlapsBody(self):
+        for tail in [(12, 10), (13, 10), (14, 10)]:
+            self.snake.grow(tail)
+        for direction in [c.UP, c.RIGHT, c.DOWN]:
+            self.snake.change_direction(direction)
+            self.snake.move()
+        self.assertTrue(self.snake.has_self_collision())
+
+    def test_move_matchesSnake_overRandomGame(self):
+        rng = random.Random(7)
+        segment_snake = SegmentSnake(Board(size=40))
+        snake = Snake(Board(size=40))
+
+        for _ in range(500):
+            direction = rng.choice([c.UP, c.DOWN, c.LEFT, c.RIGHT])
+            segment_snake.change_direction(direction)
+            snake.change_direction(direction)
+            head = snake._get_next_head_position()
+            if not 0 <= head[0] < 40 or not 0 <= head[1] < 40:
+                continue
+
+            segment_tail = segment_snake.move()
+            tail = snake.move()
+            self.assertEqual(tail, segment_tail)
+            if rng.random() < 0.2:
+                segment_snake.grow(segment_tail)
+                snake.grow(tail)
+            self.assertEqual(snake.positions, segment_snake.positions)
+
+        self.assertEqual(snake.board._cells, segment_snake.board._cells)
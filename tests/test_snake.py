@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch
 
+from src.core.board import Board
 from src.core.snake import Snake
 from src.utils import constants as c
 
@@ -97,3 +98,86 @@ class SnakeShould(unittest.TestCase):
         self.snake.change_direction(c.UP)
         self.snake.change_direction(c.RIGHT)
         self.assertEqual(c.UP, self.snake.direction)
+
+    def test_occupies_returnsTrue_forBodyCell(self):
+        self.assertTrue(self.snake.occupies((11, 10)))
+
+    def test_occupies_returnsFalse_forFreeCell(self):
+        self.assertFalse(self.snake.occupies((12, 10)))
+
+    def test_move_releasesVacatedTailCell(self):
+        self.snake.move()
+        self.assertFalse(self.snake.occupies((11, 10)))
+        self.assertTrue(self.snake.occupies((9, 10)))
+
+    def test_grow_occupiesTailCell(self):
+        tail = self.snake.move()
+        self.snake.grow(tail)
+        self.assertTrue(self.snake.occupies(tail))
+
+    def test_hasSelfCollision_returnsFalse_whenHeadIsAlone(self):
+        self.assertFalse(self.snake.has_self_collision())
+
+    def test_hasSelfCollision_returnsTrue_whenHeadOverlapsBody(self):
+        for tail in [(12, 10), (13, 10), (14, 10)]:
+            self.snake.grow(tail)
+        for direction in [c.UP, c.RIGHT, c.DOWN]:
+            self.snake.change_direction(direction)
+            self.snake.move()
+        self.assertTrue(self.snake.has_self_collision())
+
+    def test_init_marksPositionsOnBoard(self):
+        board = Board()
+        Snake(board)
+        self.assertEqual(1, board.snake_count((10, 10)))
+        self.assertEqual(1, board.snake_count((11, 10)))
+
+    def test_init_withPositions_placesBodyOnBoard(self):
+        board = Board()
+        snake = Snake(board, [(3, 3), (3, 4), (4, 4)])
+        self.assertEqual((3, 3), snake.get_head_position())
+        self.assertEqual((4, 4), snake.get_tail_position())
+        self.assertEqual(1, board.snake_count((3, 4)))
+
+    def test_retractHead_undoesMove(self):
+        tail = self.snake.move()
+        self.snake.retract_head()
+        self.snake.grow(tail)
+        self.assertEqual(((10, 10), (11, 10)), self.snake.positions)
+        self.assertEqual(0, self.snake.board.snake_count((9, 10)))
+
+    def test_restore_keepsPositionsViewLive(self):
+        positions = self.snake.positions
+        snapshot = self.snake.snapshot()
+        self.snake.grow((12, 10))
+        self.snake.change_direction(c.UP)
+        self.snake.restore(snapshot)
+        self.assertEqual(((10, 10), (11, 10)), positions)
+        self.assertEqual(c.LEFT, self.snake.direction)
+
+    def test_iterSegments_returnsSingleRun_whenStraight(self):
+        self.snake.grow((12, 10))
+        self.assertEqual([((10, 10), (12, 10))], list(self.snake.iter_segments()))
+
+    def test_iterSegments_splitsRunsAtTurns(self):
+        self.snake.grow((11, 11))
+        self.assertEqual(
+            [((10, 10), (11, 10)), ((11, 10), (11, 11))],
+            list(self.snake.iter_segments()),
+        )
+
+    def test_positions_returnsSameView_afterMove(self):
+        positions = self.snake.positions
+        self.snake.move()
+        self.assertIs(positions, self.snake.positions)
+        self.assertEqual(((9, 10), (10, 10)), positions)
+
+    def test_positions_cannotBeModified(self):
+        with self.assertRaises(TypeError):
+            self.snake.positions[0] = (0, 0)
+
+    def test_positions_slice_returnsTuple(self):
+        self.assertEqual(((11, 10),), self.snake.positions[1:])
+
+    def test_getTailPosition_returnsTailPosition(self):
+        self.assertEqual((11, 10), self.snake.get_tail_position())
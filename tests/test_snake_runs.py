@@ -0,0 +1,148 @@
+import unittest
+from unittest.mock import patch
+
+from src.core.segment_snake import SegmentSnake
+from src.core.snake import Snake
+from src.ui.renderer import Renderer
+from src.ui.snake_runs import SnakeRuns
+from src.utils import constants as c
+
+import pygame
+
+
+def _serpentine(snake, moves):
+    """
+    Drive a snake along the rows of the board, turning down at the walls and
+    growing every few moves, and yield after every move
+    """
+    horizontal = snake.direction
+    for move in range(moves):
+        head = snake.get_head_position()
+        if snake.direction in (c.LEFT, c.RIGHT):
+            if not 0 <= head[0] + snake.direction[0] < snake.board.size:
+                horizontal = snake.direction
+                snake.change_direction(c.DOWN)
+        else:
+            snake.change_direction((-horizontal[0], 0))
+        tail = snake.move()
+        if move % 3 == 0:
+            snake.grow(tail)
+        yield
+
+
+class SnakeRunsShould(unittest.TestCase):
+    def setUp(self):
+        self.runs = SnakeRuns()
+
+    def test_rects_mergesCollinearCells(self):
+        snake = Snake(positions=[(5, 5), (6, 5), (7, 5), (7, 6), (7, 7), (6, 7)])
+
+        self.runs.update(snake)
+
+        cell = c.CELL_SIZE
+        self.assertEqual(
+            [
+                pygame.Rect(5 * cell, 5 * cell, 3 * cell, cell),
+                pygame.Rect(7 * cell, 5 * cell, cell, 3 * cell),
+                pygame.Rect(6 * cell, 7 * cell, 2 * cell, cell),
+            ],
+            self.runs.rects(),
+        )
+
+    def test_rects_coversSingleCellSnake(self):
+        self.runs.update(Snake(positions=[(3, 4)]))
+
+        self.assertEqual(
+            [pygame.Rect(3 * c.CELL_SIZE, 4 * c.CELL_SIZE, c.CELL_SIZE, c.CELL_SIZE)],
+            self.runs.rects(),
+        )
+
+    def test_update_matchesSegments_afterEveryMove(self):
+        for snake in [Snake(), SegmentSnake()]:
+            self.runs = SnakeRuns()
+            for _ in _serpentine(snake, 120):
+                self.runs.update(snake)
+                segments = list(snake.iter_segments())
+                self.assertEqual(
+                    (segments[0][0], *(end for _, end in segments)), self.runs.corners
+                )
+
+    def test_update_followsMovesWithoutRebuilding(self):
+        snake = Snake()
+        self.runs.update(snake)
+
+        with patch.object(SnakeRuns, "_rebuild") as mock_rebuild:
+            for _ in _serpentine(snake, 60):
+                self.runs.update(snake)
+
+        mock_rebuild.assert_not_called()
+
+    def test_update_rebuilds_whenSnakeChangedByMoreThanOneMove(self):
+        snake = Snake()
+        self.runs.update(snake)
+        for _ in _serpentine(snake, 5):
+            pass
+
+        self.runs.update(snake)
+
+        segments = list(snake.iter_segments())
+        self.assertEqual(
+            (segments[0][0], *(end for _, end in segments)), self.runs.corners
+        )
+
+    def test_update_rebuilds_whenMoveIsUndone(self):
+        snake = Snake()
+        for _ in _serpentine(snake, 30):
+            self.runs.update(snake)
+        tail = snake.get_tail_position()
+        snake.move()
+        self.runs.update(snake)
+
+        snake.retract_head()
+        snake.grow(tail)
+        self.runs.update(snake)
+
+        segments = list(snake.iter_segments())
+        self.assertEqual(
+            (segments[0][0], *(end for _, end in segments)), self.runs.corners
+        )
+
+
+class MergedSnakeDrawingShould(unittest.TestCase):
+    def setUp(self):
+        self.size = (c.WINDOW_SIZE, c.WINDOW_SIZE)
+        self.renderer = Renderer(pygame.Surface(self.size))
+
+    def _draw_per_cell(self, snake):
+        surface = pygame.Surface(self.size)
+        surface.fill(c.BACKGROUND)
+        atlas = self.renderer._atlas
+        snake_head, *snake_body = snake.get_snake_body_positions()
+        blits = [atlas.body(segment) for segment in snake_body]
+        blits.append(atlas.head(snake_head, snake.direction))
+        surface.blits(blits, False)
+        return surface
+
+    def test_drawSnake_matchesPerCellDrawing_afterEveryMove(self):
+        for snake in [Snake(), SegmentSnake()]:
+            for _ in _serpentine(snake, 120):
+                self.renderer.screen.fill(c.BACKGROUND)
+                self.renderer._draw_snake(snake)
+
+                self.assertEqual(
+                    pygame.image.tobytes(self._draw_per_cell(snake), "RGB"),
+                    pygame.image.tobytes(self.renderer.screen, "RGB"),
+                )
+
+    def test_drawSnake_drawsOneRectanglePerTurn(self):
+        snake = Snake()
+        for _ in _serpentine(snake, 120):
+            pass
+
+        with patch("src.ui.renderer.create_rectangle") as mock_create_rectangle:
+            self.renderer._draw_snake(snake)
+
+        self.assertEqual(
+            len(list(snake.iter_segments())), mock_create_rectangle.call_count
+        )
+        self.assertLess(mock_create_rectangle.call_count, len(snake.positions) // 2)
@@ -0,0 +1,106 @@
+import unittest
+
+from src.ui.sprite_atlas import SpriteAtlas, get_eyes_positions
+from src.utils import constants as c
+
+import pygame
+
+
+def _blank():
+    surface = pygame.Surface((c.CELL_SIZE * 3, c.CELL_SIZE * 3))
+    surface.fill(c.BACKGROUND)
+    return surface
+
+
+class SpriteAtlasShould(unittest.TestCase):
+    def setUp(self):
+        self.atlas = SpriteAtlas()
+        self.position = (c.CELL_SIZE, c.CELL_SIZE)
+
+    def test_head_matchesDrawnRectangles_forEveryDirection(self):
+        for direction in [c.UP, c.RIGHT, c.DOWN, c.LEFT]:
+            drawn, blitted = _blank(), _blank()
+            pygame.draw.rect(
+                drawn, c.DARKER_PASTEL_GREEN, (*self.position, c.CELL_SIZE, c.CELL_SIZE)
+            )
+            for eye in get_eyes_positions(self.position, direction):
+                pygame.draw.rect(drawn, c.TEXT_COLOR, (*eye, c.EYE_SIZE, c.EYE_SIZE))
+
+            blitted.blit(*self.atlas.head(self.position, direction))
+
+            self.assertEqual(
+                pygame.image.tobytes(drawn, "RGB"), pygame.image.tobytes(blitted, "RGB")
+            )
+
+    def test_tiles_matchDrawnRectangles(self):
+        for color, blit in [
+            (c.PASTEL_GREEN, self.atlas.body(self.position)),
+            (c.PASTEL_PINK, self.atlas.food((1, 1))),
+            (c.MINT_GREEN, self.atlas.food((1, 1), bonus_food=True)),
+        ]:
+            drawn, blitted = _blank(), _blank()
+            pygame.draw.rect(drawn, color, (*self.position, c.CELL_SIZE, c.CELL_SIZE))
+
+            blitted.blit(*blit)
+
+            self.assertEqual(
+                pygame.image.tobytes(drawn, "RGB"), pygame.image.tobytes(blitted, "RGB")
+            )
+
+    def test_headRect_coversHeadAndEyes(self):
+        for direction in [c.UP, c.RIGHT, c.DOWN, c.LEFT]:
+            rect = self.atlas.head_rect(self.position, direction)
+
+            self.assertTrue(
+                rect.contains(pygame.Rect(self.position, (c.CELL_SIZE, c.CELL_SIZE)))
+            )
+            for eye in get_eyes_positions(self.position, direction):
+                self.assertTrue(rect.contains(pygame.Rect(eye, (c.EYE_SIZE,) * 2)))
+
+
+class GetEyesPositionsShould(unittest.TestCase):
+    def test_getEyesPositions_returnsCorrectPositions_whenFacingLeft(self):
+        head = (100, 100)
+        direction = c.LEFT
+
+        expected_left_eye = (head[0] + c.EYE_DEPTH, head[1] - c.EYE_OFFSET_SIDE_FAR)
+        expected_right_eye = (head[0] + c.EYE_DEPTH, head[1] + c.EYE_OFFSET_SIDE_NEAR)
+
+        eyes = get_eyes_positions(head, direction)
+        self.assertEqual((expected_left_eye, expected_right_eye), eyes)
+
+    def test_getEyesPositions_returnsCorrectPositions_whenFacingRight(self):
+        head = (100, 100)
+        direction = c.RIGHT
+
+        expected_left_eye = (
+            head[0] + c.CELL_SIZE - c.EYE_DEPTH - c.EYE_SIZE,
+            head[1] - c.EYE_OFFSET_SIDE_FAR,
+        )
+        expected_right_eye = (
+            head[0] + c.CELL_SIZE - c.EYE_DEPTH - c.EYE_SIZE,
+            head[1] + c.EYE_OFFSET_SIDE_NEAR,
+        )
+
+        eyes = get_eyes_positions(head, direction)
+        self.assertEqual((expected_left_eye, expected_right_eye), eyes)
+
+    def test_getEyesPositions_returnsCorrectPositions_whenFacingUp(self):
+        head = (100, 100)
+        direction = c.UP
+
+        expected_left_eye = (head[0] + c.EYE_OFFSET_NEAR, head[1] - c.EYE_DEPTH_UP)
+        expected_right_eye = (head[0] + c.EYE_OFFSET_FAR, head[1] - c.EYE_DEPTH_UP)
+
+        eyes = get_eyes_positions(head, direction)
+        self.assertEqual((expected_left_eye, expected_right_eye), eyes)
+
+    def test_getEyesPositions_returnsCorrectPositions_whenFacingDown(self):
+        head = (100, 100)
+        direction = c.DOWN
+
+        expected_left_eye = (head[0] + c.EYE_OFFSET_NEAR, head[1] + c.EYE_DEPTH)
+        expected_right_eye = (head[0] + c.EYE_OFFSET_FAR, head[1] + c.EYE_DEPTH)
+
+        eyes = get_eyes_positions(head, direction)
+        self.assertEqual((expected_left_eye, expected_right_eye), eyes)
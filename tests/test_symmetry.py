@@ -0,0 +1,91 @@
+import unittest
+
+from src.core.game_state import GameState
+from src.core.symmetry import (
+    IDENTITY,
+    TRANSFORMS,
+    canonicalize,
+    from_canonical_direction,
+    inverse_transform,
+    state_of,
+    to_canonical_direction,
+    transform_position,
+    transform_state,
+)
+from src.utils import constants as c
+
+
+def _transformed_game(game_state, transform):
+    state = transform_state(state_of(game_state), transform, game_state.board.size)
+    return GameState.from_keyframe(
+        game_state.keyframe()._replace(
+            positions=state.positions,
+            direction=state.direction,
+            food_pos=state.food_pos,
+            bonus_food_pos=state.bonus_food_pos,
+        )
+    )
+
+
+class SymmetryShould(unittest.TestCase):
+    def setUp(self):
+        self.game_state = GameState(seed=11)
+        for direction in [c.UP, c.UP, c.LEFT, c.LEFT, c.DOWN]:
+            self.game_state.step(direction)
+
+    def test_inverseTransform_undoesTransform(self):
+        state = state_of(self.game_state)
+        for transform in range(len(TRANSFORMS)):
+            transformed = transform_state(state, transform)
+            self.assertEqual(
+                state, transform_state(transformed, inverse_transform(transform))
+            )
+
+    def test_transformPosition_mapsCornersToCorners(self):
+        last = c.GRID_SIZE - 1
+        corners = {(0, 0), (last, 0), (0, last), (last, last)}
+        for transform in range(len(TRANSFORMS)):
+            self.assertEqual(
+                corners,
+                {transform_position(corner, transform) for corner in corners},
+            )
+
+    def test_transformPosition_returnsNone_whenPositionIsNone(self):
+        self.assertIsNone(transform_position(None, 3))
+
+    def test_transformPosition_rotatesClockwise(self):
+        last = c.GRID_SIZE - 1
+        self.assertEqual((last, last), transform_position((last, 0), 1))
+        self.assertEqual((last, 0), transform_position((0, 0), 1))
+
+    def test_canonicalize_returnsIdentity_whenAlreadyCanonical(self):
+        state, transform = canonicalize(self.game_state)
+        self.assertEqual(state, transform_state(state_of(self.game_state), transform))
+        canonical_game = _transformed_game(self.game_state, transform)
+        self.assertEqual((state, IDENTITY), canonicalize(canonical_game))
+
+    def test_canonicalize_returnsSameState_forAllSymmetricGames(self):
+        expected, _ = canonicalize(self.game_state)
+        for transform in range(len(TRANSFORMS)):
+            state, _ = canonicalize(_transformed_game(self.game_state, transform))
+            self.assertEqual(expected, state)
+
+    def test_canonicalDirections_mapBackToGame(self):
+        _, transform = canonicalize(self.game_state)
+        for direction in [c.UP, c.DOWN, c.LEFT, c.RIGHT]:
+            canonical = to_canonical_direction(direction, transform)
+            self.assertEqual(direction, from_canonical_direction(canonical, transform))
+
+    def test_canonicalAction_playsTheSameMove_inEverySymmetricGame(self):
+        canonical, _ = canonicalize(self.game_state)
+        canonical_direction = c.UP
+        expected_heads = set()
+        for transform in range(len(TRANSFORMS)):
+            game_state = _transformed_game(self.game_state, transform)
+            _, to_canonical = canonicalize(game_state)
+            game_state.step(from_canonical_direction(canonical_direction, to_canonical))
+            head = transform_position(
+                game_state.snake.get_head_position(), to_canonical
+            )
+            expected_heads.add(head)
+        self.assertEqual(1, len(expected_heads))
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import Mock, patch
 
+from src.ui.fonts import clear_font_caches
 from src.ui.ui_components import (
     _draw_start_button,
     create_rectangle,
@@ -13,6 +14,7 @@ from src.ui.ui_components import (
 
 class UiComponentsShould(unittest.TestCase):
     def setUp(self):
+        clear_font_caches()
         self.screen = Mock()
 
     def test_createRectangle_drawsRectangleWithCorrectParameters(self):
@@ -108,7 +110,16 @@ class UiComponentsShould(unittest.TestCase):
 
             draw_instructions(self.screen, last=4)
 
-            self.assertEqual(mock_font_class.call_count, 4)
+            mock_font_class.assert_called_once_with("arial", 14)
             self.assertEqual(mock_font.render.call_count, 4)
             self.assertEqual(mock_text_surface.get_rect.call_count, 4)
             self.assertEqual(self.screen.blit.call_count, 4)
+
+    def test_drawInstructions_reusesRenderedText_whenDrawnAgain(self):
+        with patch("pygame.font.SysFont") as mock_font_class:
+            draw_instructions(self.screen, last=4)
+            draw_instructions(self.screen, last=4)
+
+            mock_font_class.assert_called_once()
+            self.assertEqual(mock_font_class.return_value.render.call_count, 4)
+            self.assertEqual(self.screen.blit.call_count, 8)
@@ -0,0 +1,48 @@
+from collections import deque
+import unittest
+
+from src.core.views import SequenceView
+
+
+class SequenceViewShould(unittest.TestCase):
+    def setUp(self):
+        self.items = deque([(1, 1), (2, 1), (3, 1)])
+        self.view = SequenceView(self.items)
+
+    def test_len_returnsLengthOfItems(self):
+        self.assertEqual(3, len(self.view))
+
+    def test_getItem_returnsItem(self):
+        self.assertEqual((1, 1), self.view[0])
+        self.assertEqual((3, 1), self.view[-1])
+
+    def test_getItem_withSlice_returnsTuple(self):
+        self.assertEqual(((2, 1), (3, 1)), self.view[1:])
+
+    def test_getItem_withSlice_matchesTupleSlicing(self):
+        items = tuple(self.items)
+        for index in [
+            slice(None, 2),
+            slice(-2, None),
+            slice(2, 0),
+            slice(None, None, 2),
+        ]:
+            self.assertEqual(items[index], self.view[index])
+        self.assertEqual(items[::-1], self.view[::-1])
+
+    def test_contains_checksItems(self):
+        self.assertIn((2, 1), self.view)
+        self.assertNotIn((4, 1), self.view)
+
+    def test_eq_comparesWithTuple(self):
+        self.assertEqual(((1, 1), (2, 1), (3, 1)), self.view)
+        self.assertNotEqual(((1, 1), (2, 1)), self.view)
+
+    def test_view_reflectsChangesToItems(self):
+        self.items.appendleft((0, 1))
+        self.assertEqual((0, 1), self.view[0])
+        self.assertEqual(4, len(self.view))
+
+    def test_view_isNotHashable(self):
+        with self.assertRaises(TypeError):
+            hash(self.view)
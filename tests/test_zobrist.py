@@ -0,0 +1,158 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from src.core.board import Board
+from src.core.game_state import GameState
+from src.core.rewind import RewindBuffer
+from src.core.segment_snake import SegmentSnake
+from src.core.snake import Snake
+from src.core.zobrist import (
+    ZobristKeys,
+    compute_hash,
+    moved_snake_hash,
+    zobrist_keys,
+)
+from src.utils import constants as c
+
+
+def _random_direction(game_state, rng):
+    directions = [c.UP, c.DOWN, c.LEFT, c.RIGHT]
+    rng.shuffle(directions)
+    head_x, head_y = game_state.snake.get_head_position()
+    for direction in directions:
+        if not game_state.board.is_lethal(
+            (head_x + direction[0], head_y + direction[1])
+        ):
+            return direction
+    return directions[0]
+
+
+class ZobristHashShould(unittest.TestCase):
+    def test_zobristHash_matchesRecomputation_overRandomGames(self):
+        for snake_class in [Snake, SegmentSnake]:
+            for seed in range(10):
+                game_state = GameState(snake_class=snake_class, seed=seed)
+                rng = random.Random(seed)
+                while not game_state.game_over:
+                    game_state.step(_random_direction(game_state, rng))
+                    self.assertEqual(compute_hash(game_state), game_state.zobrist_hash)
+
+    def test_zobristHash_matchesRecomputation_afterRewind(self):
+        game_state = GameState(seed=3)
+        game_state.start_game()
+        rewind_buffer = RewindBuffer()
+        rewind_buffer.record(game_state)
+        rng = random.Random(3)
+        for _ in range(2000):
+            game_state.update()
+            game_state.food_system.spawn_food()
+            rewind_buffer.record(game_state)
+            game_state.snake.change_direction(_random_direction(game_state, rng))
+        for frames in [1, 37, 150]:
+            rewind_buffer.rewind(frames)
+            self.assertEqual(compute_hash(game_state), game_state.zobrist_hash)
+
+    def test_zobristHash_isEqual_forSameState(self):
+        first, second = GameState(seed=5), GameState(seed=5)
+        for direction in [c.UP, c.LEFT, c.LEFT, c.DOWN]:
+            first.step(direction)
+            second.step(direction)
+        self.assertEqual(first.zobrist_hash, second.zobrist_hash)
+        self.assertEqual(first.zobrist_hash, first.clone().zobrist_hash)
+
+    def test_zobristHash_changes_whenDirectionChanges(self):
+        game_state = GameState(seed=5)
+        before = game_state.zobrist_hash
+        game_state.snake.change_direction(c.UP)
+        self.assertNotEqual(before, game_state.zobrist_hash)
+        game_state.snake.restore_direction(c.LEFT, False)
+        self.assertEqual(before, game_state.zobrist_hash)
+
+    def test_zobristHash_differs_forSameCellsInOtherOrder(self):
+        cells = [(3, 3), (4, 3), (5, 3)]
+        forward = Snake(Board(), cells)
+        backward = Snake(Board(), cells[::-1])
+        self.assertNotEqual(forward.zobrist_hash, backward.zobrist_hash)
+
+    def test_zobristHash_isRestored_withSnapshot(self):
+        game_state = GameState(seed=2)
+        snapshot = game_state.snapshot()
+        before = game_state.zobrist_hash
+        for direction in [c.UP, c.UP, c.RIGHT]:
+            game_state.step(direction)
+        game_state.restore(snapshot)
+        self.assertEqual(before, game_state.zobrist_hash)
+
+    def test_keys_areDerivedOnFirstUse(self):
+        keys = ZobristKeys(2000)
+
+        self.assertEqual(0, len(keys.head) + len(keys.tail) + len(keys.food))
+        self.assertEqual(ZobristKeys(2000).head[(3, 4)], keys.head[(3, 4)])
+        self.assertEqual(1, len(keys.head))
+
+    def test_keys_differ_acrossCellsAndFeatures(self):
+        keys = ZobristKeys(20)
+        values = {
+            table[position]
+            for table in [keys.head, keys.tail, keys.food, *keys.links.values()]
+            for position in [(-1, -1), (0, 0), (1, 0), (0, 1), (19, 19), (20, 20)]
+        }
+        self.assertEqual(7 * 6, len(values))
+
+    def test_restore_keepsHashWithoutRehashing(self):
+        for snake_class in [Snake, SegmentSnake]:
+            game_state = GameState(snake_class, seed=2)
+            snapshot = game_state.snapshot()
+            before = game_state.zobrist_hash
+            for direction in [c.UP, c.UP, c.RIGHT]:
+                game_state.step(direction)
+
+            # a rehash walks the whole body, so restore would depend on its length
+            with patch("src.core.snake.snake_hash") as mock_snake_hash:
+                game_state.restore(snapshot)
+
+            mock_snake_hash.assert_not_called()
+            self.assertEqual(before, game_state.zobrist_hash)
+            self.assertEqual(compute_hash(game_state), game_state.zobrist_hash)
+
+    def test_movedSnakeHash_predictsHash_afterMoveAndGrowth(self):
+        for snake_class in [Snake, SegmentSnake]:
+            snake = snake_class(Board())
+            keys = zobrist_keys(snake.board.size)
+            for grow in [False, True, False]:
+                before = snake.zobrist_hash
+                head, tail = snake.get_head_position(), snake.get_tail_position()
+                snake.move()
+                if grow:
+                    snake.grow(tail)
+                self.assertEqual(
+                    snake.zobrist_hash,
+                    moved_snake_hash(
+                        keys,
+                        before,
+                        head,
+                        snake.get_head_position(),
+                        tail,
+                        snake.get_tail_position(),
+                    ),
+                )
+
+    def test_movedSnakeHash_differs_whenSnakeChangedOtherwise(self):
+        snake = Snake(Board())
+        keys = zobrist_keys(snake.board.size)
+        before = snake.zobrist_hash
+        head, tail = snake.get_head_position(), snake.get_tail_position()
+        snake.move()
+        snake.move()
+        self.assertNotEqual(
+            snake.zobrist_hash,
+            moved_snake_hash(
+                keys,
+                before,
+                head,
+                snake.get_head_position(),
+                tail,
+                snake.get_tail_position(),
+            ),
+        )